@@ -0,0 +1,99 @@
+"""
+Benchmark: blocking Web3 calls vs AsyncWeb3 on a single event loop.
+
+Starts a local stub JSON-RPC node on its own thread that answers every
+request after a fixed delay (simulating RPC round-trip time), then fires N
+concurrent "requests" from one event loop:
+
+- blocking: each coroutine calls the synchronous ``Web3.HTTPProvider``, which
+  is what the service did before it moved to ``AsyncWeb3``. The calls
+  serialize because each one blocks the loop.
+- async: each coroutine awaits ``AsyncWeb3``, so the round-trips overlap.
+
+Usage:
+    poetry run python benchmarks/async_backend_benchmark.py --requests 200
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+from typing import Any
+
+from aiohttp import web
+from web3 import AsyncHTTPProvider, AsyncWeb3, Web3
+
+
+def _start_stub_node(latency: float, port: int) -> None:
+    """Serve a JSON-RPC stub on its own thread that answers after a delay."""
+
+    async def handle(request: web.Request) -> web.Response:
+        payload: dict[str, Any] = await request.json()
+        await asyncio.sleep(latency)
+        return web.json_response(
+            {"jsonrpc": "2.0", "id": payload["id"], "result": "0x2a"}
+        )
+
+    async def serve() -> None:
+        app = web.Application()
+        app.router.add_post("/", handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", port).start()
+        started.set()
+        await asyncio.Event().wait()
+
+    started = threading.Event()
+    threading.Thread(target=lambda: asyncio.run(serve()), daemon=True).start()
+    started.wait()
+
+
+async def _run_blocking(url: str, n: int) -> float:
+    w3 = Web3(Web3.HTTPProvider(url))
+    w3.eth.get_block_number()  # warm up the pooled session
+
+    async def one_request() -> None:
+        # Blocks the event loop for the whole round-trip
+        w3.eth.get_block_number()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one_request() for _ in range(n)))
+    return time.perf_counter() - start
+
+
+async def _run_async(url: str, n: int) -> float:
+    w3 = AsyncWeb3(AsyncHTTPProvider(url))
+    await w3.eth.get_block_number()  # warm up the pooled session
+
+    start = time.perf_counter()
+    await asyncio.gather(*(w3.eth.get_block_number() for _ in range(n)))
+    elapsed = time.perf_counter() - start
+
+    await w3.provider.disconnect()
+    return elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--port", type=int, default=8599)
+    args = parser.parse_args()
+
+    url = f"http://127.0.0.1:{args.port}"
+    _start_stub_node(args.latency_ms / 1000, args.port)
+    blocking = await _run_blocking(url, args.requests)
+    concurrent = await _run_async(url, args.requests)
+
+    print(f"{args.requests} calls, {args.latency_ms:.0f} ms simulated RPC latency")
+    print(
+        f"  blocking Web3: {blocking:8.3f} s  ({args.requests / blocking:8.1f} req/s)"
+    )
+    print(
+        f"  AsyncWeb3:     {concurrent:8.3f} s  ({args.requests / concurrent:8.1f} req/s)"
+    )
+    print(f"  speed-up:      {blocking / concurrent:8.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,99 @@
+"""
+Benchmark: SQLite ticket registry at scale.
+
+Fills a fresh SQLiteTicketRegistry with N ticket mappings through
+``register_many`` and reports sustained insert throughput, then measures
+point-lookup latency (``get_token_id``) and bulk lookups (``get_many``) on
+random existing tickets.
+
+Usage:
+    poetry run python benchmarks/registry_benchmark.py --rows 10000000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.datastore.sqlite_registry import SQLiteTicketRegistry  # noqa: E402
+
+
+def _ticket_id(i: int) -> str:
+    return f"ticket-{i:010d}"
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    return statistics.quantiles(samples, n=100)[int(pct) - 1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--batch", type=int, default=10_000)
+    parser.add_argument("--lookups", type=int, default=100_000)
+    parser.add_argument("--events", type=int, default=1_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "registry.db")
+        registry = SQLiteTicketRegistry(path)
+
+        start = time.perf_counter()
+        report_every = max(args.rows // 10, args.batch)
+        window_start, window_rows = start, 0
+        for offset in range(0, args.rows, args.batch):
+            count = min(args.batch, args.rows - offset)
+            registry.register_many(
+                {_ticket_id(offset + i): offset + i for i in range(count)},
+                event_id=f"event-{offset % args.events}",
+            )
+            window_rows += count
+            if (offset + count) % report_every == 0:
+                now = time.perf_counter()
+                print(
+                    f"  {offset + count:>11,} rows  "
+                    f"{window_rows / (now - window_start):>10,.0f} rows/s"
+                )
+                window_start, window_rows = now, 0
+        insert_seconds = time.perf_counter() - start
+
+        rng = random.Random(42)
+        latencies = []
+        for _ in range(args.lookups):
+            ticket_id = _ticket_id(rng.randrange(args.rows))
+            t0 = time.perf_counter()
+            registry.get_token_id(ticket_id)
+            latencies.append((time.perf_counter() - t0) * 1e6)
+
+        bulk = [_ticket_id(rng.randrange(args.rows)) for _ in range(1_000)]
+        t0 = time.perf_counter()
+        found = registry.get_many(bulk)
+        bulk_ms = (time.perf_counter() - t0) * 1e3
+        assert len(found) == len(set(bulk))
+
+        size_mb = (
+            sum(os.path.getsize(os.path.join(tmp, f)) for f in os.listdir(tmp)) / 2**20
+        )
+        registry.close()
+
+    print(f"{args.rows:,} rows, batches of {args.batch:,}")
+    print(
+        f"  insert:        {insert_seconds:8.1f} s  "
+        f"({args.rows / insert_seconds:,.0f} rows/s sustained)"
+    )
+    print(
+        f"  get_token_id:  p50 {_percentile(latencies, 50):6.1f} us  "
+        f"p99 {_percentile(latencies, 99):6.1f} us  ({args.lookups:,} random lookups)"
+    )
+    print(f"  get_many:      {bulk_ms:6.1f} ms for 1,000 random tickets")
+    print(f"  database size: {size_mb:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
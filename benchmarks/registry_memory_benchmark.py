@@ -0,0 +1,165 @@
+"""
+Benchmark: memory and lookup latency of the in-memory registry layouts.
+
+Fills a TicketRegistry with N ticket mappings, once with the default dict
+layout and once with the compact typed-array layout, each in a fresh
+subprocess so resident memory is measured in isolation. Reports resident
+memory growth, bytes per ticket, fill time and point-lookup latency
+(``get_token_id``) on random existing and unknown tickets. It then writes
+a snapshot of N tickets and loads it into a fresh registry per layout,
+reporting load time and resident/peak memory, which shows whether loading
+needs room for the snapshot on top of the registry.
+
+Usage:
+    poetry run python benchmarks/registry_memory_benchmark.py --rows 10000000
+"""
+
+import argparse
+import json
+import os
+import random
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.datastore.ticket_registry import TicketRegistry  # noqa: E402
+
+
+def _ticket_id(i: int) -> str:
+    return f"ticket-{i:010d}"
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    return statistics.quantiles(samples, n=100)[int(pct) - 1]
+
+
+def _rss_bytes() -> int:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def _measure(layout: str, rows: int, batch: int, lookups: int) -> dict[str, float]:
+    """Fill and probe one registry; runs inside the child process."""
+    baseline = _rss_bytes()
+    registry = TicketRegistry(compact=layout == "compact", capacity=rows)
+
+    start = time.perf_counter()
+    for offset in range(0, rows, batch):
+        count = min(batch, rows - offset)
+        registry.register_many(
+            {_ticket_id(offset + i): offset + i for i in range(count)}
+        )
+    fill_seconds = time.perf_counter() - start
+    resident = _rss_bytes() - baseline
+
+    rng = random.Random(42)
+    hits, misses = [], []
+    for _ in range(lookups):
+        ticket_id = _ticket_id(rng.randrange(rows))
+        t0 = time.perf_counter()
+        registry.get_token_id(ticket_id)
+        hits.append((time.perf_counter() - t0) * 1e6)
+        ticket_id = _ticket_id(rows + rng.randrange(rows))
+        t0 = time.perf_counter()
+        registry.get_token_id(ticket_id)
+        misses.append((time.perf_counter() - t0) * 1e6)
+
+    return {
+        "fill_seconds": fill_seconds,
+        "resident_mb": resident / 2**20,
+        "bytes_per_ticket": resident / rows,
+        "peak_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10,
+        "hit_p50": _percentile(hits, 50),
+        "hit_p99": _percentile(hits, 99),
+        "miss_p50": _percentile(misses, 50),
+        "miss_p99": _percentile(misses, 99),
+    }
+
+
+def _write_snapshot(path: str, rows: int) -> None:
+    """Stream a snapshot of ``rows`` tickets in the registry's format."""
+    with open(path, "w") as f:
+        f.write("{")
+        for i in range(rows):
+            f.write(f'{", " if i else ""}"{_ticket_id(i)}": {i}')
+        f.write("}")
+
+
+def _measure_load(layout: str, path: str, rows: int) -> dict[str, float]:
+    """Load a snapshot into a fresh registry; runs inside the child process."""
+    baseline = _rss_bytes()
+    start = time.perf_counter()
+    registry = TicketRegistry(
+        storage_path=path, compact=layout == "compact", capacity=rows
+    )
+    load_seconds = time.perf_counter() - start
+    resident = _rss_bytes() - baseline
+    assert registry.get_token_id(_ticket_id(rows - 1)) == rows - 1
+    registry.close()
+    return {
+        "load_seconds": load_seconds,
+        "resident_mb": resident / 2**20,
+        "peak_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10,
+    }
+
+
+def _child(*args: str) -> dict[str, float]:
+    child = subprocess.run(
+        [sys.executable, __file__, *sys.argv[1:], *args],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(child.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--batch", type=int, default=10_000)
+    parser.add_argument("--lookups", type=int, default=100_000)
+    parser.add_argument("--layout", choices=["dict", "compact"], help=argparse.SUPPRESS)
+    parser.add_argument("--load", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.layout and args.load:
+        print(json.dumps(_measure_load(args.layout, args.load, args.rows)))
+        return
+    if args.layout:
+        print(json.dumps(_measure(args.layout, args.rows, args.batch, args.lookups)))
+        return
+
+    print(f"{args.rows:,} tickets, {args.lookups:,} random lookups each")
+    for layout in ("dict", "compact"):
+        r = _child("--layout", layout)
+        print(
+            f"  {layout:<8} {r['resident_mb']:8.1f} MB resident "
+            f"({r['bytes_per_ticket']:5.1f} B/ticket, peak RSS {r['peak_mb']:,.0f} MB), "
+            f"fill {r['fill_seconds']:5.1f} s"
+        )
+        print(
+            f"           hit  p50 {r['hit_p50']:5.2f} us  p99 {r['hit_p99']:5.2f} us   "
+            f"miss p50 {r['miss_p50']:5.2f} us  p99 {r['miss_p99']:5.2f} us"
+        )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "registry.json")
+        _write_snapshot(path, args.rows)
+        size_mb = os.path.getsize(path) / 2**20
+        print(f"load from a {size_mb:,.0f} MB snapshot")
+        for layout in ("dict", "compact"):
+            r = _child("--layout", layout, "--load", path)
+            print(
+                f"  {layout:<8} {r['resident_mb']:8.1f} MB resident "
+                f"(peak RSS {r['peak_mb']:,.0f} MB), load {r['load_seconds']:5.1f} s"
+            )
+
+
+if __name__ == "__main__":
+    main()
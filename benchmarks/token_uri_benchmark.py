@@ -0,0 +1,112 @@
+"""
+Benchmark: gas and build latency of the token URI encodings.
+
+Compares the encodings a mint can put on-chain for a typical sold ticket:
+
+- ``hex``: the JSON hex-encoded under a base64 label (the old encoding)
+- ``base64``: the JSON inline as a proper base64 data URI
+- ``offchain``: a short URI naming the document in the metadata store
+
+Gas is computed rather than measured on a node: calldata gas of the encoded
+``mintTicket(address,string)`` call (16 per nonzero byte, 4 per zero byte)
+plus the ``SSTORE`` gas of keeping the URI string in ``_tokenURIs`` (22,100
+per new storage slot). The rest of the mint costs the same for every
+encoding. Latency is the time to build the URI, including writing the
+document to a file-backed store for ``offchain``.
+
+Usage:
+    poetry run python benchmarks/token_uri_benchmark.py --iterations 10000
+"""
+
+import argparse
+import base64
+import json
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from eth_abi import encode  # noqa: E402
+from eth_utils import function_signature_to_4byte_selector  # noqa: E402
+
+from src.datastore.metadata_store import MetadataStore  # noqa: E402
+
+TO_ADDRESS = "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"
+SSTORE_NEW_SLOT_GAS = 22_100  # 20,000 set + 2,100 cold slot access
+BASE_URL = "https://tickets.example.com"
+
+
+def _metadata(i: int) -> dict:
+    return {
+        "name": f"Ticket #concert-2025-{i:06d}",
+        "description": "Ticket for event concert-2025",
+        "image": "https://tickets.example.com/images/concert-2025.png",
+        "attributes": {"section": "B", "row": "12", "seat": str(i % 40)},
+        "event_id": "concert-2025",
+        "ticket_id": f"concert-2025-{i:06d}",
+    }
+
+
+def _calldata_gas(token_uri: str) -> int:
+    data = function_signature_to_4byte_selector("mintTicket(address,string)")
+    data += encode(["address", "string"], [TO_ADDRESS, token_uri])
+    return sum(16 if byte else 4 for byte in data)
+
+
+def _storage_gas(token_uri: str) -> int:
+    length = len(token_uri.encode())
+    # Solidity keeps strings under 32 bytes in one slot, longer ones in a
+    # length slot plus one slot per 32 bytes
+    slots = 1 if length < 32 else 1 + -(-length // 32)
+    return slots * SSTORE_NEW_SLOT_GAS
+
+
+def _encoders(store: MetadataStore) -> dict[str, Callable[[dict], str]]:
+    return {
+        "hex": lambda m: (
+            f"data:application/json;base64,{json.dumps(m).encode().hex()}"
+        ),
+        "base64": lambda m: (
+            "data:application/json;base64,"
+            + base64.b64encode(json.dumps(m).encode()).decode()
+        ),
+        "offchain": lambda m: f"{BASE_URL}/metadata/{store.put(m)}",
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=10_000)
+    args = parser.parse_args()
+
+    documents = [_metadata(i) for i in range(args.iterations)]
+    with tempfile.TemporaryDirectory() as directory:
+        encoders = _encoders(MetadataStore(directory))
+        print(f"{args.iterations:,} tickets, mintTicket(address,string)")
+        baseline = None
+        for name, build in encoders.items():
+            timings, uris = [], []
+            for metadata in documents:
+                t0 = time.perf_counter()
+                uris.append(build(metadata))
+                timings.append((time.perf_counter() - t0) * 1e6)
+
+            length = statistics.mean(len(uri) for uri in uris)
+            calldata = statistics.mean(_calldata_gas(uri) for uri in uris)
+            storage = statistics.mean(_storage_gas(uri) for uri in uris)
+            gas = calldata + storage
+            baseline = baseline or gas
+            print(
+                f"  {name:<9} URI {length:5.0f} B   calldata {calldata:7,.0f} gas   "
+                f"storage {storage:8,.0f} gas   total {gas:8,.0f} gas "
+                f"({gas / baseline:4.0%} of hex)   "
+                f"build p50 {statistics.median(timings):6.1f} us"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -41,12 +41,20 @@ contract Ticket is ERC721, Ownable {
      * @param tokenURI_ URI for the ticket metadata
      */
     function mintTicket(address to, string memory tokenURI_) external onlyOwner {
-        uint256 tokenId = _nextTokenId++;
-        _safeMint(to, tokenId);
-        _setTokenURI(tokenId, tokenURI_);
-        ticketStatuses[tokenId] = TicketStatus.Valid;
+        _mintTicket(to, tokenURI_);
+    }
 
-        emit TicketMinted(tokenId, to);
+    /**
+     * @dev Mint several ticket NFTs in one transaction
+     * @param to Addresses to mint the tickets to
+     * @param tokenURIs URIs for the ticket metadata, one per address
+     */
+    function batchMintTicket(address[] calldata to, string[] calldata tokenURIs) external onlyOwner {
+        require(to.length == tokenURIs.length, "Array length mismatch");
+
+        for (uint256 i = 0; i < to.length; i++) {
+            _mintTicket(to[i], tokenURIs[i]);
+        }
     }
 
     /**
@@ -86,6 +94,42 @@ contract Ticket is ERC721, Ownable {
         emit TicketInvalidated(tokenId);
     }
 
+    /**
+     * @dev Check in several tickets, skipping any that do not exist or are not valid
+     * @param tokenIds IDs of the tickets to check in
+     * @return checkedIn Number of tickets checked in; each emits TicketCheckedIn
+     */
+    function batchCheckIn(uint256[] calldata tokenIds) external onlyOwner returns (uint256 checkedIn) {
+        for (uint256 i = 0; i < tokenIds.length; i++) {
+            uint256 tokenId = tokenIds[i];
+            if (!_isValidTicket(tokenId)) {
+                continue;
+            }
+
+            ticketStatuses[tokenId] = TicketStatus.CheckedIn;
+            emit TicketCheckedIn(tokenId);
+            checkedIn++;
+        }
+    }
+
+    /**
+     * @dev Invalidate several tickets, skipping any that do not exist or are not valid
+     * @param tokenIds IDs of the tickets to invalidate
+     * @return invalidated Number of tickets invalidated; each emits TicketInvalidated
+     */
+    function batchInvalidate(uint256[] calldata tokenIds) external onlyOwner returns (uint256 invalidated) {
+        for (uint256 i = 0; i < tokenIds.length; i++) {
+            uint256 tokenId = tokenIds[i];
+            if (!_isValidTicket(tokenId)) {
+                continue;
+            }
+
+            ticketStatuses[tokenId] = TicketStatus.Invalidated;
+            emit TicketInvalidated(tokenId);
+            invalidated++;
+        }
+    }
+
     /**
      * @dev Get the token URI
      * @param tokenId ID of the ticket
@@ -95,6 +139,28 @@ contract Ticket is ERC721, Ownable {
         return _tokenURIs[tokenId];
     }
 
+    /**
+     * @dev Whether a ticket exists and is still valid
+     * @param tokenId ID of the ticket
+     */
+    function _isValidTicket(uint256 tokenId) internal view returns (bool) {
+        return _ownerOf(tokenId) != address(0) && ticketStatuses[tokenId] == TicketStatus.Valid;
+    }
+
+    /**
+     * @dev Mint a ticket and emit TicketMinted
+     * @param to Address to mint the ticket to
+     * @param tokenURI_ URI for the ticket metadata
+     */
+    function _mintTicket(address to, string memory tokenURI_) internal {
+        uint256 tokenId = _nextTokenId++;
+        _safeMint(to, tokenId);
+        _setTokenURI(tokenId, tokenURI_);
+        ticketStatuses[tokenId] = TicketStatus.Valid;
+
+        emit TicketMinted(tokenId, to);
+    }
+
     /**
      * @dev Set the token URI
      * @param tokenId ID of the ticket
@@ -0,0 +1,148 @@
+"""
+Events API router for TicketChain.
+"""
+
+import asyncio
+import json
+import zlib
+from collections.abc import AsyncIterator
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from ..config import settings
+from ..datastore.ticket_index import TicketIndex
+from ..datastore.ticket_registry import ticket_registry as registry
+from .models import ErrorResponse, EventTicket, EventTicketsResponse
+from .tickets import _STATUS_FROM_CHAIN, get_ticket_index
+
+router = APIRouter(
+    prefix="/api/v1/events",
+    tags=["events"],
+    responses={
+        400: {"model": ErrorResponse, "description": "Invalid cursor"},
+    },
+)
+
+
+@router.get("/{event_id}/tickets", response_model=EventTicketsResponse)
+async def list_event_tickets(
+    event_id: str,
+    cursor: Annotated[
+        Optional[str], Query(description="next_cursor of the previous page")
+    ] = None,
+    limit: Annotated[int, Query(ge=1, le=1000, description="Page size")] = 100,
+) -> EventTicketsResponse:
+    """
+    List the tickets minted for an event, one page at a time.
+
+    Pages come from the registry's event index, so each costs time
+    proportional to its size however many tickets the event has. An event
+    with no tickets returns an empty page.
+    """
+    try:
+        page = registry.list_event_tickets(event_id, cursor=cursor, limit=limit)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
+
+    return EventTicketsResponse(
+        event_id=event_id,
+        tickets=[
+            EventTicket(
+                ticket_id=ticket.ticket_id,
+                token_id=ticket.token_id,
+                metadata=ticket.metadata,
+            )
+            for ticket in page.tickets
+        ],
+        next_cursor=page.next_cursor,
+    )
+
+
+async def _export_rows(
+    event_id: str, cursor: Optional[str], index: TicketIndex
+) -> AsyncIterator[bytes]:
+    """
+    Yield an event's tickets as NDJSON, one registry page at a time.
+
+    Only one page is held in memory. The state of each page is read from the
+    event index in one query, and control returns to the event loop between
+    pages so other requests keep being served during a long export.
+    """
+    while True:
+        page = registry.list_event_tickets(
+            event_id, cursor=cursor, limit=settings.export_page_size
+        )
+        states = index.get_tickets([ticket.token_id for ticket in page.tickets])
+        lines = []
+        for ticket, row_cursor in zip(page.tickets, page.cursors, strict=True):
+            state = states.get(ticket.token_id)
+            lines.append(
+                json.dumps(
+                    {
+                        "ticket_id": ticket.ticket_id,
+                        "token_id": ticket.token_id,
+                        "owner_address": state.owner if state else None,
+                        "status": (
+                            _STATUS_FROM_CHAIN[state.status].value if state else None
+                        ),
+                        "block_number": state.updated_block if state else None,
+                        "metadata": ticket.metadata,
+                        "cursor": row_cursor,
+                    }
+                )
+            )
+        if lines:
+            yield ("\n".join(lines) + "\n").encode()
+        cursor = page.next_cursor
+        if cursor is None:
+            return
+        await asyncio.sleep(0)
+
+
+async def _gzip(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Compress a byte stream incrementally, flushing after every chunk."""
+    compressor = zlib.compressobj(wbits=31)  # gzip container
+    async for chunk in chunks:
+        yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+
+@router.get(
+    "/{event_id}/tickets/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
+async def export_event_tickets(
+    event_id: str,
+    index: Annotated[TicketIndex, Depends(get_ticket_index)],
+    cursor: Annotated[
+        Optional[str],
+        Query(description="'cursor' of the last row received, to resume"),
+    ] = None,
+    accept_encoding: Annotated[str, Header()] = "",
+) -> StreamingResponse:
+    """
+    Stream every ticket of an event as newline-delimited JSON.
+
+    Each row holds the ticket's token ID, its owner, status and last change
+    block from the event index (null until indexed), its sale details, and a
+    ``cursor`` that resumes the export right after that row. The response is
+    gzip-compressed when the client accepts it.
+    """
+    try:
+        registry.list_event_tickets(event_id, cursor=cursor, limit=1)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+        ) from e
+
+    body = _export_rows(event_id, cursor, index)
+    headers = {}
+    if "gzip" in accept_encoding.lower():
+        body = _gzip(body)
+        headers = {"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+    return StreamingResponse(body, media_type="application/x-ndjson", headers=headers)
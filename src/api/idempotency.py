@@ -0,0 +1,262 @@
+"""
+Deduplication of retried write requests.
+
+A client that times out waiting for ``/sold`` and retries would otherwise
+mint a second NFT. Write endpoints therefore run through an
+:class:`IdempotencyStore`, keyed by the ``Idempotency-Key`` header or, for
+operations that can only happen once per ticket, by the ticket ID:
+
+- the first request runs the operation in a task owned by the store, so
+  it survives the client disconnecting
+- duplicates arriving while it runs attach to the same task
+- duplicates arriving after it succeeded get the stored response, until
+  the entry expires
+
+No duplicate ever sends a transaction. Failures are not stored, so a retry
+after an error runs the operation again. That includes a ``202 Accepted``
+whose transaction later fails: the operation links its response to the
+outcome with :func:`keep_response_if`, and the entry is dropped if the
+outcome is a failure. Reusing a key for a different request, including
+different query parameters, is rejected with 422.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from fastapi import HTTPException, Request, Response, status
+from pydantic import BaseModel
+
+from ..config import settings
+
+
+@dataclass
+class _Entry:
+    fingerprint: str
+    task: "asyncio.Task[Any]"
+    expires_at: float = float("inf")  # set once the operation succeeds
+
+
+# Store and key of the operation running in the current task
+_running: ContextVar[Optional[tuple["IdempotencyStore", str]]] = ContextVar(
+    "idempotent_operation", default=None
+)
+
+
+class IdempotencyStore:
+    """Bounded TTL store of in-flight and completed write operations."""
+
+    def __init__(self, max_entries: int = 10_000, ttl_seconds: float = 3600.0):
+        """
+        Initialize the store.
+
+        Args:
+            max_entries: Number of operations to remember; the oldest
+                         completed ones are forgotten first
+            ttl_seconds: How long a completed operation's response is replayed
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._executed = 0
+        self._attached = 0
+        self._replayed = 0
+
+    async def run(
+        self,
+        key: str,
+        fingerprint: str,
+        operation: Callable[[], Awaitable[Any]],
+    ) -> tuple[Any, bool]:
+        """
+        Run an operation once per key.
+
+        Args:
+            key: Idempotency key of the request
+            fingerprint: Digest of the request, to detect a reused key
+            operation: Performs the request and returns its response
+
+        Returns:
+            The response, and whether it came from an earlier request
+
+        Raises:
+            HTTPException: 422 if the key was used for a different request;
+                           otherwise whatever the operation raised
+        """
+        self._expire()
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.fingerprint != fingerprint:
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail="Idempotency key was already used for a different request",
+                )
+            if entry.task.done():
+                self._replayed += 1
+            else:
+                self._attached += 1
+            return await asyncio.shield(entry.task), True
+
+        async def run_keyed() -> Any:
+            _running.set((self, key))
+            return await operation()
+
+        task = asyncio.ensure_future(run_keyed())
+        self._entries[key] = _Entry(fingerprint, task)
+        task.add_done_callback(lambda t: self._settle(key, t))
+        self._executed += 1
+        self._evict()
+        return await asyncio.shield(task), False
+
+    def _settle(self, key: str, task: "asyncio.Task[Any]") -> None:
+        entry = self._entries.get(key)
+        if entry is None or entry.task is not task:
+            return
+        if task.cancelled() or task.exception() is not None:
+            # Let a retry run the operation again
+            del self._entries[key]
+        else:
+            entry.expires_at = time.monotonic() + self.ttl_seconds
+
+    def _link(self, key: str, outcome: "asyncio.Future[bool]") -> None:
+        """Drop a key's response if ``outcome`` turns out to be a failure."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+
+        def settle(outcome: "asyncio.Future[bool]") -> None:
+            failed = outcome.cancelled() or outcome.exception() or not outcome.result()
+            if failed and self._entries.get(key) is entry:
+                del self._entries[key]
+
+        outcome.add_done_callback(settle)
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        expired = [k for k, e in self._entries.items() if e.expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+
+    def _evict(self) -> None:
+        """Forget the oldest completed operations beyond ``max_entries``."""
+        excess = len(self._entries) - self.max_entries
+        if excess <= 0:
+            return
+        completed = [k for k, e in self._entries.items() if e.task.done()]
+        for key in completed[:excess]:
+            del self._entries[key]
+
+    async def close(self) -> None:
+        """Wait for operations still running, so none is cut off mid-write."""
+        running = [e.task for e in self._entries.values() if not e.task.done()]
+        await asyncio.gather(*running, return_exceptions=True)
+
+    def stats(self) -> dict[str, Any]:
+        """Store size and dedupe counters, for monitoring."""
+        return {
+            "entries": len(self._entries),
+            "in_flight": sum(not e.task.done() for e in self._entries.values()),
+            "executed": self._executed,
+            "attached": self._attached,
+            "replayed": self._replayed,
+        }
+
+
+def keep_response_if(outcome: "asyncio.Future[bool]") -> None:
+    """
+    Keep the running operation's response only if ``outcome`` succeeds.
+
+    For responses such as ``202 Accepted`` that are returned before the
+    operation is over. Does nothing outside :meth:`IdempotencyStore.run`.
+
+    Args:
+        outcome: Resolves to whether the operation finally succeeded
+    """
+    running = _running.get()
+    if running is not None:
+        store, key = running
+        store._link(key, outcome)
+
+
+def request_fingerprint(operation: str, body: BaseModel, **query: Any) -> str:
+    """Digest identifying a write request by its operation, body and query."""
+    payload = json.dumps(
+        [operation, body.model_dump(mode="json"), query], sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def idempotency_key(
+    header: Optional[str], operation: str, ticket_id: Optional[str] = None
+) -> Optional[str]:
+    """
+    Key deduplicating a request.
+
+    Args:
+        header: ``Idempotency-Key`` header value, if sent
+        operation: Name of the API operation
+        ticket_id: Ticket to dedupe on when no header is sent; only for
+                   operations that can happen once per ticket
+
+    Returns:
+        The key, or None if the request is not deduplicated
+    """
+    if header:
+        return f"key:{header}"
+    if ticket_id is not None:
+        return f"{operation}:ticket:{ticket_id}"
+    return None
+
+
+async def run_idempotent(
+    store: "IdempotencyStore",
+    key: Optional[str],
+    fingerprint: str,
+    operation: Callable[[], Awaitable[Any]],
+    response: Response,
+) -> Any:
+    """
+    Run an endpoint's operation through the store when it has a key.
+
+    Replayed responses are marked with an ``Idempotent-Replayed`` header.
+    """
+    if key is None:
+        return await operation()
+    result, replayed = await store.run(key, fingerprint, operation)
+    if not replayed:
+        return result
+    if isinstance(result, Response):
+        # A Response cannot be sent twice; send a copy
+        result = Response(
+            content=result.body,
+            status_code=result.status_code,
+            headers=dict(result.headers),
+        )
+        result.headers["Idempotent-Replayed"] = "true"
+        return result
+    response.headers["Idempotent-Replayed"] = "true"
+    return result
+
+
+# Dependency injection for the idempotency store
+async def get_idempotency_store(request: Request) -> IdempotencyStore:
+    """
+    Dependency injection for the app-scoped idempotency store.
+
+    Created on first use if the app lifespan has not run.
+    """
+    store: IdempotencyStore | None = getattr(
+        request.app.state, "idempotency_store", None
+    )
+    if store is None:
+        store = IdempotencyStore(
+            settings.idempotency_max_entries, settings.idempotency_ttl_seconds
+        )
+        request.app.state.idempotency_store = store
+    return store
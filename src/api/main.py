@@ -2,16 +2,90 @@
 Main FastAPI application for TicketChain backend.
 """
 
-from fastapi import FastAPI
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Annotated
+
+from fastapi import Depends, FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 
+from ..blockchain_service.batching_provider import calling_route
+from ..blockchain_service.interface import BlockchainServiceInterface, ServiceBusyError
+from ..config import settings
+from ..datastore.metadata_store import check_offchain_settings, metadata_store
+from ..datastore.ticket_index import TicketIndex
+from ..datastore.ticket_registry import ticket_registry
+from ..indexer import EventIndexer
+from ..metrics import registry as metrics_registry
+from .events import router as events_router
+from .idempotency import IdempotencyStore, get_idempotency_store
+from .metadata import router as metadata_router
+from .metrics import MetricsMiddleware
+from .tickets import create_blockchain_service, get_blockchain_service
 from .tickets import router as tickets_router
+from .transactions import TransactionTracker, get_transaction_tracker
+from .transactions import router as transactions_router
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Create the shared blockchain service on startup and close it on shutdown."""
+    check_offchain_settings()
+    app.state.blockchain_service = await create_blockchain_service()
+    app.state.transaction_tracker = TransactionTracker(
+        settings.transaction_tracker_max_entries
+    )
+    app.state.idempotency_store = IdempotencyStore(
+        settings.idempotency_max_entries, settings.idempotency_ttl_seconds
+    )
+    app.state.ticket_index = TicketIndex(settings.indexer_db_path or ":memory:")
+    app.state.event_indexer = None
+    if settings.indexer_enabled:
+        if settings.indexer_db_path is None:
+            print(
+                "Warning: INDEXER_DB_PATH is not set; the event index is kept "
+                "in memory and rebuilt from INDEXER_START_BLOCK on every start"
+            )
+        app.state.event_indexer = EventIndexer(
+            app.state.blockchain_service,
+            app.state.ticket_index,
+            start_block=settings.indexer_start_block,
+            chunk_size=settings.indexer_chunk_size,
+            reorg_depth=settings.indexer_reorg_depth,
+            poll_interval=settings.indexer_poll_seconds,
+        )
+        await app.state.event_indexer.start()
+    try:
+        yield
+    finally:
+        if app.state.event_indexer is not None:
+            await app.state.event_indexer.stop()
+        await app.state.idempotency_store.close()
+        app.state.ticket_index.close()
+        await ticket_registry.flush()
+        await app.state.transaction_tracker.close()
+        await app.state.blockchain_service.close()
+        app.state.event_indexer = None
+        app.state.ticket_index = None
+        app.state.idempotency_store = None
+        app.state.transaction_tracker = None
+        app.state.blockchain_service = None
+
+
+async def attribute_node_calls(request: Request) -> None:
+    """Count the node calls made while handling a request under its route."""
+    route = request.scope.get("route")
+    calling_route.set(route.path if route is not None else "unmatched")
+
 
 # Create FastAPI app instance
 app = FastAPI(
     title="TicketChain API",
     description="Blockchain-based ticketing system API",
     version="0.1.0",
+    lifespan=lifespan,
+    dependencies=[Depends(attribute_node_calls)],
 )
 
 # Configure CORS
@@ -23,8 +97,25 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Time every request for /metrics
+app.add_middleware(MetricsMiddleware)
+
+
+@app.exception_handler(ServiceBusyError)
+async def service_busy_handler(request: Request, exc: ServiceBusyError) -> JSONResponse:
+    """Tell clients to back off when the transaction queue is full."""
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(int(exc.retry_after))},
+    )
+
+
 # Include routers
 app.include_router(tickets_router)
+app.include_router(transactions_router)
+app.include_router(events_router)
+app.include_router(metadata_router)
 
 
 @app.get("/")
@@ -34,13 +125,13 @@ async def root() -> dict:
 
 
 @app.get("/api/v1/health")
-async def health_check() -> dict:
+async def health_check(
+    blockchain_service: Annotated[
+        BlockchainServiceInterface, Depends(get_blockchain_service)
+    ],
+) -> dict:
     """Health check endpoint."""
-    from ..config import settings
-    from .tickets import get_blockchain_service
-
     # Get blockchain service info for debugging
-    blockchain_service = await get_blockchain_service()
     service_type = type(blockchain_service).__name__
 
     return {
@@ -50,3 +141,42 @@ async def health_check() -> dict:
         "blockchain_service": service_type,
         "contract_address": settings.ticket_contract_address,
     }
+
+
+@app.get("/api/v1/stats")
+async def service_stats(
+    request: Request,
+    blockchain_service: Annotated[
+        BlockchainServiceInterface, Depends(get_blockchain_service)
+    ],
+    tracker: Annotated[TransactionTracker, Depends(get_transaction_tracker)],
+    idempotency: Annotated[IdempotencyStore, Depends(get_idempotency_store)],
+) -> dict:
+    """Internal state of the backend (fee quotes, nonces, queues), for monitoring."""
+    indexer: EventIndexer | None = getattr(request.app.state, "event_indexer", None)
+    return {
+        "blockchain_service": type(blockchain_service).__name__,
+        "blockchain": blockchain_service.stats(),
+        "transactions": {"pending": tracker.pending_count},
+        "idempotency": idempotency.stats(),
+        "registry": ticket_registry.stats(),
+        "metadata": metadata_store.stats(),
+        "indexer": indexer.stats() if indexer is not None else None,
+    }
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics(
+    request: Request,
+    blockchain_service: Annotated[
+        BlockchainServiceInterface, Depends(get_blockchain_service)
+    ],
+    tracker: Annotated[TransactionTracker, Depends(get_transaction_tracker)],
+    idempotency: Annotated[IdempotencyStore, Depends(get_idempotency_store)],
+) -> PlainTextResponse:
+    """Prometheus metrics: request, RPC and gas histograms plus service state."""
+    stats = await service_stats(request, blockchain_service, tracker, idempotency)
+    return PlainTextResponse(
+        metrics_registry.render(stats),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
@@ -0,0 +1,117 @@
+"""
+Metadata API router for TicketChain.
+
+Serves the token metadata documents named by on-chain token URIs. Documents
+are content-addressed, so responses carry a strong ETag and may be cached
+forever by browsers, wallets and CDNs.
+"""
+
+import base64
+import binascii
+import hashlib
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+
+from ..blockchain_service.interface import BlockchainServiceInterface
+from ..datastore.metadata_store import digest_from_uri, is_digest, metadata_store
+from .models import ErrorResponse
+from .tickets import get_blockchain_service
+
+router = APIRouter(
+    prefix="/metadata",
+    tags=["metadata"],
+    responses={
+        404: {"model": ErrorResponse, "description": "Metadata not found"},
+    },
+)
+
+_IMMUTABLE = "public, max-age=31536000, immutable"
+_DATA_URI_PREFIX = "data:application/json;base64,"
+
+
+def _decode_data_uri(token_uri: str) -> Optional[bytes]:
+    """Document embedded in an inline token URI, or None for other URIs."""
+    if not token_uri.startswith(_DATA_URI_PREFIX):
+        return None
+    payload = token_uri[len(_DATA_URI_PREFIX) :]
+    try:
+        # Tokens minted before the fix carry hex under a base64 label. Hex
+        # of a JSON object starts "7b"; base64 of one starts "e".
+        document = bytes.fromhex(payload)
+        if document.startswith(b"{"):
+            return document
+    except ValueError:
+        pass
+    try:
+        return base64.b64decode(payload, validate=True)
+    except binascii.Error:
+        return None
+
+
+async def _token_document(
+    token_id: int, blockchain_service: BlockchainServiceInterface
+) -> tuple[Optional[str], Optional[bytes]]:
+    """Content address and document of a token's metadata."""
+    digest = metadata_store.digest_for_token(token_id)
+    if digest is not None:
+        return digest, metadata_store.get(digest)
+
+    token_uri = await blockchain_service.get_token_uri(token_id)
+    if token_uri is None:
+        return None, None
+    digest = digest_from_uri(token_uri)
+    if digest is not None:
+        metadata_store.link_token(token_id, digest)
+        return digest, metadata_store.get(digest)
+    document = _decode_data_uri(token_uri)
+    if document is None:
+        return None, None
+    return hashlib.sha256(document).hexdigest(), document
+
+
+@router.get(
+    "/{ref}",
+    response_class=Response,
+    responses={
+        200: {"content": {"application/json": {}}},
+        304: {"description": "Not modified"},
+    },
+)
+async def get_metadata(
+    ref: str,
+    blockchain_service: Annotated[
+        BlockchainServiceInterface, Depends(get_blockchain_service)
+    ],
+    if_none_match: Annotated[Optional[str], Header()] = None,
+) -> Response:
+    """
+    Get a token's metadata document.
+
+    ``ref`` is either the content address from the token URI or a token ID.
+    A token ID is resolved through the token URI on-chain the first time.
+    """
+    if is_digest(ref):
+        digest: Optional[str] = ref
+        document = metadata_store.get(ref)
+    elif ref.isdigit():
+        try:
+            digest, document = await _token_document(int(ref), blockchain_service)
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to get metadata: {str(e)}",
+            ) from e
+    else:
+        digest, document = None, None
+
+    if digest is None or document is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Metadata {ref} not found",
+        )
+
+    headers = {"ETag": f'"{digest}"', "Cache-Control": _IMMUTABLE}
+    if if_none_match is not None and f'"{digest}"' in if_none_match:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=document, media_type="application/json", headers=headers)
@@ -0,0 +1,47 @@
+"""
+Request timing for the Prometheus ``/metrics`` endpoint.
+"""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..metrics import http_request_seconds
+
+
+class MetricsMiddleware:
+    """
+    Times every HTTP request by method, route template and status.
+
+    Plain ASGI rather than ``BaseHTTPMiddleware``, which would add a task and
+    a memory stream to each request. Routes are labelled by their template
+    (``/api/v1/tickets/{ticket_id}``) so label values stay bounded.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            http_request_seconds.observe(
+                time.perf_counter() - start,
+                scope["method"],
+                route.path if route is not None else "unmatched",
+                str(status_code),
+            )
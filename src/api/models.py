@@ -6,7 +6,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class TicketStatus(str, Enum):
@@ -31,6 +31,25 @@ class SoldTicketRequest(BaseModel):
     metadata_attributes: Optional[dict] = Field(None, description="Additional metadata")
 
 
+class BatchSoldTicketRequest(BaseModel):
+    """Request model for minting many sold tickets at once."""
+
+    tickets: list[SoldTicketRequest] = Field(
+        ..., min_length=1, max_length=1000, description="Tickets to mint"
+    )
+
+    @field_validator("tickets")
+    @classmethod
+    def ticket_ids_unique(
+        cls, tickets: list[SoldTicketRequest]
+    ) -> list[SoldTicketRequest]:
+        """Reject batches that mention the same ticket twice."""
+        ticket_ids = [ticket.ticket_id for ticket in tickets]
+        if len(set(ticket_ids)) != len(ticket_ids):
+            raise ValueError("ticket_id values must be unique within a batch")
+        return tickets
+
+
 class ResoldTicketRequest(BaseModel):
     """Request model for reselling a ticket."""
 
@@ -52,6 +71,22 @@ class InvalidateTicketRequest(BaseModel):
     ticket_id: str = Field(..., description="Unique identifier for the ticket")
 
 
+class BatchTicketIdsRequest(BaseModel):
+    """Request model for checking in or invalidating many tickets at once."""
+
+    ticket_ids: list[str] = Field(
+        ..., min_length=1, max_length=5000, description="Tickets to update"
+    )
+
+    @field_validator("ticket_ids")
+    @classmethod
+    def ticket_ids_unique(cls, ticket_ids: list[str]) -> list[str]:
+        """Reject batches that mention the same ticket twice."""
+        if len(set(ticket_ids)) != len(ticket_ids):
+            raise ValueError("ticket_ids must be unique within a batch")
+        return ticket_ids
+
+
 class TicketResponse(BaseModel):
     """Response model for ticket operations."""
 
@@ -65,9 +100,110 @@ class TicketResponse(BaseModel):
     message: str
 
 
+class TicketStateResponse(BaseModel):
+    """Response model for reading a ticket's current on-chain state."""
+
+    ticket_id: str
+    token_id: int = Field(..., description="On-chain NFT token ID")
+    status: TicketStatus
+    owner_address: str
+    block_number: Optional[int] = Field(
+        None, description="Block of the last change, if served from the index"
+    )
+    source: str = Field(..., description="'index' or 'chain'")
+
+
+class BatchItemError(BaseModel):
+    """A ticket in a batch operation that could not be processed."""
+
+    ticket_id: str
+    error: str
+
+
+class BatchTicketResponse(BaseModel):
+    """Response model for batch ticket operations."""
+
+    tickets: list[TicketResponse] = Field(..., description="Processed tickets")
+    failed: list[BatchItemError] = Field(
+        default_factory=list, description="Tickets that could not be processed"
+    )
+    message: str
+
+
+class BatchItemResult(BaseModel):
+    """Outcome for one ticket of a batch state change."""
+
+    ticket_id: str
+    token_id: Optional[int] = None
+    success: bool
+    transaction_hash: Optional[str] = None
+    error: Optional[str] = None
+
+
+class BatchStateChangeResponse(BaseModel):
+    """Response model for batch check-in and invalidation."""
+
+    status: TicketStatus = Field(..., description="State the tickets moved to")
+    results: list[BatchItemResult] = Field(..., description="One per requested ticket")
+    succeeded: int
+    failed: int
+    message: str
+
+
+class TransactionState(str, Enum):
+    """Resolution state of a transaction submitted in asynchronous mode."""
+
+    PENDING = "pending"
+    CONFIRMED = "confirmed"
+    FAILED = "failed"
+
+
+class TransactionAcceptedResponse(BaseModel):
+    """Response model for a write accepted in asynchronous mode."""
+
+    ticket_id: str
+    transaction_hash: str = Field(..., description="Handle for the status endpoint")
+    status: TransactionState
+    status_url: str
+    message: str
+
+
+class TransactionStatusResponse(BaseModel):
+    """Response model for the status of a tracked transaction."""
+
+    transaction_hash: str
+    operation: str
+    ticket_id: str
+    status: TransactionState
+    result: Optional[TicketResponse] = Field(
+        None, description="Final ticket state once confirmed"
+    )
+    error: Optional[str] = Field(None, description="Failure reason if failed")
+    submitted_at: datetime
+    updated_at: datetime
+
+
 class ErrorResponse(BaseModel):
     """Standard error response."""
 
     error: str
     detail: Optional[str] = None
     status_code: int
+
+
+class EventTicket(BaseModel):
+    """A ticket of an event, as recorded at mint time."""
+
+    ticket_id: str
+    token_id: int = Field(..., description="On-chain NFT token ID")
+    metadata: Optional[dict] = Field(None, description="Sale details recorded at mint")
+
+
+class EventTicketsResponse(BaseModel):
+    """One page of an event's tickets."""
+
+    event_id: str
+    tickets: list[EventTicket]
+    next_cursor: Optional[str] = Field(
+        None, description="Pass as 'cursor' for the next page; null on the last page"
+    )
@@ -2,59 +2,268 @@
 Tickets API router for TicketChain.
 """
 
+import asyncio
+import base64
 import json
+from collections.abc import Awaitable, Callable
 from datetime import datetime
-from typing import Annotated
-
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Annotated, Any, Optional
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import JSONResponse
+from pydantic import AfterValidator
 
-from ..blockchain_service.interface import BlockchainServiceInterface
+from ..blockchain_service.interface import (
+    BlockchainServiceInterface,
+    PendingTransaction,
+    ServiceBusyError,
+)
 from ..blockchain_service.mock_service import MockBlockchainService
+from ..config import settings
+from ..datastore.metadata_store import digest_from_uri, metadata_store
+from ..datastore.records import RegisteredTicket
+from ..datastore.ticket_index import TicketIndex
 from ..datastore.ticket_registry import ticket_registry as registry
+from .idempotency import (
+    IdempotencyStore,
+    get_idempotency_store,
+    idempotency_key,
+    keep_response_if,
+    request_fingerprint,
+    run_idempotent,
+)
 from .models import (
+    BatchItemError,
+    BatchItemResult,
+    BatchSoldTicketRequest,
+    BatchStateChangeResponse,
+    BatchTicketIdsRequest,
+    BatchTicketResponse,
     CheckedInTicketRequest,
     ErrorResponse,
     InvalidateTicketRequest,
     ResoldTicketRequest,
     SoldTicketRequest,
     TicketResponse,
+    TicketStateResponse,
     TicketStatus,
+    TransactionAcceptedResponse,
+    TransactionState,
+)
+from .transactions import (
+    TransactionTracker,
+    get_transaction_tracker,
+    validate_callback_url,
 )
 
 router = APIRouter(
     prefix="/api/v1/tickets",
     tags=["tickets"],
     responses={
+        202: {
+            "model": TransactionAcceptedResponse,
+            "description": "Transaction broadcast; poll status_url for the result",
+        },
         404: {"model": ErrorResponse, "description": "Ticket not found"},
+        429: {
+            "model": ErrorResponse,
+            "description": "Transaction queue full; retry after Retry-After seconds",
+        },
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
 
 
-# Dependency injection for blockchain service
-async def get_blockchain_service() -> BlockchainServiceInterface:
+async def create_blockchain_service() -> BlockchainServiceInterface:
     """
-    Dependency injection for blockchain service.
+    Build the blockchain service used by the application.
+
     Returns mock service if no contract address is configured,
     otherwise returns the real Web3 implementation.
+
+    Raises:
+        Exception: If a contract is configured but its node cannot be
+                   reached; the app must not fall back to the mock chain
     """
     from ..blockchain_service import Web3BlockchainService
-    from ..config import settings
 
-    # Use real service if contract address is configured
-    if settings.ticket_contract_address:
-        try:
-            service = Web3BlockchainService()
-            return service
-        except Exception as e:
-            print(
-                f"Warning: Failed to initialize Web3 service ({e}), using mock service"
-            )
-            return MockBlockchainService()
-    else:
+    if not settings.ticket_contract_address:
         print("No contract address configured, using mock service")
         return MockBlockchainService()
 
+    service = Web3BlockchainService()
+    try:
+        await service.connect()
+    except Exception:
+        await service.close()
+        raise
+    return service
+
+
+# Dependency injection for blockchain service
+async def get_blockchain_service(request: Request) -> BlockchainServiceInterface:
+    """
+    Dependency injection for blockchain service.
+
+    Returns the app-scoped service created by the lifespan hook. If the app
+    is served without running its lifespan (e.g. a bare TestClient), the
+    service is created on first use and cached on the app state.
+    """
+    service: BlockchainServiceInterface | None = getattr(
+        request.app.state, "blockchain_service", None
+    )
+    if service is None:
+        service = await create_blockchain_service()
+        request.app.state.blockchain_service = service
+    return service
+
+
+# Dependency injection for the contract event index
+async def get_ticket_index(request: Request) -> TicketIndex:
+    """
+    Dependency injection for the app-scoped ticket index.
+
+    Created on first use if the app lifespan has not run; it then stays
+    empty and reads fall back to the chain.
+    """
+    index: TicketIndex | None = getattr(request.app.state, "ticket_index", None)
+    if index is None:
+        index = TicketIndex(settings.indexer_db_path or ":memory:")
+        request.app.state.ticket_index = index
+    return index
+
+
+# On-chain status names as API ticket states
+_STATUS_FROM_CHAIN = {
+    "Valid": TicketStatus.VALID,
+    "CheckedIn": TicketStatus.CHECKED_IN,
+    "Invalidated": TicketStatus.INVALIDATED,
+}
+
+
+# Query parameters enabling asynchronous submit-and-track mode
+WaitQuery = Annotated[
+    bool,
+    Query(
+        description="Wait for the transaction to be mined. If false, respond "
+        "202 right after broadcast with a transaction handle."
+    ),
+]
+CallbackUrlQuery = Annotated[
+    Optional[str],
+    AfterValidator(validate_callback_url),
+    Query(
+        description="Public http(s) webhook notified with the final state "
+        "(wait=false only)"
+    ),
+]
+IdempotencyKeyHeader = Annotated[
+    Optional[str],
+    Header(
+        alias="Idempotency-Key",
+        description="Retries with the same key get the first request's response "
+        "instead of sending another transaction",
+    ),
+]
+
+
+async def _respond(
+    pending: PendingTransaction,
+    finalize: Callable[[dict[str, Any]], Awaitable[TicketResponse]],
+    wait: bool,
+    tracker: TransactionTracker,
+    operation: str,
+    ticket_id: str,
+    callback_url: Optional[str],
+) -> TicketResponse | JSONResponse:
+    """
+    Finish a write either synchronously or in submit-and-track mode.
+
+    Args:
+        pending: Handle of the broadcast transaction
+        finalize: Builds the ticket response from the mined result
+        wait: Whether to wait for the transaction to be mined
+        tracker: Tracker resolving the transaction when not waiting
+        operation: Name of the API operation, for the status endpoint
+        ticket_id: Off-chain ticket ID
+        callback_url: Optional webhook for the final state
+
+    Returns:
+        The ticket response, or a 202 response with the transaction handle
+    """
+    if wait:
+        return await finalize(await pending.wait())
+
+    record = tracker.track(pending, operation, ticket_id, finalize, callback_url)
+    assert record.outcome is not None
+    # A retry must not get this 202 back if the transaction fails
+    keep_response_if(record.outcome)
+    status_url = f"/api/v1/transactions/{record.transaction_hash}"
+    accepted = TransactionAcceptedResponse(
+        ticket_id=ticket_id,
+        transaction_hash=record.transaction_hash,
+        status=TransactionState.PENDING,
+        status_url=status_url,
+        message="Transaction submitted",
+    )
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=accepted.model_dump(mode="json"),
+        headers={"Location": status_url},
+    )
+
+
+async def _build_token_uri(request: SoldTicketRequest) -> str:
+    """
+    Build the token metadata URI for a sold ticket.
+
+    The metadata goes on-chain as a base64 data URI. With
+    ``TOKEN_METADATA_STORAGE=offchain`` it is kept in the content-addressed
+    metadata store instead and only its short URI goes on-chain.
+    """
+    metadata = {
+        "name": request.name or f"Ticket #{request.ticket_id}",
+        "description": request.description or f"Ticket for event {request.event_id}",
+        "image": request.image_url,
+        "attributes": request.metadata_attributes or {},
+        "event_id": request.event_id,
+        "ticket_id": request.ticket_id,
+    }
+    if settings.token_metadata_storage == "inline":
+        encoded = base64.b64encode(json.dumps(metadata).encode()).decode()
+        return f"data:application/json;base64,{encoded}"
+    return metadata_store.uri(await metadata_store.put(metadata))
+
+
+def _link_metadata(token_id: int, token_uri: str) -> None:
+    """Remember which stored metadata document a minted token names."""
+    digest = digest_from_uri(token_uri)
+    if digest is not None:
+        metadata_store.link_token(token_id, digest)
+
+
+def _registered_ticket(request: SoldTicketRequest, token_id: int) -> RegisteredTicket:
+    """Registry record of a sold ticket, with its sale details."""
+    return RegisteredTicket(
+        ticket_id=request.ticket_id,
+        token_id=token_id,
+        event_id=request.event_id,
+        metadata={
+            "user_id": request.user_id,
+            "price": request.price,
+            "to_address": request.to_address,
+        },
+    )
+
 
 @router.post(
     "/sold", response_model=TicketResponse, status_code=status.HTTP_201_CREATED
@@ -64,7 +273,13 @@ async def sold_ticket(
     blockchain_service: Annotated[
         BlockchainServiceInterface, Depends(get_blockchain_service)
     ],
-) -> TicketResponse:
+    tracker: Annotated[TransactionTracker, Depends(get_transaction_tracker)],
+    response: Response,
+    idempotency: Annotated[IdempotencyStore, Depends(get_idempotency_store)],
+    wait: WaitQuery = True,
+    callback_url: CallbackUrlQuery = None,
+    idempotency_key_header: IdempotencyKeyHeader = None,
+) -> TicketResponse | JSONResponse:
     """
     Mint a new ticket NFT when a ticket is sold.
 
@@ -72,47 +287,190 @@ async def sold_ticket(
     - Creates a new NFT on the blockchain
     - Assigns it to the specified user address
     - Returns the ticket details including the on-chain token ID
+
+    With ``wait=false`` the ticket is registered once its mint is confirmed.
+    Retries of a sale, identified by ``Idempotency-Key`` or else by ticket
+    ID, get the first response instead of minting again.
+    """
+
+    async def submit() -> TicketResponse | JSONResponse:
+        try:
+            # Mint the ticket on-chain
+            token_uri = await _build_token_uri(request)
+            pending = await blockchain_service.submit_mint_ticket(
+                to_address=request.to_address,
+                token_uri=token_uri,
+            )
+
+            async def finalize(result: dict[str, Any]) -> TicketResponse:
+                _link_metadata(result["token_id"], token_uri)
+                # Store mapping and sale details for later operations
+                registry.register_tickets(
+                    [_registered_ticket(request, result["token_id"])]
+                )
+                await registry.flush()
+
+                return TicketResponse(
+                    ticket_id=request.ticket_id,
+                    token_id=result["token_id"],
+                    event_id=request.event_id,
+                    status=TicketStatus.VALID,
+                    owner_address=request.to_address,
+                    transaction_hash=result["transaction_hash"],
+                    timestamp=datetime.fromisoformat(result["timestamp"]),
+                    message="Ticket successfully minted",
+                )
+
+            return await _respond(
+                pending,
+                finalize,
+                wait,
+                tracker,
+                "sold",
+                request.ticket_id,
+                callback_url,
+            )
+
+        except ServiceBusyError:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to mint ticket: {str(e)}",
+            ) from e
+
+    return await run_idempotent(
+        idempotency,
+        idempotency_key(idempotency_key_header, "sold", request.ticket_id),
+        request_fingerprint("sold", request, wait=wait, callback_url=callback_url),
+        submit,
+        response,
+    )
+
+
+@router.post(
+    "/sold/batch",
+    response_model=BatchTicketResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def sold_tickets_batch(
+    request: BatchSoldTicketRequest,
+    blockchain_service: Annotated[
+        BlockchainServiceInterface, Depends(get_blockchain_service)
+    ],
+    response: Response,
+    idempotency: Annotated[IdempotencyStore, Depends(get_idempotency_store)],
+    idempotency_key_header: IdempotencyKeyHeader = None,
+) -> BatchTicketResponse:
+    """
+    Mint many sold tickets at once.
+
+    This endpoint:
+    - Mints the tickets with one ``batchMintTicket`` transaction per chunk
+      of ``BATCH_CHUNK_SIZE`` tickets, chunks being submitted concurrently
+    - Registers every minted ticket in a single registry write
+    - Reports tickets from failed chunks in ``failed``
     """
-    try:
-        # Create metadata URI (in production, this would be uploaded to IPFS or similar)
-        metadata = {
-            "name": request.name or f"Ticket #{request.ticket_id}",
-            "description": request.description
-            or f"Ticket for event {request.event_id}",
-            "image": request.image_url,
-            "attributes": request.metadata_attributes or {},
-            "event_id": request.event_id,
-            "ticket_id": request.ticket_id,
-        }
-        token_uri = (
-            f"data:application/json;base64,{json.dumps(metadata).encode().hex()}"
-        )
 
-        # Mint the ticket on-chain
-        result = await blockchain_service.mint_ticket(
-            to_address=request.to_address,
-            token_uri=token_uri,
+    async def submit() -> BatchTicketResponse:
+        chunk_size = settings.batch_chunk_size
+        chunks = [
+            request.tickets[i : i + chunk_size]
+            for i in range(0, len(request.tickets), chunk_size)
+        ]
+
+        token_uris = [
+            await asyncio.gather(*(_build_token_uri(ticket) for ticket in chunk))
+            for chunk in chunks
+        ]
+
+        results = await asyncio.gather(
+            *(
+                blockchain_service.batch_mint_tickets(
+                    to_addresses=[ticket.to_address for ticket in chunk],
+                    token_uris=uris,
+                )
+                for chunk, uris in zip(chunks, token_uris, strict=True)
+            ),
+            return_exceptions=True,
         )
 
-        # Store mapping for later operations
-        registry.register_ticket(request.ticket_id, result["token_id"])
-
-        return TicketResponse(
-            ticket_id=request.ticket_id,
-            token_id=result["token_id"],
-            event_id=request.event_id,
-            status=TicketStatus.VALID,
-            owner_address=request.to_address,
-            transaction_hash=result["transaction_hash"],
-            timestamp=datetime.fromisoformat(result["timestamp"]),
-            message="Ticket successfully minted",
+        minted: list[TicketResponse] = []
+        failed: list[BatchItemError] = []
+        registered: list[RegisteredTicket] = []
+        for chunk, uris, result in zip(chunks, token_uris, results, strict=True):
+            if isinstance(result, BaseException):
+                failed.extend(
+                    BatchItemError(ticket_id=ticket.ticket_id, error=str(result))
+                    for ticket in chunk
+                )
+                continue
+
+            timestamp = datetime.fromisoformat(result["timestamp"])
+            for ticket, uri, token_id in zip(
+                chunk, uris, result["token_ids"], strict=True
+            ):
+                _link_metadata(token_id, uri)
+                registered.append(_registered_ticket(ticket, token_id))
+                minted.append(
+                    TicketResponse(
+                        ticket_id=ticket.ticket_id,
+                        token_id=token_id,
+                        event_id=ticket.event_id,
+                        status=TicketStatus.VALID,
+                        owner_address=ticket.to_address,
+                        transaction_hash=result["transaction_hash"],
+                        timestamp=timestamp,
+                        message="Ticket successfully minted",
+                    )
+                )
+
+        # Store all mappings for later operations in one bulk write
+        registry.register_tickets(registered)
+        await registry.flush()
+
+        if not minted:
+            _raise_if_all_busy(results)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to mint tickets: {failed[0].error}",
+            )
+
+        return BatchTicketResponse(
+            tickets=minted,
+            failed=failed,
+            message=f"Minted {len(minted)} of {len(request.tickets)} tickets",
         )
 
-    except Exception as e:
+    return await run_idempotent(
+        idempotency,
+        idempotency_key(idempotency_key_header, "sold/batch"),
+        request_fingerprint("sold/batch", request),
+        submit,
+        response,
+    )
+
+
+def _raise_if_all_busy(outcomes: list[Any]) -> None:
+    """Reject a batch as a whole if the service turned away every chunk."""
+    if outcomes and all(isinstance(o, ServiceBusyError) for o in outcomes):
+        raise outcomes[0]
+
+
+def _lookup_ticket(ticket_id: str) -> RegisteredTicket:
+    """Resolve a ticket ID to its registry record or raise a 404."""
+    ticket = registry.get_ticket(ticket_id)
+    if ticket is None:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to mint ticket: {str(e)}",
-        ) from e
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Ticket {ticket_id} not found",
+        )
+    return ticket
+
+
+def _event_id(ticket: RegisteredTicket) -> str:
+    """Event of a ticket; tickets registered without one report "unknown"."""
+    return ticket.event_id or "unknown"
 
 
 @router.post("/resold", response_model=TicketResponse)
@@ -121,7 +479,13 @@ async def resold_ticket(
     blockchain_service: Annotated[
         BlockchainServiceInterface, Depends(get_blockchain_service)
     ],
-) -> TicketResponse:
+    tracker: Annotated[TransactionTracker, Depends(get_transaction_tracker)],
+    response: Response,
+    idempotency: Annotated[IdempotencyStore, Depends(get_idempotency_store)],
+    wait: WaitQuery = True,
+    callback_url: CallbackUrlQuery = None,
+    idempotency_key_header: IdempotencyKeyHeader = None,
+) -> TicketResponse | JSONResponse:
     """
     Handle secondary market ticket resale.
 
@@ -129,52 +493,63 @@ async def resold_ticket(
     - Transfers the NFT from the current owner to the new owner
     - Records the resale transaction on-chain
     """
-    try:
-        # Look up token ID
-        if not registry.exists(request.ticket_id):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Ticket {request.ticket_id} not found",
-            )
 
-        token_id = registry.get_token_id(request.ticket_id)
-        if token_id is None:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Token ID not found for ticket {request.ticket_id}",
+    async def submit() -> TicketResponse | JSONResponse:
+        try:
+            # Look up token ID
+            ticket = _lookup_ticket(request.ticket_id)
+            token_id = ticket.token_id
+
+            # Get current owner
+            current_owner = await blockchain_service.get_ticket_owner(token_id)
+
+            # Transfer the ticket
+            pending = await blockchain_service.submit_transfer_ticket(
+                token_id=token_id,
+                from_address=current_owner,
+                to_address=request.to_address,
             )
 
-        # Get current owner
-        current_owner = await blockchain_service.get_ticket_owner(token_id)
-
-        # Transfer the ticket
-        result = await blockchain_service.transfer_ticket(
-            token_id=token_id,
-            from_address=current_owner,
-            to_address=request.to_address,
-        )
-
-        # Get current status
-        status_str = await blockchain_service.get_ticket_status(token_id)
+            async def finalize(result: dict[str, Any]) -> TicketResponse:
+                # Get current status
+                status_str = await blockchain_service.get_ticket_status(token_id)
+
+                return TicketResponse(
+                    ticket_id=request.ticket_id,
+                    token_id=token_id,
+                    event_id=_event_id(ticket),
+                    status=TicketStatus(status_str.lower()),
+                    owner_address=request.to_address,
+                    transaction_hash=result["transaction_hash"],
+                    timestamp=datetime.fromisoformat(result["timestamp"]),
+                    message="Ticket successfully transferred",
+                )
+
+            return await _respond(
+                pending,
+                finalize,
+                wait,
+                tracker,
+                "resold",
+                request.ticket_id,
+                callback_url,
+            )
 
-        return TicketResponse(
-            ticket_id=request.ticket_id,
-            token_id=token_id,
-            event_id="unknown",  # In production, this would be fetched from metadata
-            status=TicketStatus(status_str.lower()),
-            owner_address=request.to_address,
-            transaction_hash=result["transaction_hash"],
-            timestamp=datetime.fromisoformat(result["timestamp"]),
-            message="Ticket successfully transferred",
-        )
+        except (HTTPException, ServiceBusyError):
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to resell ticket: {str(e)}",
+            ) from e
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to resell ticket: {str(e)}",
-        ) from e
+    return await run_idempotent(
+        idempotency,
+        idempotency_key(idempotency_key_header, "resold"),
+        request_fingerprint("resold", request, wait=wait, callback_url=callback_url),
+        submit,
+        response,
+    )
 
 
 @router.post("/checked-in", response_model=TicketResponse)
@@ -183,7 +558,13 @@ async def checked_in_ticket(
     blockchain_service: Annotated[
         BlockchainServiceInterface, Depends(get_blockchain_service)
     ],
-) -> TicketResponse:
+    tracker: Annotated[TransactionTracker, Depends(get_transaction_tracker)],
+    response: Response,
+    idempotency: Annotated[IdempotencyStore, Depends(get_idempotency_store)],
+    wait: WaitQuery = True,
+    callback_url: CallbackUrlQuery = None,
+    idempotency_key_header: IdempotencyKeyHeader = None,
+) -> TicketResponse | JSONResponse:
     """
     Check in a ticket at the event.
 
@@ -191,45 +572,58 @@ async def checked_in_ticket(
     - Updates the ticket state on-chain to CheckedIn
     - Prevents the ticket from being used again
     """
-    try:
-        # Look up token ID
-        if not registry.exists(request.ticket_id):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Ticket {request.ticket_id} not found",
+
+    async def submit() -> TicketResponse | JSONResponse:
+        try:
+            # Look up token ID
+            ticket = _lookup_ticket(request.ticket_id)
+            token_id = ticket.token_id
+
+            # Check in the ticket
+            pending = await blockchain_service.submit_check_in_ticket(token_id)
+
+            async def finalize(result: dict[str, Any]) -> TicketResponse:
+                # Get owner
+                owner = await blockchain_service.get_ticket_owner(token_id)
+
+                return TicketResponse(
+                    ticket_id=request.ticket_id,
+                    token_id=token_id,
+                    event_id=_event_id(ticket),
+                    status=TicketStatus.CHECKED_IN,
+                    owner_address=owner,
+                    transaction_hash=result["transaction_hash"],
+                    timestamp=datetime.fromisoformat(result["timestamp"]),
+                    message="Ticket successfully checked in",
+                )
+
+            return await _respond(
+                pending,
+                finalize,
+                wait,
+                tracker,
+                "checked-in",
+                request.ticket_id,
+                callback_url,
             )
 
-        token_id = registry.get_token_id(request.ticket_id)
-        if token_id is None:
+        except (HTTPException, ServiceBusyError):
+            raise
+        except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Token ID not found for ticket {request.ticket_id}",
-            )
-
-        # Check in the ticket
-        result = await blockchain_service.check_in_ticket(token_id)
-
-        # Get owner
-        owner = await blockchain_service.get_ticket_owner(token_id)
+                detail=f"Failed to check in ticket: {str(e)}",
+            ) from e
 
-        return TicketResponse(
-            ticket_id=request.ticket_id,
-            token_id=token_id,
-            event_id="unknown",  # In production, this would be fetched from metadata
-            status=TicketStatus.CHECKED_IN,
-            owner_address=owner,
-            transaction_hash=result["transaction_hash"],
-            timestamp=datetime.fromisoformat(result["timestamp"]),
-            message="Ticket successfully checked in",
-        )
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to check in ticket: {str(e)}",
-        ) from e
+    return await run_idempotent(
+        idempotency,
+        idempotency_key(idempotency_key_header, "checked-in", request.ticket_id),
+        request_fingerprint(
+            "checked-in", request, wait=wait, callback_url=callback_url
+        ),
+        submit,
+        response,
+    )
 
 
 @router.post("/invalidated", response_model=TicketResponse)
@@ -238,7 +632,13 @@ async def invalidate_ticket(
     blockchain_service: Annotated[
         BlockchainServiceInterface, Depends(get_blockchain_service)
     ],
-) -> TicketResponse:
+    tracker: Annotated[TransactionTracker, Depends(get_transaction_tracker)],
+    response: Response,
+    idempotency: Annotated[IdempotencyStore, Depends(get_idempotency_store)],
+    wait: WaitQuery = True,
+    callback_url: CallbackUrlQuery = None,
+    idempotency_key_header: IdempotencyKeyHeader = None,
+) -> TicketResponse | JSONResponse:
     """
     Invalidate a ticket (e.g., for refunds or cancellations).
 
@@ -246,42 +646,252 @@ async def invalidate_ticket(
     - Updates the ticket state on-chain to Invalidated
     - Prevents the ticket from being used or transferred
     """
-    try:
-        # Look up token ID
-        if not registry.exists(request.ticket_id):
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Ticket {request.ticket_id} not found",
+
+    async def submit() -> TicketResponse | JSONResponse:
+        try:
+            # Look up token ID
+            ticket = _lookup_ticket(request.ticket_id)
+            token_id = ticket.token_id
+
+            # Invalidate the ticket
+            pending = await blockchain_service.submit_invalidate_ticket(token_id)
+
+            async def finalize(result: dict[str, Any]) -> TicketResponse:
+                # Get owner
+                owner = await blockchain_service.get_ticket_owner(token_id)
+
+                return TicketResponse(
+                    ticket_id=request.ticket_id,
+                    token_id=token_id,
+                    event_id=_event_id(ticket),
+                    status=TicketStatus.INVALIDATED,
+                    owner_address=owner,
+                    transaction_hash=result["transaction_hash"],
+                    timestamp=datetime.fromisoformat(result["timestamp"]),
+                    message="Ticket successfully invalidated",
+                )
+
+            return await _respond(
+                pending,
+                finalize,
+                wait,
+                tracker,
+                "invalidated",
+                request.ticket_id,
+                callback_url,
             )
 
-        token_id = registry.get_token_id(request.ticket_id)
-        if token_id is None:
+        except (HTTPException, ServiceBusyError):
+            raise
+        except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Token ID not found for ticket {request.ticket_id}",
+                detail=f"Failed to invalidate ticket: {str(e)}",
+            ) from e
+
+    return await run_idempotent(
+        idempotency,
+        idempotency_key(idempotency_key_header, "invalidated", request.ticket_id),
+        request_fingerprint(
+            "invalidated", request, wait=wait, callback_url=callback_url
+        ),
+        submit,
+        response,
+    )
+
+
+async def _batch_state_change(
+    ticket_ids: list[str],
+    change: Callable[[list[int]], Awaitable[dict[str, Any]]],
+    new_status: TicketStatus,
+    action: str,
+) -> BatchStateChangeResponse:
+    """
+    Apply a batch state change, one transaction per chunk of tickets.
+
+    Args:
+        ticket_ids: Off-chain ticket IDs to update
+        change: Service method applying the change to a list of token IDs
+        new_status: State the tickets move to
+        action: Past-tense verb for messages (e.g. "checked in")
+
+    Returns:
+        Per-ticket results in request order
+    """
+    results: dict[str, BatchItemResult] = {}
+    ticket_by_token: dict[int, str] = {}
+    known = registry.get_many(ticket_ids)
+    for ticket_id in ticket_ids:
+        token_id = known.get(ticket_id)
+        if token_id is None:
+            results[ticket_id] = BatchItemResult(
+                ticket_id=ticket_id,
+                success=False,
+                error=f"Ticket {ticket_id} not found",
             )
+        else:
+            ticket_by_token[token_id] = ticket_id
+
+    token_ids = list(ticket_by_token)
+    chunk_size = settings.batch_chunk_size
+    chunks = [
+        token_ids[i : i + chunk_size] for i in range(0, len(token_ids), chunk_size)
+    ]
+    outcomes = await asyncio.gather(
+        *(change(chunk) for chunk in chunks), return_exceptions=True
+    )
+    _raise_if_all_busy(outcomes)
+
+    for chunk, outcome in zip(chunks, outcomes, strict=True):
+        if isinstance(outcome, BaseException):
+            for token_id in chunk:
+                ticket_id = ticket_by_token[token_id]
+                results[ticket_id] = BatchItemResult(
+                    ticket_id=ticket_id,
+                    token_id=token_id,
+                    success=False,
+                    error=str(outcome),
+                )
+            continue
+
+        skipped = set(outcome["failed"])
+        for token_id in chunk:
+            ticket_id = ticket_by_token[token_id]
+            results[ticket_id] = BatchItemResult(
+                ticket_id=ticket_id,
+                token_id=token_id,
+                success=token_id not in skipped,
+                transaction_hash=outcome["transaction_hash"],
+                error="Ticket is not valid" if token_id in skipped else None,
+            )
+
+    ordered = [results[ticket_id] for ticket_id in ticket_ids]
+    succeeded = sum(result.success for result in ordered)
+    return BatchStateChangeResponse(
+        status=new_status,
+        results=ordered,
+        succeeded=succeeded,
+        failed=len(ordered) - succeeded,
+        message=f"{succeeded} of {len(ordered)} tickets {action}",
+    )
+
+
+@router.post("/checked-in/batch", response_model=BatchStateChangeResponse)
+async def checked_in_tickets_batch(
+    request: BatchTicketIdsRequest,
+    blockchain_service: Annotated[
+        BlockchainServiceInterface, Depends(get_blockchain_service)
+    ],
+    response: Response,
+    idempotency: Annotated[IdempotencyStore, Depends(get_idempotency_store)],
+    idempotency_key_header: IdempotencyKeyHeader = None,
+) -> BatchStateChangeResponse:
+    """
+    Check in many tickets at once (e.g. gate scanners when doors open).
+
+    Tickets are checked in with one ``batchCheckIn`` transaction per chunk.
+    A ticket that is unknown, already checked in or invalidated is reported
+    as failed without affecting the rest of the batch.
+    """
+
+    async def submit() -> BatchStateChangeResponse:
+        return await _batch_state_change(
+            request.ticket_ids,
+            blockchain_service.batch_check_in_tickets,
+            TicketStatus.CHECKED_IN,
+            "checked in",
+        )
+
+    return await run_idempotent(
+        idempotency,
+        idempotency_key(idempotency_key_header, "checked-in/batch"),
+        request_fingerprint("checked-in/batch", request),
+        submit,
+        response,
+    )
+
+
+@router.post("/invalidated/batch", response_model=BatchStateChangeResponse)
+async def invalidate_tickets_batch(
+    request: BatchTicketIdsRequest,
+    blockchain_service: Annotated[
+        BlockchainServiceInterface, Depends(get_blockchain_service)
+    ],
+    response: Response,
+    idempotency: Annotated[IdempotencyStore, Depends(get_idempotency_store)],
+    idempotency_key_header: IdempotencyKeyHeader = None,
+) -> BatchStateChangeResponse:
+    """
+    Invalidate many tickets at once (e.g. mass refunds on event cancellation).
+
+    Tickets are invalidated with one ``batchInvalidate`` transaction per
+    chunk. A ticket that is unknown, checked in or already invalidated is
+    reported as failed without affecting the rest of the batch.
+    """
 
-        # Invalidate the ticket
-        result = await blockchain_service.invalidate_ticket(token_id)
+    async def submit() -> BatchStateChangeResponse:
+        return await _batch_state_change(
+            request.ticket_ids,
+            blockchain_service.batch_invalidate_tickets,
+            TicketStatus.INVALIDATED,
+            "invalidated",
+        )
+
+    return await run_idempotent(
+        idempotency,
+        idempotency_key(idempotency_key_header, "invalidated/batch"),
+        request_fingerprint("invalidated/batch", request),
+        submit,
+        response,
+    )
 
-        # Get owner
-        owner = await blockchain_service.get_ticket_owner(token_id)
 
-        return TicketResponse(
-            ticket_id=request.ticket_id,
+@router.get("/{ticket_id}", response_model=TicketStateResponse)
+async def get_ticket(
+    ticket_id: str,
+    blockchain_service: Annotated[
+        BlockchainServiceInterface, Depends(get_blockchain_service)
+    ],
+    index: Annotated[TicketIndex, Depends(get_ticket_index)],
+) -> TicketStateResponse:
+    """
+    Get a ticket's current owner and status.
+
+    Served from the local event index; tickets the indexer has not reached
+    yet are read from the chain.
+    """
+    token_id = _lookup_ticket(ticket_id).token_id
+
+    indexed = index.get_ticket(token_id)
+    if indexed is not None and indexed.owner is not None:
+        return TicketStateResponse(
+            ticket_id=ticket_id,
             token_id=token_id,
-            event_id="unknown",  # In production, this would be fetched from metadata
-            status=TicketStatus.INVALIDATED,
-            owner_address=owner,
-            transaction_hash=result["transaction_hash"],
-            timestamp=datetime.fromisoformat(result["timestamp"]),
-            message="Ticket successfully invalidated",
+            status=_STATUS_FROM_CHAIN[indexed.status],
+            owner_address=indexed.owner,
+            block_number=indexed.updated_block,
+            source="index",
         )
 
-    except HTTPException:
-        raise
+    try:
+        owner, status_str = await asyncio.gather(
+            blockchain_service.get_ticket_owner(token_id),
+            blockchain_service.get_ticket_status(token_id),
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to invalidate ticket: {str(e)}",
+            detail=f"Failed to get ticket: {str(e)}",
         ) from e
+    if status_str not in _STATUS_FROM_CHAIN:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Ticket {ticket_id} not found on-chain",
+        )
+    return TicketStateResponse(
+        ticket_id=ticket_id,
+        token_id=token_id,
+        status=_STATUS_FROM_CHAIN[status_str],
+        owner_address=owner,
+        source="chain",
+    )
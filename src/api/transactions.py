@@ -0,0 +1,280 @@
+"""
+Tracking of transactions submitted in asynchronous mode.
+
+Write endpoints called with ``wait=false`` return ``202 Accepted`` as soon as
+their transaction is broadcast. The tracker below resolves the transaction in
+the background, keeps its final state for the status endpoint and optionally
+notifies a webhook.
+"""
+
+import asyncio
+import ipaddress
+import socket
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Annotated, Any, Optional
+from urllib.parse import urlsplit
+
+import httpx
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+
+from ..blockchain_service.interface import PendingTransaction
+from ..config import settings
+from .models import (
+    ErrorResponse,
+    TicketResponse,
+    TransactionState,
+    TransactionStatusResponse,
+)
+
+router = APIRouter(
+    prefix="/api/v1/transactions",
+    tags=["transactions"],
+    responses={
+        404: {"model": ErrorResponse, "description": "Transaction not found"},
+    },
+)
+
+
+def _is_public_ip(host: str) -> Optional[bool]:
+    """Whether a host is a publicly routable IP address; None if not an IP."""
+    try:
+        return ipaddress.ip_address(host.strip("[]")).is_global
+    except ValueError:
+        return None
+
+
+def validate_callback_url(url: Optional[str]) -> Optional[str]:
+    """
+    Check a webhook URL supplied by a client before anything is sent to it.
+
+    Without this, callers could make the server POST to internal addresses
+    such as cloud metadata endpoints or admin ports.
+
+    Raises:
+        ValueError: If the URL is not http(s), or its host is not allowed
+    """
+    if url is None:
+        return None
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+    if parts.scheme not in ("http", "https") or not host:
+        raise ValueError("callback_url must be an absolute http(s) URL")
+    if settings.webhook_allowed_hosts:
+        if host not in settings.webhook_allowed_hosts:
+            raise ValueError(f"callback_url host {host!r} is not allowed")
+        return url
+    if (
+        host == "localhost"
+        or host.endswith(".localhost")
+        or _is_public_ip(host) is False
+    ):
+        raise ValueError(f"callback_url host {host!r} is not a public address")
+    return url
+
+
+async def _resolves_to_public_ips(host: str, port: int) -> bool:
+    """Whether every address a webhook host resolves to is public."""
+    try:
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            host, port, type=socket.SOCK_STREAM
+        )
+    except OSError:
+        return False
+    return all(_is_public_ip(str(info[4][0])) for info in infos)
+
+
+@dataclass
+class TrackedTransaction:
+    """State of one transaction followed by the tracker."""
+
+    transaction_hash: str
+    operation: str
+    ticket_id: str
+    callback_url: Optional[str] = None
+    status: TransactionState = TransactionState.PENDING
+    result: Optional[TicketResponse] = None
+    error: Optional[str] = None
+    submitted_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
+    # Resolves to whether the transaction was confirmed
+    outcome: Optional["asyncio.Task[bool]"] = field(default=None, repr=False)
+
+    def to_response(self) -> TransactionStatusResponse:
+        """Build the API representation of this transaction."""
+        return TransactionStatusResponse(
+            transaction_hash=self.transaction_hash,
+            operation=self.operation,
+            ticket_id=self.ticket_id,
+            status=self.status,
+            result=self.result,
+            error=self.error,
+            submitted_at=self.submitted_at,
+            updated_at=self.updated_at,
+        )
+
+
+class TransactionTracker:
+    """Resolves submitted transactions in the background and remembers them."""
+
+    def __init__(self, max_entries: int = 10_000):
+        """
+        Initialize the tracker.
+
+        Args:
+            max_entries: Number of transactions to remember; the oldest
+                         finished ones are forgotten first
+        """
+        self.max_entries = max_entries
+        self._records: OrderedDict[str, TrackedTransaction] = OrderedDict()
+        self._tasks: set[asyncio.Task[bool]] = set()
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+    def track(
+        self,
+        pending: PendingTransaction,
+        operation: str,
+        ticket_id: str,
+        finalize: Callable[[dict[str, Any]], Awaitable[TicketResponse]],
+        callback_url: Optional[str] = None,
+    ) -> TrackedTransaction:
+        """
+        Start following a broadcast transaction.
+
+        Args:
+            pending: Handle returned by a ``submit_*`` service method
+            operation: Name of the API operation (e.g. ``"sold"``)
+            ticket_id: Off-chain ticket ID the transaction is for
+            finalize: Turns the mined result into the final ticket response
+                      and applies any off-chain side effects
+            callback_url: Optional webhook notified once resolved
+
+        Returns:
+            The tracking record, initially pending
+        """
+        record = TrackedTransaction(
+            transaction_hash=pending.transaction_hash,
+            operation=operation,
+            ticket_id=ticket_id,
+            callback_url=callback_url,
+        )
+        self._records[record.transaction_hash] = record
+        self._evict()
+
+        task = asyncio.create_task(self._resolve(record, pending, finalize))
+        record.outcome = task
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return record
+
+    def get(self, transaction_hash: str) -> Optional[TrackedTransaction]:
+        """Get a tracked transaction by its hash."""
+        return self._records.get(transaction_hash)
+
+    @property
+    def pending_count(self) -> int:
+        """Number of transactions still being resolved."""
+        return len(self._tasks)
+
+    async def close(self) -> None:
+        """Stop resolving outstanding transactions and close the webhook client."""
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    async def _resolve(
+        self,
+        record: TrackedTransaction,
+        pending: PendingTransaction,
+        finalize: Callable[[dict[str, Any]], Awaitable[TicketResponse]],
+    ) -> bool:
+        try:
+            record.result = await finalize(await pending.wait())
+            record.status = TransactionState.CONFIRMED
+        except Exception as e:
+            record.error = str(e)
+            record.status = TransactionState.FAILED
+        record.updated_at = datetime.now()
+
+        if record.callback_url:
+            await self._notify(record)
+        return record.status == TransactionState.CONFIRMED
+
+    async def _notify(self, record: TrackedTransaction) -> None:
+        """POST the final transaction state to its webhook (best effort)."""
+        assert record.callback_url is not None
+        parts = urlsplit(record.callback_url)
+        if not settings.webhook_allowed_hosts and not await _resolves_to_public_ips(
+            parts.hostname or "", parts.port or (443 if parts.scheme == "https" else 80)
+        ):
+            # A public name may still point at an internal address
+            print(
+                f"Warning: Webhook {record.callback_url} skipped "
+                "(host does not resolve to public addresses)"
+            )
+            return
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                timeout=settings.webhook_timeout_seconds
+            )
+        try:
+            await self._http_client.post(
+                record.callback_url,
+                json=record.to_response().model_dump(mode="json"),
+            )
+        except httpx.HTTPError as e:
+            print(f"Warning: Webhook {record.callback_url} failed ({e})")
+
+    def _evict(self) -> None:
+        """Forget the oldest finished transactions beyond ``max_entries``."""
+        excess = len(self._records) - self.max_entries
+        if excess <= 0:
+            return
+        finished = [
+            tx_hash
+            for tx_hash, record in self._records.items()
+            if record.status != TransactionState.PENDING
+        ]
+        for tx_hash in finished[:excess]:
+            del self._records[tx_hash]
+
+
+# Dependency injection for transaction tracker
+async def get_transaction_tracker(request: Request) -> TransactionTracker:
+    """
+    Dependency injection for the app-scoped transaction tracker.
+
+    Created on first use if the app lifespan has not run.
+    """
+    tracker: TransactionTracker | None = getattr(
+        request.app.state, "transaction_tracker", None
+    )
+    if tracker is None:
+        tracker = TransactionTracker(settings.transaction_tracker_max_entries)
+        request.app.state.transaction_tracker = tracker
+    return tracker
+
+
+@router.get("/{transaction_hash}", response_model=TransactionStatusResponse)
+async def get_transaction_status(
+    transaction_hash: str,
+    tracker: Annotated[TransactionTracker, Depends(get_transaction_tracker)],
+) -> TransactionStatusResponse:
+    """
+    Get the status of a write submitted in asynchronous mode.
+
+    Reports pending, confirmed (with the final ticket state) or failed
+    (with the error).
+    """
+    record = tracker.get(transaction_hash)
+    if record is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Transaction {transaction_hash} not found",
+        )
+    return record.to_response()
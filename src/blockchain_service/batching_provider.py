@@ -0,0 +1,232 @@
+"""
+JSON-RPC request batching for the async HTTP provider.
+
+A single API call can issue several independent node calls (status reads,
+nonce lookups, receipt polls of every in-flight transaction). The provider
+below queues each call instead of posting it right away, and sends everything
+queued during one event-loop iteration as one JSON-RPC batch request. Every
+call still gets its own response, so an error in one call is raised only to
+its caller.
+
+Calls are counted per API route, read from :data:`calling_route` when the
+call is made, so the round-trips batching saves show up per endpoint.
+"""
+
+import asyncio
+import itertools
+import time
+from collections import Counter, defaultdict
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from web3 import AsyncHTTPProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+# Route template of the API request making node calls; set by the API
+calling_route: ContextVar[str] = ContextVar("calling_route", default="background")
+
+
+@dataclass
+class RpcBatchStats:
+    """Counters for the calls made through a batching provider."""
+
+    calls: int = 0
+    http_requests: int = 0
+    batches: int = 0
+    largest_batch: int = 0
+    batches_rejected: int = 0
+    calls_by_method: Counter[str] = field(default_factory=Counter)
+    batched_by_method: Counter[str] = field(default_factory=Counter)
+    calls_by_route: Counter[str] = field(default_factory=Counter)
+    batched_by_route: Counter[str] = field(default_factory=Counter)
+    # A batch of n calls saves n - 1 round-trips, shared by its calls
+    saved_by_route: defaultdict[str, float] = field(
+        default_factory=lambda: defaultdict(float)
+    )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Counters as a JSON-serializable dict, for monitoring."""
+        return {
+            "calls": self.calls,
+            "http_requests": self.http_requests,
+            "round_trips_saved": self.calls - self.http_requests,
+            "batches": self.batches,
+            "largest_batch": self.largest_batch,
+            "batches_rejected": self.batches_rejected,
+            "methods": {
+                method: {
+                    "calls": count,
+                    "batched": self.batched_by_method[method],
+                }
+                for method, count in self.calls_by_method.items()
+            },
+            "routes": {
+                route: {
+                    "calls": count,
+                    "batched": self.batched_by_route[route],
+                    "round_trips_saved": round(self.saved_by_route[route], 1),
+                }
+                for route, count in self.calls_by_route.items()
+            },
+        }
+
+
+@dataclass
+class _QueuedCall:
+    method: RPCEndpoint
+    params: Any
+    route: str
+    future: "asyncio.Future[RPCResponse]"
+
+
+class BatchingHTTPProvider(AsyncHTTPProvider):
+    """``AsyncHTTPProvider`` that coalesces concurrent calls into batches."""
+
+    def __init__(
+        self,
+        endpoint_uri: str,
+        max_batch_size: int = 100,
+        stats: Optional[RpcBatchStats] = None,
+        batch_retry_seconds: float = 60.0,
+        **kwargs: Any,
+    ):
+        """
+        Initialize the provider.
+
+        Args:
+            endpoint_uri: JSON-RPC endpoint of the node
+            max_batch_size: Most calls sent in one batch request; a full
+                            queue is flushed without waiting for the loop
+            stats: Counters to update, so they can outlive the provider
+                   across reconnects
+            batch_retry_seconds: How long calls are sent one by one after
+                                 the node answers a batch with a single
+                                 error, before batches are tried again
+        """
+        super().__init__(endpoint_uri, **kwargs)
+        self.max_batch_size = max_batch_size
+        self.stats = stats or RpcBatchStats()
+        self.batch_retry_seconds = batch_retry_seconds
+        self._batching_paused_until = 0.0
+        self._queue: list[_QueuedCall] = []
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._sends: set[asyncio.Task[None]] = set()
+        self._batch_ids = itertools.count()
+
+    @property
+    def batching_supported(self) -> bool:
+        """Whether calls are batched, i.e. no batch was rejected recently."""
+        return time.monotonic() >= self._batching_paused_until
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """Queue a call for the next batch and wait for its own response."""
+        route = calling_route.get()
+        self.stats.calls += 1
+        self.stats.calls_by_method[method] += 1
+        self.stats.calls_by_route[route] += 1
+        if not self.batching_supported:
+            self.stats.http_requests += 1
+            return await super().make_request(method, params)
+
+        loop = asyncio.get_running_loop()
+        call = _QueuedCall(method, params, route, loop.create_future())
+        self._queue.append(call)
+        if len(self._queue) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            # Runs after every callback already scheduled for this iteration
+            self._flush_handle = loop.call_soon(self._flush)
+        return await call.future
+
+    def _flush(self) -> None:
+        """Send everything queued so far."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        calls, self._queue = self._queue, []
+        if not calls:
+            return
+        task = asyncio.create_task(self._send(calls))
+        self._sends.add(task)
+        task.add_done_callback(self._sends.discard)
+
+    async def _send(self, calls: list[_QueuedCall]) -> None:
+        try:
+            if len(calls) == 1:
+                self.stats.http_requests += 1
+                call = calls[0]
+                _resolve(call, await super().make_request(call.method, call.params))
+            else:
+                await self._send_batch(calls)
+        except Exception as e:
+            for call in calls:
+                if not call.future.done():
+                    call.future.set_exception(e)
+
+    async def _send_batch(self, calls: list[_QueuedCall]) -> None:
+        by_id: dict[int, _QueuedCall] = {}
+        requests = []
+        for call in calls:
+            request_id = next(self._batch_ids)
+            by_id[request_id] = call
+            requests.append(
+                {
+                    "id": request_id,
+                    "jsonrpc": "2.0",
+                    "method": call.method,
+                    "params": call.params or [],
+                }
+            )
+
+        self.stats.http_requests += 1
+        raw_response = await self._request_session_manager.async_make_post_request(
+            self.endpoint_uri,
+            b"[" + b",".join(self.encode_rpc_dict(r) for r in requests) + b"]",
+            **self.get_request_kwargs(),
+        )
+        responses = self.decode_rpc_response(raw_response)
+
+        if not isinstance(responses, list):
+            # No batch support, or a rate limit or other error for the whole
+            # request: send these one by one, and others for a while
+            self.stats.batches_rejected += 1
+            self._batching_paused_until = time.monotonic() + self.batch_retry_seconds
+            await asyncio.gather(*(self._send([call]) for call in calls))
+            return
+
+        self.stats.batches += 1
+        self.stats.largest_batch = max(self.stats.largest_batch, len(calls))
+        saved = (len(calls) - 1) / len(calls)
+        for call in calls:
+            self.stats.batched_by_method[call.method] += 1
+            self.stats.batched_by_route[call.route] += 1
+            self.stats.saved_by_route[call.route] += saved
+
+        for response in responses:
+            call = by_id.pop(response.get("id"), None)  # type: ignore[arg-type]
+            if call is not None:
+                _resolve(call, response)
+        for request_id, call in by_id.items():
+            if not call.future.done():
+                call.future.set_exception(
+                    ValueError(
+                        f"No response to {call.method} (id {request_id}) in batch"
+                    )
+                )
+
+    async def disconnect(self) -> None:
+        """Fail queued calls and close the HTTP sessions."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        calls, self._queue = self._queue, []
+        for call in calls:
+            if not call.future.done():
+                call.future.set_exception(ConnectionError("Provider disconnected"))
+        await super().disconnect()
+
+
+def _resolve(call: _QueuedCall, response: RPCResponse) -> None:
+    if not call.future.done():
+        call.future.set_result(response)
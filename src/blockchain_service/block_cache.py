@@ -0,0 +1,85 @@
+"""
+Bounded cache of block timestamps.
+
+Write results report the timestamp of the block their transaction was mined
+in. Pipelined transactions often land in the same block, so the timestamp is
+looked up once per block rather than once per receipt. Concurrent lookups of
+the same block share a single ``eth_getBlockByNumber`` call.
+"""
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+
+class BlockTimestampCache:
+    """LRU cache of block number to block timestamp."""
+
+    def __init__(
+        self,
+        fetch_timestamp: Callable[[int], Awaitable[int]],
+        max_entries: int = 1024,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            fetch_timestamp: Coroutine function returning the timestamp of a
+                             block, called on a miss
+            max_entries: Number of blocks to remember; the least recently
+                         used ones are forgotten first
+        """
+        self._fetch_timestamp = fetch_timestamp
+        self.max_entries = max_entries
+        self._timestamps: OrderedDict[int, int] = OrderedDict()
+        self._in_flight: dict[int, asyncio.Future[int]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def put(self, block_number: int, timestamp: int) -> None:
+        """Record a block seen elsewhere (e.g. by a block or receipt watcher)."""
+        self._timestamps[block_number] = timestamp
+        self._timestamps.move_to_end(block_number)
+        while len(self._timestamps) > self.max_entries:
+            self._timestamps.popitem(last=False)
+
+    async def get(self, block_number: int) -> int:
+        """
+        Get the timestamp of a block, fetching it from the node on a miss.
+
+        Args:
+            block_number: Number of a mined block
+
+        Returns:
+            Block timestamp in seconds since the epoch
+        """
+        timestamp = self._timestamps.get(block_number)
+        if timestamp is not None:
+            self._hits += 1
+            self._timestamps.move_to_end(block_number)
+            return timestamp
+
+        self._misses += 1
+        in_flight = self._in_flight.get(block_number)
+        if in_flight is not None:
+            return await asyncio.shield(in_flight)
+
+        future = asyncio.ensure_future(self._fetch_timestamp(block_number))
+        self._in_flight[block_number] = future
+        try:
+            timestamp = await asyncio.shield(future)
+        finally:
+            del self._in_flight[block_number]
+        self.put(block_number, timestamp)
+        return timestamp
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters and size, for monitoring."""
+        lookups = self._hits + self._misses
+        return {
+            "entries": len(self._timestamps),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_ratio": self._hits / lookups if lookups else None,
+        }
@@ -0,0 +1,141 @@
+"""
+Keep-alive connection pooling for the node's HTTP provider.
+
+Left to itself, ``AsyncHTTPProvider`` creates its aiohttp session with a
+``force_close`` connector, so every JSON-RPC call opens a new TCP connection
+and, against a hosted endpoint, does a new TLS handshake. A
+:class:`RpcConnectionPool` gives the provider a session whose connections
+are kept alive and reused, bounded by a pool size, with separate connect and
+read timeouts per call. The pool outlives providers: after a reconnect it is
+attached to the new provider with a fresh session and its counters carry on.
+
+aiohttp speaks HTTP/1.1 only. Keep-alive reuse removes the handshakes that
+HTTP/2 multiplexing would also save, and the pool size bounds concurrency.
+"""
+
+import types
+from typing import Any
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector, TraceConfig
+from web3 import AsyncHTTPProvider
+
+
+class RpcConnectionPool:
+    """Bounded keep-alive HTTP session shared by all node calls."""
+
+    def __init__(
+        self,
+        size: int = 32,
+        keepalive_seconds: float = 30.0,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            size: Most connections open to the node at once; further calls
+                  wait for a free connection
+            keepalive_seconds: How long an idle connection is kept for reuse
+            connect_timeout: Seconds to wait for a connection, including
+                             waiting for a free one in the pool
+            read_timeout: Seconds to wait for each read of a response
+        """
+        self.size = size
+        self.keepalive_seconds = keepalive_seconds
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self._sessions_created = 0
+        self._connections_created = 0
+        self._connections_reused = 0
+        self._queued = 0
+        self._in_flight = 0
+        self._peak_in_flight = 0
+
+    def request_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments for the provider's requests."""
+        return {
+            "timeout": ClientTimeout(
+                total=None,
+                connect=self.connect_timeout,
+                sock_read=self.read_timeout,
+            )
+        }
+
+    async def attach(self, provider: AsyncHTTPProvider) -> None:
+        """
+        Make a provider send its requests through a fresh pooled session.
+
+        Must be called from the event loop the provider is used on. The
+        provider owns the session from then on and closes it on
+        ``disconnect()``.
+        """
+        session = ClientSession(
+            # Same as the provider's own sessions
+            raise_for_status=True,
+            connector=TCPConnector(
+                limit=self.size,
+                limit_per_host=self.size,
+                keepalive_timeout=self.keepalive_seconds,
+                enable_cleanup_closed=True,
+            ),
+            trace_configs=[self._trace_config()],
+        )
+        if await provider.cache_async_session(session) is not session:
+            # The provider already had a session; keep that one
+            await session.close()
+            return
+        self._sessions_created += 1
+
+    def _trace_config(self) -> TraceConfig:
+        trace = TraceConfig()
+        trace.on_connection_create_end.append(self._on_connection_created)
+        trace.on_connection_reuseconn.append(self._on_connection_reused)
+        trace.on_connection_queued_start.append(self._on_queued)
+        trace.on_request_start.append(self._on_request_start)
+        trace.on_request_end.append(self._on_request_done)
+        trace.on_request_exception.append(self._on_request_done)
+        return trace
+
+    async def _on_connection_created(
+        self, session: ClientSession, context: types.SimpleNamespace, params: Any
+    ) -> None:
+        self._connections_created += 1
+
+    async def _on_connection_reused(
+        self, session: ClientSession, context: types.SimpleNamespace, params: Any
+    ) -> None:
+        self._connections_reused += 1
+
+    async def _on_queued(
+        self, session: ClientSession, context: types.SimpleNamespace, params: Any
+    ) -> None:
+        self._queued += 1
+
+    async def _on_request_start(
+        self, session: ClientSession, context: types.SimpleNamespace, params: Any
+    ) -> None:
+        self._in_flight += 1
+        self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+
+    async def _on_request_done(
+        self, session: ClientSession, context: types.SimpleNamespace, params: Any
+    ) -> None:
+        self._in_flight -= 1
+
+    def stats(self) -> dict[str, Any]:
+        """Pool size, utilization and connection reuse, for monitoring."""
+        connections = self._connections_created + self._connections_reused
+        return {
+            "size": self.size,
+            "in_flight": self._in_flight,
+            "peak_in_flight": self._peak_in_flight,
+            "utilization": self._in_flight / self.size,
+            "connections_created": self._connections_created,
+            "connections_reused": self._connections_reused,
+            "reuse_ratio": (
+                self._connections_reused / connections if connections else None
+            ),
+            "queued_for_connection": self._queued,
+            "sessions_created": self._sessions_created,
+        }
@@ -0,0 +1,195 @@
+"""
+Background gas fee oracle.
+
+Fees are refreshed off the request path, either on a fixed TTL or whenever a
+new block is seen, so building a transaction never waits on a fee RPC.
+EIP-1559 fees are derived from ``eth_feeHistory``; nodes without it fall back
+to the legacy ``eth_gasPrice``.
+"""
+
+import asyncio
+import contextlib
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass(frozen=True)
+class FeeQuote:
+    """Fee parameters for the next transaction."""
+
+    max_fee_per_gas: Optional[int] = None
+    max_priority_fee_per_gas: Optional[int] = None
+    base_fee_per_gas: Optional[int] = None
+    gas_price: Optional[int] = None
+    block_number: Optional[int] = None
+    fetched_at: float = 0.0
+
+    @property
+    def is_eip1559(self) -> bool:
+        """Whether this quote carries EIP-1559 fees rather than a gas price."""
+        return self.max_fee_per_gas is not None
+
+    def transaction_fields(self) -> dict[str, int]:
+        """Fee fields to merge into a transaction dict."""
+        if self.is_eip1559:
+            assert self.max_priority_fee_per_gas is not None
+            assert self.max_fee_per_gas is not None
+            return {
+                "maxFeePerGas": self.max_fee_per_gas,
+                "maxPriorityFeePerGas": self.max_priority_fee_per_gas,
+            }
+        assert self.gas_price is not None
+        return {"gasPrice": self.gas_price}
+
+
+class GasOracle:
+    """Keeps a fresh fee quote for the hot path to read without RPC calls."""
+
+    def __init__(
+        self,
+        fee_history: Callable[[int, str, list[float]], Awaitable[Any]],
+        gas_price: Callable[[], Awaitable[int]],
+        block_number: Callable[[], Awaitable[int]],
+        ttl_seconds: float = 5.0,
+        refresh_on_block: bool = False,
+        history_blocks: int = 10,
+        priority_percentile: float = 50.0,
+        base_fee_multiplier: float = 2.0,
+        min_priority_fee: int = 0,
+    ):
+        """
+        Initialize the gas oracle.
+
+        Args:
+            fee_history: ``eth_feeHistory(block_count, newest_block, percentiles)``
+            gas_price: ``eth_gasPrice``, used when fee history is unavailable
+            block_number: ``eth_blockNumber``, used in refresh-on-block mode
+            ttl_seconds: Refresh interval, or the block polling interval in
+                         refresh-on-block mode
+            refresh_on_block: Refresh only when a new block is seen
+            history_blocks: Number of recent blocks to sample
+            priority_percentile: Reward percentile used for the priority fee
+            base_fee_multiplier: Headroom on the base fee for ``maxFeePerGas``
+                                 so a quote survives a few full blocks
+            min_priority_fee: Floor for the priority fee (e.g. Polygon's
+                              minimum tip)
+        """
+        self._fee_history = fee_history
+        self._gas_price = gas_price
+        self._block_number = block_number
+        self.ttl_seconds = ttl_seconds
+        self.refresh_on_block = refresh_on_block
+        self.history_blocks = history_blocks
+        self.priority_percentile = priority_percentile
+        self.base_fee_multiplier = base_fee_multiplier
+        self.min_priority_fee = min_priority_fee
+
+        self._quote: Optional[FeeQuote] = None
+        self._refresh_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task[None]] = None
+        self._refresh_count = 0
+        self._error_count = 0
+        self._last_error: Optional[str] = None
+
+    async def start(self) -> None:
+        """Fetch an initial quote and start refreshing in the background."""
+        if self._task is not None:
+            return
+        await self.refresh()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background refresh."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def current(self) -> FeeQuote:
+        """
+        Get the latest quote.
+
+        Served from memory; the node is only queried if no quote has been
+        fetched yet.
+        """
+        if self._quote is None:
+            await self.refresh()
+        assert self._quote is not None
+        return self._quote
+
+    async def refresh(self, block_number: Optional[int] = None) -> FeeQuote:
+        """Fetch a new quote from the node."""
+        async with self._refresh_lock:
+            try:
+                history = await self._fee_history(
+                    self.history_blocks, "latest", [self.priority_percentile]
+                )
+                quote = self._quote_from_history(history, block_number)
+            except Exception:
+                # Node without EIP-1559 support: fall back to legacy pricing
+                quote = FeeQuote(
+                    gas_price=int(await self._gas_price()),
+                    block_number=block_number,
+                    fetched_at=time.monotonic(),
+                )
+            self._quote = quote
+            self._refresh_count += 1
+            return quote
+
+    def _quote_from_history(
+        self, history: Any, block_number: Optional[int]
+    ) -> FeeQuote:
+        # The last entry is the base fee of the upcoming block
+        base_fee = int(history["baseFeePerGas"][-1])
+        if base_fee == 0:
+            raise ValueError("Fee history has no base fee")
+
+        rewards = [int(block[0]) for block in history.get("reward") or [] if block]
+        priority_fee = max(
+            int(statistics.median(rewards)) if rewards else 0,
+            self.min_priority_fee,
+        )
+        return FeeQuote(
+            max_fee_per_gas=int(base_fee * self.base_fee_multiplier) + priority_fee,
+            max_priority_fee_per_gas=priority_fee,
+            base_fee_per_gas=base_fee,
+            block_number=block_number,
+            fetched_at=time.monotonic(),
+        )
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.ttl_seconds)
+            try:
+                if self.refresh_on_block:
+                    block_number = int(await self._block_number())
+                    if self._quote is None or block_number != self._quote.block_number:
+                        await self.refresh(block_number)
+                else:
+                    await self.refresh()
+            except Exception as e:
+                # Keep serving the last quote; try again on the next tick
+                self._error_count += 1
+                self._last_error = str(e)
+
+    def stats(self) -> dict[str, Any]:
+        """Current quote and its age, for monitoring."""
+        quote = self._quote
+        return {
+            "mode": "eip1559" if quote and quote.is_eip1559 else "legacy",
+            "max_fee_per_gas": quote.max_fee_per_gas if quote else None,
+            "max_priority_fee_per_gas": (
+                quote.max_priority_fee_per_gas if quote else None
+            ),
+            "base_fee_per_gas": quote.base_fee_per_gas if quote else None,
+            "gas_price": quote.gas_price if quote else None,
+            "age_seconds": time.monotonic() - quote.fetched_at if quote else None,
+            "refreshes": self._refresh_count,
+            "refresh_errors": self._error_count,
+            "last_error": self._last_error,
+        }
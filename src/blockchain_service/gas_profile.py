@@ -0,0 +1,116 @@
+"""
+Learned gas limits per contract function.
+
+The single-ticket Ticket functions use nearly constant gas (``checkIn``,
+``invalidate``) or gas that grows with calldata (``mintTicket`` with the token
+URI). Once such a function has been observed, its gas limit is served from
+this profile instead of running ``estimate_gas`` (an extra RPC round-trip and
+EVM simulation) per transaction.
+
+``mintTicket`` and ``ownerTransfer`` also depend on the recipient: raising a
+first-time holder's balance from zero writes a fresh storage slot, about 17k
+gas more than for an existing holder. A profile learned from existing holders
+would run such a transaction out of gas, so served limits carry a fixed
+headroom on top of the safety margin.
+
+The batch functions are always estimated live: ``batchCheckIn`` and
+``batchInvalidate`` skip tickets that are not valid, so a limit learned from
+a mostly skipped batch is too low for a fresh batch of the same size.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Optional
+
+# Functions whose gas depends only on their calldata, served from the profile
+PROFILED_FUNCTIONS = frozenset({"mintTicket", "checkIn", "invalidate", "ownerTransfer"})
+
+
+@dataclass
+class _Observation:
+    max_gas: int
+    max_calldata_size: int
+
+
+class GasLimitProfile:
+    """Gas limits learned per function selector and calldata size bucket."""
+
+    def __init__(
+        self, safety_margin: float = 1.2, bucket_bytes: int = 256, headroom: int = 0
+    ):
+        """
+        Initialize the profile.
+
+        Args:
+            safety_margin: Multiplier applied to the largest gas seen
+            headroom: Gas added after the multiplier, covering state-dependent
+                      costs the observations may not include
+            bucket_bytes: Calldata size bucket width; calls are only served
+                          from the profile if their calldata is no larger
+                          than what was observed in the same bucket
+        """
+        self.safety_margin = safety_margin
+        self.bucket_bytes = bucket_bytes
+        self.headroom = headroom
+        self._observations: dict[tuple[str, int], _Observation] = {}
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def _key(self, selector: str, calldata_size: int) -> tuple[str, int]:
+        return selector, calldata_size // self.bucket_bytes
+
+    def get(self, selector: str, calldata_size: int) -> Optional[int]:
+        """
+        Get a gas limit for a call, or None if it must be estimated live.
+
+        Args:
+            selector: 4-byte function selector (hex)
+            calldata_size: Size of the encoded calldata in bytes
+        """
+        observation = self._observations.get(self._key(selector, calldata_size))
+        if observation is None or calldata_size > observation.max_calldata_size:
+            self._misses += 1
+            return None
+        self._hits += 1
+        return int(observation.max_gas * self.safety_margin) + self.headroom
+
+    def record(self, selector: str, calldata_size: int, gas: int) -> None:
+        """
+        Learn from an estimate or from the gas used by a mined transaction.
+
+        Args:
+            selector: 4-byte function selector (hex)
+            calldata_size: Size of the encoded calldata in bytes
+            gas: Gas estimated or used
+        """
+        key = self._key(selector, calldata_size)
+        observation = self._observations.get(key)
+        if observation is None:
+            self._observations[key] = _Observation(gas, calldata_size)
+            return
+        observation.max_gas = max(observation.max_gas, gas)
+        observation.max_calldata_size = max(
+            observation.max_calldata_size, calldata_size
+        )
+
+    def invalidate(self, selector: str, calldata_size: int) -> None:
+        """Forget a bucket, e.g. after a revert or out-of-gas error."""
+        if self._observations.pop(self._key(selector, calldata_size), None):
+            self._invalidations += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters and size, for monitoring."""
+        lookups = self._hits + self._misses
+        return {
+            "entries": len(self._observations),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_ratio": self._hits / lookups if lookups else None,
+            "invalidations": self._invalidations,
+        }
+
+
+def is_out_of_gas_error(error: Exception) -> bool:
+    """Whether a node error means the gas limit was too low."""
+    message = str(error).lower()
+    return "out of gas" in message or "intrinsic gas too low" in message
@@ -3,13 +3,179 @@ Abstract blockchain service interface for interacting with the Ticket smart cont
 """
 
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Awaitable
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+class ServiceBusyError(Exception):
+    """The service is saturated and did not accept the transaction."""
+
+    def __init__(self, message: str, retry_after: float):
+        """
+        Initialize the error.
+
+        Args:
+            message: Description of the rejection
+            retry_after: Suggested delay in seconds before retrying
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+@dataclass
+class PendingTransaction:
+    """A broadcast transaction whose outcome is still being resolved."""
+
+    transaction_hash: str
+    outcome: Awaitable[dict[str, Any]]
+
+    async def wait(self) -> dict[str, Any]:
+        """Wait for the transaction to be mined and return its result."""
+        return await self.outcome
+
+
+@dataclass(frozen=True)
+class TicketEvent:
+    """A Ticket contract log, as followed by the event indexer."""
+
+    name: str  # TicketMinted, Transfer, TicketCheckedIn or TicketInvalidated
+    token_id: int
+    block_number: int
+    block_hash: str
+    transaction_hash: str
+    log_index: int
+    # New owner for TicketMinted and Transfer
+    to_address: Optional[str] = None
 
 
 class BlockchainServiceInterface(ABC):
-    """Abstract interface for blockchain interactions."""
+    """
+    Abstract interface for blockchain interactions.
+
+    Write operations come in two forms: ``submit_*`` methods return as soon
+    as the transaction is broadcast, with a :class:`PendingTransaction`
+    handle, while the plain methods wait for the result.
+    """
+
+    @abstractmethod
+    async def submit_mint_ticket(
+        self,
+        to_address: str,
+        token_uri: str,
+    ) -> PendingTransaction:
+        """
+        Broadcast a mint transaction without waiting for it to be mined.
+
+        Args:
+            to_address: Ethereum address to mint the ticket to
+            token_uri: URI containing ticket metadata
+
+        Returns:
+            Handle resolving to the same dict as :meth:`mint_ticket`
+        """
+        pass
+
+    @abstractmethod
+    async def submit_batch_mint_tickets(
+        self,
+        to_addresses: list[str],
+        token_uris: list[str],
+    ) -> PendingTransaction:
+        """
+        Broadcast one transaction minting several tickets.
+
+        Args:
+            to_addresses: Ethereum addresses to mint the tickets to
+            token_uris: Metadata URIs, one per address
+
+        Returns:
+            Handle resolving to the same dict as :meth:`batch_mint_tickets`
+        """
+        pass
+
+    @abstractmethod
+    async def submit_check_in_ticket(self, token_id: int) -> PendingTransaction:
+        """
+        Broadcast a check-in transaction without waiting for it to be mined.
+
+        Args:
+            token_id: The NFT token ID to check in
+
+        Returns:
+            Handle resolving to the same dict as :meth:`check_in_ticket`
+        """
+        pass
+
+    @abstractmethod
+    async def submit_invalidate_ticket(self, token_id: int) -> PendingTransaction:
+        """
+        Broadcast an invalidation transaction without waiting for it to be mined.
+
+        Args:
+            token_id: The NFT token ID to invalidate
+
+        Returns:
+            Handle resolving to the same dict as :meth:`invalidate_ticket`
+        """
+        pass
+
+    @abstractmethod
+    async def submit_batch_check_in_tickets(
+        self, token_ids: list[int]
+    ) -> PendingTransaction:
+        """
+        Broadcast one transaction checking in several tickets.
+
+        Tickets that do not exist or are not valid are skipped on-chain
+        instead of reverting the whole batch.
+
+        Args:
+            token_ids: The NFT token IDs to check in
+
+        Returns:
+            Handle resolving to the same dict as :meth:`batch_check_in_tickets`
+        """
+        pass
 
     @abstractmethod
+    async def submit_batch_invalidate_tickets(
+        self, token_ids: list[int]
+    ) -> PendingTransaction:
+        """
+        Broadcast one transaction invalidating several tickets.
+
+        Tickets that do not exist or are not valid are skipped on-chain
+        instead of reverting the whole batch.
+
+        Args:
+            token_ids: The NFT token IDs to invalidate
+
+        Returns:
+            Handle resolving to the same dict as :meth:`batch_invalidate_tickets`
+        """
+        pass
+
+    @abstractmethod
+    async def submit_transfer_ticket(
+        self,
+        token_id: int,
+        from_address: str,
+        to_address: str,
+    ) -> PendingTransaction:
+        """
+        Broadcast a transfer transaction without waiting for it to be mined.
+
+        Args:
+            token_id: The NFT token ID to transfer
+            from_address: Current owner address
+            to_address: New owner address
+
+        Returns:
+            Handle resolving to the same dict as :meth:`transfer_ticket`
+        """
+        pass
+
     async def mint_ticket(
         self,
         to_address: str,
@@ -25,9 +191,28 @@ class BlockchainServiceInterface(ABC):
         Returns:
             Dict containing token_id, transaction_hash, and other details
         """
-        pass
+        pending = await self.submit_mint_ticket(to_address, token_uri)
+        return await pending.wait()
+
+    async def batch_mint_tickets(
+        self,
+        to_addresses: list[str],
+        token_uris: list[str],
+    ) -> dict[str, Any]:
+        """
+        Mint several ticket NFTs in one transaction.
+
+        Args:
+            to_addresses: Ethereum addresses to mint the tickets to
+            token_uris: Metadata URIs, one per address
+
+        Returns:
+            Dict containing token_ids (in input order), transaction_hash,
+            and other details
+        """
+        pending = await self.submit_batch_mint_tickets(to_addresses, token_uris)
+        return await pending.wait()
 
-    @abstractmethod
     async def check_in_ticket(self, token_id: int) -> dict[str, Any]:
         """
         Check in a ticket by updating its on-chain state.
@@ -38,9 +223,9 @@ class BlockchainServiceInterface(ABC):
         Returns:
             Dict containing transaction_hash and updated state
         """
-        pass
+        pending = await self.submit_check_in_ticket(token_id)
+        return await pending.wait()
 
-    @abstractmethod
     async def invalidate_ticket(self, token_id: int) -> dict[str, Any]:
         """
         Invalidate a ticket by updating its on-chain state.
@@ -51,9 +236,37 @@ class BlockchainServiceInterface(ABC):
         Returns:
             Dict containing transaction_hash and updated state
         """
-        pass
+        pending = await self.submit_invalidate_ticket(token_id)
+        return await pending.wait()
+
+    async def batch_check_in_tickets(self, token_ids: list[int]) -> dict[str, Any]:
+        """
+        Check in several tickets in one transaction.
+
+        Args:
+            token_ids: The NFT token IDs to check in
+
+        Returns:
+            Dict containing succeeded and failed token IDs, transaction_hash,
+            and other details
+        """
+        pending = await self.submit_batch_check_in_tickets(token_ids)
+        return await pending.wait()
+
+    async def batch_invalidate_tickets(self, token_ids: list[int]) -> dict[str, Any]:
+        """
+        Invalidate several tickets in one transaction.
+
+        Args:
+            token_ids: The NFT token IDs to invalidate
+
+        Returns:
+            Dict containing succeeded and failed token IDs, transaction_hash,
+            and other details
+        """
+        pending = await self.submit_batch_invalidate_tickets(token_ids)
+        return await pending.wait()
 
-    @abstractmethod
     async def transfer_ticket(
         self,
         token_id: int,
@@ -71,7 +284,8 @@ class BlockchainServiceInterface(ABC):
         Returns:
             Dict containing transaction_hash and transfer details
         """
-        pass
+        pending = await self.submit_transfer_ticket(token_id, from_address, to_address)
+        return await pending.wait()
 
     @abstractmethod
     async def get_ticket_status(self, token_id: int) -> str:
@@ -98,3 +312,72 @@ class BlockchainServiceInterface(ABC):
             Ethereum address of the current owner
         """
         pass
+
+    @abstractmethod
+    async def get_token_uri(self, token_id: int) -> Optional[str]:
+        """
+        Get the metadata URI stored for a ticket at mint time.
+
+        Args:
+            token_id: The NFT token ID
+
+        Returns:
+            The token URI, or None if the ticket does not exist
+        """
+        pass
+
+    @abstractmethod
+    async def get_block_number(self) -> int:
+        """
+        Get the number of the latest block.
+
+        Returns:
+            Latest block number
+        """
+        pass
+
+    @abstractmethod
+    async def get_block_hash(self, block_number: int) -> Optional[str]:
+        """
+        Get the hash of a block, used to detect reorganizations.
+
+        Args:
+            block_number: Block number
+
+        Returns:
+            Block hash, or None if the block does not exist (anymore)
+        """
+        pass
+
+    @abstractmethod
+    async def get_ticket_events(
+        self, from_block: int, to_block: int
+    ) -> list[TicketEvent]:
+        """
+        Get the Ticket contract's events in a block range.
+
+        Args:
+            from_block: First block, inclusive
+            to_block: Last block, inclusive
+
+        Returns:
+            Events in chain order (block, then log index)
+        """
+        pass
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Internal state worth monitoring (caches, queues, fee quotes).
+
+        The default implementation has nothing to report.
+        """
+        return {}
+
+    async def close(self) -> None:
+        """
+        Release any resources held by the service (connections, sessions).
+
+        Called once on application shutdown. The default implementation
+        holds nothing and does nothing.
+        """
+        return None
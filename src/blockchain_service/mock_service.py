@@ -2,10 +2,20 @@
 Mock implementation of the blockchain service for development and testing.
 """
 
+import asyncio
 from datetime import datetime
-from typing import Any
+from typing import Any, Optional
 
-from .interface import BlockchainServiceInterface
+from .interface import BlockchainServiceInterface, PendingTransaction, TicketEvent
+
+
+def _mined(result: dict[str, Any]) -> PendingTransaction:
+    """Wrap a result in a handle that is already resolved."""
+    outcome: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+    outcome.set_result(result)
+    return PendingTransaction(
+        transaction_hash=str(result["transaction_hash"]), outcome=outcome
+    )
 
 
 class MockBlockchainService(BlockchainServiceInterface):
@@ -15,13 +25,50 @@ class MockBlockchainService(BlockchainServiceInterface):
         # Track ticket states in memory for the mock
         self._next_token_id = 1
         self._tickets: dict[int, dict[str, Any]] = {}
+        self._transaction_count = 0
+        # Every write mines its own block; block 0 is an empty genesis block
+        self._blocks: list[list[TicketEvent]] = [[]]
+
+    def _block_hash(self, block_number: int) -> str:
+        return f"0x{block_number:060x}b10c"
+
+    def _mine(self, transaction_hash: str, logs: list[tuple[str, int, Any]]) -> int:
+        """Mine a block holding one transaction's (event, token_id, to) logs."""
+        block_number = len(self._blocks)
+        self._blocks.append(
+            [
+                TicketEvent(
+                    name=name,
+                    token_id=token_id,
+                    block_number=block_number,
+                    block_hash=self._block_hash(block_number),
+                    transaction_hash=transaction_hash,
+                    log_index=log_index,
+                    to_address=to_address,
+                )
+                for log_index, (name, token_id, to_address) in enumerate(logs)
+            ]
+        )
+        return block_number
 
-    async def mint_ticket(
+    def _mint_logs(self, token_id: int, to_address: str) -> list[tuple[str, int, Any]]:
+        # Same order as the contract: ERC721 Transfer first, then TicketMinted
+        return [
+            ("Transfer", token_id, to_address),
+            ("TicketMinted", token_id, to_address),
+        ]
+
+    def _next_transaction_hash(self) -> str:
+        """Fake but unique transaction hash, usable as a tracking handle."""
+        self._transaction_count += 1
+        return f"0x{self._transaction_count:064x}"
+
+    async def submit_mint_ticket(
         self,
         to_address: str,
         token_uri: str,
-    ) -> dict[str, Any]:
-        """Mock ticket minting."""
+    ) -> PendingTransaction:
+        """Mock ticket minting; the handle is already resolved."""
         token_id = self._next_token_id
         self._next_token_id += 1
 
@@ -30,59 +77,145 @@ class MockBlockchainService(BlockchainServiceInterface):
             "status": "Valid",
             "token_uri": token_uri,
         }
+        transaction_hash = self._next_transaction_hash()
 
-        return {
-            "token_id": token_id,
-            "transaction_hash": f"0x{'1234abcd' * 8}",
-            "block_number": 12345,
-            "gas_used": 150000,
-            "timestamp": datetime.now().isoformat(),
-        }
+        return _mined(
+            {
+                "token_id": token_id,
+                "transaction_hash": transaction_hash,
+                "block_number": self._mine(
+                    transaction_hash, self._mint_logs(token_id, to_address)
+                ),
+                "gas_used": 150000,
+                "timestamp": datetime.now().isoformat(),
+            }
+        )
+
+    async def submit_batch_mint_tickets(
+        self,
+        to_addresses: list[str],
+        token_uris: list[str],
+    ) -> PendingTransaction:
+        """Mock batch minting."""
+        token_ids = []
+        logs = []
+        for to_address, token_uri in zip(to_addresses, token_uris, strict=True):
+            token_id = self._next_token_id
+            self._next_token_id += 1
+            self._tickets[token_id] = {
+                "owner": to_address,
+                "status": "Valid",
+                "token_uri": token_uri,
+            }
+            token_ids.append(token_id)
+            logs.extend(self._mint_logs(token_id, to_address))
+        transaction_hash = self._next_transaction_hash()
 
-    async def check_in_ticket(self, token_id: int) -> dict[str, Any]:
+        return _mined(
+            {
+                "token_ids": token_ids,
+                "transaction_hash": transaction_hash,
+                "block_number": self._mine(transaction_hash, logs),
+                "gas_used": 150000 * len(token_ids),
+                "timestamp": datetime.now().isoformat(),
+            }
+        )
+
+    async def submit_check_in_ticket(self, token_id: int) -> PendingTransaction:
         """Mock ticket check-in."""
+        logs = []
         if token_id in self._tickets:
             self._tickets[token_id]["status"] = "CheckedIn"
+            logs.append(("TicketCheckedIn", token_id, None))
+        transaction_hash = self._next_transaction_hash()
 
-        return {
-            "transaction_hash": f"0x{'5678efgh' * 8}",
-            "block_number": 12346,
-            "gas_used": 50000,
-            "timestamp": datetime.now().isoformat(),
-            "new_status": "CheckedIn",
-        }
+        return _mined(
+            {
+                "transaction_hash": transaction_hash,
+                "block_number": self._mine(transaction_hash, logs),
+                "gas_used": 50000,
+                "timestamp": datetime.now().isoformat(),
+                "new_status": "CheckedIn",
+            }
+        )
 
-    async def invalidate_ticket(self, token_id: int) -> dict[str, Any]:
+    async def submit_invalidate_ticket(self, token_id: int) -> PendingTransaction:
         """Mock ticket invalidation."""
+        logs = []
         if token_id in self._tickets:
             self._tickets[token_id]["status"] = "Invalidated"
+            logs.append(("TicketInvalidated", token_id, None))
+        transaction_hash = self._next_transaction_hash()
+
+        return _mined(
+            {
+                "transaction_hash": transaction_hash,
+                "block_number": self._mine(transaction_hash, logs),
+                "gas_used": 50000,
+                "timestamp": datetime.now().isoformat(),
+                "new_status": "Invalidated",
+            }
+        )
+
+    async def submit_batch_check_in_tickets(
+        self, token_ids: list[int]
+    ) -> PendingTransaction:
+        """Mock batch check-in; non-valid tickets are skipped."""
+        return _mined(self._batch_set_status(token_ids, "CheckedIn"))
+
+    async def submit_batch_invalidate_tickets(
+        self, token_ids: list[int]
+    ) -> PendingTransaction:
+        """Mock batch invalidation; non-valid tickets are skipped."""
+        return _mined(self._batch_set_status(token_ids, "Invalidated"))
+
+    def _batch_set_status(self, token_ids: list[int], status: str) -> dict[str, Any]:
+        succeeded, failed = [], []
+        for token_id in token_ids:
+            ticket = self._tickets.get(token_id)
+            if ticket is None or ticket["status"] != "Valid":
+                failed.append(token_id)
+                continue
+            ticket["status"] = status
+            succeeded.append(token_id)
+        event_name = "TicketCheckedIn" if status == "CheckedIn" else "TicketInvalidated"
+        transaction_hash = self._next_transaction_hash()
 
         return {
-            "transaction_hash": f"0x{'9abcijkl' * 8}",
-            "block_number": 12347,
-            "gas_used": 50000,
+            "succeeded": succeeded,
+            "failed": failed,
+            "transaction_hash": transaction_hash,
+            "block_number": self._mine(
+                transaction_hash, [(event_name, t, None) for t in succeeded]
+            ),
+            "gas_used": 30000 * len(token_ids),
             "timestamp": datetime.now().isoformat(),
-            "new_status": "Invalidated",
+            "new_status": status,
         }
 
-    async def transfer_ticket(
+    async def submit_transfer_ticket(
         self,
         token_id: int,
         from_address: str,
         to_address: str,
-    ) -> dict[str, Any]:
+    ) -> PendingTransaction:
         """Mock ticket transfer."""
+        logs = []
         if token_id in self._tickets:
             self._tickets[token_id]["owner"] = to_address
+            logs.append(("Transfer", token_id, to_address))
+        transaction_hash = self._next_transaction_hash()
 
-        return {
-            "transaction_hash": f"0x{'defmnopq' * 8}",
-            "block_number": 12348,
-            "gas_used": 60000,
-            "timestamp": datetime.now().isoformat(),
-            "from": from_address,
-            "to": to_address,
-        }
+        return _mined(
+            {
+                "transaction_hash": transaction_hash,
+                "block_number": self._mine(transaction_hash, logs),
+                "gas_used": 60000,
+                "timestamp": datetime.now().isoformat(),
+                "from": from_address,
+                "to": to_address,
+            }
+        )
 
     async def get_ticket_status(self, token_id: int) -> str:
         """Mock get ticket status."""
@@ -95,3 +228,29 @@ class MockBlockchainService(BlockchainServiceInterface):
         if token_id in self._tickets:
             return str(self._tickets[token_id]["owner"])
         return "0x0000000000000000000000000000000000000000"
+
+    async def get_token_uri(self, token_id: int) -> Optional[str]:
+        """Mock get token URI."""
+        if token_id in self._tickets:
+            return str(self._tickets[token_id]["token_uri"])
+        return None
+
+    async def get_block_number(self) -> int:
+        """Mock latest block number."""
+        return len(self._blocks) - 1
+
+    async def get_block_hash(self, block_number: int) -> Optional[str]:
+        """Mock block hash."""
+        if 0 <= block_number < len(self._blocks):
+            return self._block_hash(block_number)
+        return None
+
+    async def get_ticket_events(
+        self, from_block: int, to_block: int
+    ) -> list[TicketEvent]:
+        """Mock contract events in a block range."""
+        return [
+            event
+            for block in self._blocks[max(from_block, 0) : to_block + 1]
+            for event in block
+        ]
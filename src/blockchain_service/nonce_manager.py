@@ -0,0 +1,105 @@
+"""
+Local nonce allocation for the service's signing account.
+
+Fetching ``get_transaction_count`` for every transaction hands the same nonce
+to concurrent writers. The manager below syncs once from the node's
+``pending`` count and then allocates nonces locally, so many signed
+transactions can be in flight at the same time.
+"""
+
+import asyncio
+import heapq
+from collections.abc import Awaitable, Callable
+from typing import Any, Optional
+
+
+class NonceManager:
+    """Concurrency-safe nonce allocator for a single account."""
+
+    def __init__(self, fetch_pending_count: Callable[[], Awaitable[int]]):
+        """
+        Initialize the nonce manager.
+
+        Args:
+            fetch_pending_count: Coroutine function returning the account's
+                                 transaction count in the ``pending`` block
+        """
+        self._fetch_pending_count = fetch_pending_count
+        self._lock = asyncio.Lock()
+        self._next_nonce: Optional[int] = None
+        # Nonces that were allocated but never reached the node
+        self._gaps: list[int] = []
+        # Nonces allocated and not yet broadcast or released
+        self._reserved: set[int] = set()
+
+    async def sync(self) -> None:
+        """Re-read the pending transaction count from the node."""
+        async with self._lock:
+            await self._sync_locked()
+
+    async def _sync_locked(self) -> None:
+        pending_count = await self._fetch_pending_count()
+        # Nonces reserved by in-flight callers are still owned by them
+        next_nonce = max([pending_count, *(n + 1 for n in self._reserved)])
+        # Released nonces below the pending count were filled by the node
+        self._gaps = [n for n in self._gaps if pending_count <= n < next_nonce]
+        heapq.heapify(self._gaps)
+        self._next_nonce = next_nonce
+
+    async def allocate(self) -> int:
+        """
+        Reserve the next nonce.
+
+        Released nonces are handed out first so that a failed transaction
+        does not leave a gap that stalls every later one in the node's queue.
+        """
+        async with self._lock:
+            if self._next_nonce is None:
+                await self._sync_locked()
+            assert self._next_nonce is not None
+
+            if self._gaps:
+                nonce = heapq.heappop(self._gaps)
+            else:
+                nonce = self._next_nonce
+                self._next_nonce += 1
+            self._reserved.add(nonce)
+            return nonce
+
+    def confirm(self, nonce: int) -> None:
+        """Mark a nonce as accepted by the node."""
+        self._reserved.discard(nonce)
+
+    def release(self, nonce: int) -> None:
+        """Return a nonce whose transaction was never accepted by the node."""
+        if nonce in self._reserved:
+            self._reserved.discard(nonce)
+            heapq.heappush(self._gaps, nonce)
+
+    def invalidate(self, nonce: Optional[int] = None) -> None:
+        """
+        Force a resync from the node on the next allocation.
+
+        Used after nonce errors ("nonce too low", connection lost mid-send)
+        where the local view can no longer be trusted.
+
+        Args:
+            nonce: The nonce held by the failing caller, if any
+        """
+        if nonce is not None:
+            self._reserved.discard(nonce)
+        self._next_nonce = None
+
+    def stats(self) -> dict[str, Any]:
+        """Current allocator state, for monitoring."""
+        return {
+            "next_nonce": self._next_nonce,
+            "in_flight": len(self._reserved),
+            "gaps": len(self._gaps),
+        }
+
+
+def is_nonce_error(error: Exception) -> bool:
+    """Whether a broadcast error means our local nonce view is stale."""
+    message = str(error).lower()
+    return "nonce" in message or "replacement transaction underpriced" in message
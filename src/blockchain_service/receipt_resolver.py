@@ -0,0 +1,269 @@
+"""
+Shared resolution of transaction receipts from new blocks.
+
+``wait_for_transaction_receipt`` polls the node once per pending transaction
+every 100 ms, so 500 transactions in flight make 500 polling loops. The
+:class:`ReceiptResolver` instead follows the chain head on its own: for each
+new block it checks the block's transaction hashes against everything being
+waited on and fetches receipts only for the matches, either with
+``eth_getBlockReceipts`` or one receipt call per match, which the batching
+provider sends as one request. Node calls then grow with the number of
+blocks, not of pending transactions.
+
+A transaction is watched before it is broadcast, so it cannot be mined in a
+block the resolver has already passed. After a gap (the first poll, a node
+outage, more than ``max_catchup_blocks`` new blocks) or a reorg, the
+affected transactions are looked up directly once instead.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, Optional
+
+from web3.exceptions import TimeExhausted
+
+
+def _is_unsupported(error: Exception) -> bool:
+    message = str(error).lower()
+    return any(
+        hint in message
+        for hint in ("-32601", "method not found", "does not exist", "not supported")
+    )
+
+
+class ReceiptResolver:
+    """Resolves waiting transactions from the receipts of new blocks."""
+
+    def __init__(
+        self,
+        get_block: Callable[[Any], Awaitable[Any]],
+        get_receipt: Callable[[Hashable], Awaitable[Optional[Any]]],
+        get_block_receipts: Optional[Callable[[int], Awaitable[list[Any]]]] = None,
+        on_block: Optional[Callable[[int, int], None]] = None,
+        confirmations: int = 1,
+        poll_interval: float = 0.5,
+        max_catchup_blocks: int = 32,
+    ):
+        """
+        Initialize the resolver.
+
+        Args:
+            get_block: Coroutine function returning a block (``"latest"`` or a
+                       number) with ``number``, ``hash``, ``timestamp`` and
+                       its transaction hashes
+            get_receipt: Coroutine function returning a transaction's receipt,
+                         or None if it is not mined
+            get_block_receipts: Coroutine function returning every receipt of
+                                a block (``eth_getBlockReceipts``); None
+                                fetches matching receipts one by one
+            on_block: Called with the number and timestamp of each block seen
+            confirmations: Blocks a transaction's block must be buried under,
+                           itself included, before its receipt is returned
+            poll_interval: Seconds between head polls while waiting
+            max_catchup_blocks: New blocks scanned one by one after a pause;
+                                beyond that, waiting transactions are looked
+                                up directly
+        """
+        self._get_block = get_block
+        self._get_receipt = get_receipt
+        self._get_block_receipts = get_block_receipts
+        self._on_block = on_block
+        self.confirmations = confirmations
+        self.poll_interval = poll_interval
+        self.max_catchup_blocks = max_catchup_blocks
+        self._waiting: dict[Hashable, asyncio.Future[Any]] = {}
+        self._mined: dict[Hashable, Any] = {}  # found, awaiting confirmations
+        self._lookups: set[Hashable] = set()
+        self._next_block: Optional[int] = None
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+        self._polls = 0
+        self._blocks_scanned = 0
+        self._receipt_calls = 0
+        self._block_receipt_calls = 0
+        self._direct_lookups = 0
+        self._reorged = 0
+        self._errors = 0
+
+    def watch(self, tx_hash: Hashable) -> "asyncio.Future[Any]":
+        """
+        Start watching for a transaction, before broadcasting it.
+
+        Returns:
+            Future set to the receipt once confirmed; watching the same hash
+            again returns the same future
+        """
+        future = self._waiting.get(tx_hash)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._waiting[tx_hash] = future
+        if self._task is None:
+            # Serves every waiter, so it must not keep the first one's context
+            self._task = asyncio.create_task(self._run(), context=contextvars.Context())
+        self._wake.set()
+        return future
+
+    def forget(self, tx_hash: Hashable) -> None:
+        """Stop watching a transaction, e.g. because its broadcast failed."""
+        future = self._waiting.pop(tx_hash, None)
+        self._mined.pop(tx_hash, None)
+        self._lookups.discard(tx_hash)
+        if future is not None and not future.done():
+            future.cancel()
+
+    async def wait(self, tx_hash: Hashable, timeout: float = 120.0) -> Any:
+        """
+        Wait for a transaction's confirmed receipt.
+
+        Raises:
+            TimeExhausted: If it is not confirmed within ``timeout`` seconds
+        """
+        future = self.watch(tx_hash)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except TimeoutError:
+            self.forget(tx_hash)
+            raise TimeExhausted(
+                f"Transaction {tx_hash!r} is not in the chain after {timeout} seconds"
+            ) from None
+
+    async def stop(self) -> None:
+        """Stop following the chain; waiting transactions stay unresolved."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            if not self._waiting:
+                self._wake.clear()
+                await self._wake.wait()
+            try:
+                await self.poll()
+            except Exception:
+                # Waiters time out on their own; try again on the next tick
+                self._errors += 1
+            await asyncio.sleep(self.poll_interval)
+
+    async def poll(self) -> None:
+        """Scan blocks mined since the last poll and resolve what is confirmed."""
+        self._polls += 1
+        head = await self._get_block("latest")
+        head_number = int(head["number"])
+        if self._on_block is not None:
+            self._on_block(head_number, int(head["timestamp"]))
+
+        next_block = self._next_block
+        if next_block is None or head_number - next_block >= self.max_catchup_blocks:
+            # Blocks were missed: look everything up directly once
+            self._lookups.update(h for h in self._waiting if h not in self._mined)
+        else:
+            for number in range(next_block, head_number + 1):
+                if len(self._mined) == len(self._waiting):
+                    break
+                block = head if number == head_number else None
+                await self._scan(number, block)
+        self._next_block = max(head_number + 1, next_block or 0)
+
+        if self._lookups:
+            await self._look_up()
+        await self._resolve(head_number)
+
+    async def _scan(self, number: int, block: Optional[Any]) -> None:
+        """Find receipts of waited-on transactions mined in one block."""
+        if block is None:
+            block = await self._get_block(number)
+            if self._on_block is not None:
+                self._on_block(number, int(block["timestamp"]))
+        self._blocks_scanned += 1
+        matches = [
+            h
+            for h in block["transactions"]
+            if h in self._waiting and h not in self._mined
+        ]
+        if not matches:
+            return
+
+        if self._get_block_receipts is not None:
+            try:
+                self._block_receipt_calls += 1
+                receipts = await self._get_block_receipts(number)
+            except Exception as e:
+                if not _is_unsupported(e):
+                    raise
+                # Fetch receipts one by one from now on
+                self._get_block_receipts = None
+            else:
+                wanted = set(matches)
+                for receipt in receipts:
+                    if receipt["transactionHash"] in wanted:
+                        self._mined[receipt["transactionHash"]] = receipt
+                return
+
+        self._receipt_calls += len(matches)
+        receipts = await asyncio.gather(*(self._get_receipt(h) for h in matches))
+        for tx_hash, receipt in zip(matches, receipts, strict=True):
+            if receipt is not None:
+                self._mined[tx_hash] = receipt
+
+    async def _look_up(self) -> None:
+        """Fetch receipts of transactions that may be in unscanned blocks."""
+        lookups = [h for h in self._lookups if h in self._waiting]
+        self._lookups.clear()
+        self._direct_lookups += len(lookups)
+        self._receipt_calls += len(lookups)
+        receipts = await asyncio.gather(*(self._get_receipt(h) for h in lookups))
+        for tx_hash, receipt in zip(lookups, receipts, strict=True):
+            if receipt is not None:
+                self._mined[tx_hash] = receipt
+
+    async def _resolve(self, head_number: int) -> None:
+        """Return receipts buried under enough blocks to their waiters."""
+        depth = self.confirmations - 1
+        ready = [
+            tx_hash
+            for tx_hash, receipt in self._mined.items()
+            if head_number - int(receipt["blockNumber"]) >= depth
+        ]
+        if not ready:
+            return
+
+        if depth > 0:
+            # A reorg may have dropped the block the receipt came from
+            numbers = {int(self._mined[h]["blockNumber"]) for h in ready}
+            blocks = await asyncio.gather(*(self._get_block(n) for n in numbers))
+            canonical = {n: b["hash"] for n, b in zip(numbers, blocks, strict=True)}
+            for tx_hash in list(ready):
+                receipt = self._mined[tx_hash]
+                if canonical[int(receipt["blockNumber"])] != receipt["blockHash"]:
+                    self._reorged += 1
+                    del self._mined[tx_hash]
+                    self._lookups.add(tx_hash)
+                    ready.remove(tx_hash)
+
+        for tx_hash in ready:
+            receipt = self._mined.pop(tx_hash)
+            future = self._waiting.pop(tx_hash)
+            if not future.done():
+                future.set_result(receipt)
+
+    def stats(self) -> dict[str, Any]:
+        """Waiting transactions and node calls made, for monitoring."""
+        return {
+            "waiting": len(self._waiting),
+            "awaiting_confirmations": len(self._mined),
+            "confirmations": self.confirmations,
+            "polls": self._polls,
+            "blocks_scanned": self._blocks_scanned,
+            "receipt_calls": self._receipt_calls,
+            "block_receipt_calls": self._block_receipt_calls,
+            "block_receipts_supported": self._get_block_receipts is not None,
+            "direct_lookups": self._direct_lookups,
+            "reorged": self._reorged,
+            "errors": self._errors,
+        }
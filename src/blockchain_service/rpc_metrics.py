@@ -0,0 +1,38 @@
+"""
+Per-method timing of JSON-RPC calls for the Prometheus ``/metrics`` endpoint.
+"""
+
+import time
+from typing import Any
+
+from web3.middleware.base import Web3Middleware
+from web3.types import AsyncMakeRequestFn, RPCEndpoint, RPCResponse
+
+from ..metrics import rpc_errors, rpc_request_seconds
+
+
+class RpcMetricsMiddleware(Web3Middleware):
+    """
+    Records the latency and errors of every JSON-RPC call by method.
+
+    Sits outside the provider, so a call's time includes waiting for a batch
+    or a pooled connection and any failover between endpoints.
+    """
+
+    async def async_wrap_make_request(
+        self, make_request: AsyncMakeRequestFn
+    ) -> AsyncMakeRequestFn:
+        async def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+            start = time.perf_counter()
+            try:
+                response = await make_request(method, params)
+            except Exception:
+                rpc_errors.inc(method)
+                raise
+            finally:
+                rpc_request_seconds.observe(time.perf_counter() - start, method)
+            if "error" in response:
+                rpc_errors.inc(method)
+            return response
+
+        return middleware
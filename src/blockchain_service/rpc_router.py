@@ -0,0 +1,327 @@
+"""
+Latency-aware routing of node calls over several RPC endpoints.
+
+With a single RPC URL, every API call slows down or fails when that one
+provider does. An :class:`RpcRouter` is a provider spreading calls over
+several endpoints:
+
+- reads go to the available endpoint with the lowest score, its EWMA
+  latency inflated by its EWMA error rate, and fail over to the next one on
+  connection errors, timeouts, HTTP errors and rate limiting
+- ``eth_sendRawTransaction`` goes to the best few endpoints at once so the
+  transaction reaches the network through several peers; the first endpoint
+  to accept it answers the call
+- a background probe times ``eth_blockNumber`` on every endpoint, keeping
+  latencies fresh, bringing failed endpoints back and taking endpoints that
+  lag behind the highest block out of rotation
+
+Each endpoint has its own provider and keep-alive connection pool.
+"""
+
+import asyncio
+import contextlib
+import time
+from collections.abc import Callable
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+from aiohttp import ClientError
+from web3 import AsyncHTTPProvider
+from web3.exceptions import ProviderConnectionError
+from web3.providers.async_base import AsyncJSONBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from .connection_pool import RpcConnectionPool
+
+# Calls sent to several endpoints at once
+_BROADCAST_METHODS = {"eth_sendRawTransaction"}
+
+# Errors after which a call is retried on the next endpoint. OSError covers
+# ConnectionError and TimeoutError.
+_FAILOVER_ERRORS = (ClientError, OSError, ProviderConnectionError)
+
+# EIP-1474 "limit exceeded", used by hosted providers for rate limiting
+_LIMIT_EXCEEDED = -32005
+
+
+def _is_rate_limited(response: RPCResponse) -> bool:
+    error = response.get("error")
+    if not isinstance(error, dict):
+        return False
+    message = str(error.get("message", "")).lower()
+    return error.get("code") == _LIMIT_EXCEEDED or "rate limit" in message
+
+
+class RpcEndpoint:
+    """One node endpoint with its provider, connection pool and health."""
+
+    def __init__(self, url: str, pool: RpcConnectionPool):
+        """
+        Initialize the endpoint.
+
+        Args:
+            url: JSON-RPC URL of the node
+            pool: Connection pool for this endpoint's provider
+        """
+        self.url = url
+        self.pool = pool
+        self.provider: Optional[AsyncHTTPProvider] = None
+        self.latency: Optional[float] = None  # EWMA, seconds
+        self.error_rate = 0.0  # EWMA of failed calls
+        self.consecutive_failures = 0
+        self.block_number: Optional[int] = None
+        self.calls = 0
+        self.failures = 0
+
+    @property
+    def name(self) -> str:
+        """Scheme and host of the URL; the path may hold an API key."""
+        parts = urlsplit(self.url)
+        return f"{parts.scheme}://{parts.netloc.rsplit('@', 1)[-1]}"
+
+
+class RpcRouter(AsyncJSONBaseProvider):
+    """Provider routing each call to the best of several endpoints."""
+
+    def __init__(
+        self,
+        endpoints: list[RpcEndpoint],
+        build_provider: Callable[[str, dict[str, Any]], AsyncHTTPProvider],
+        broadcast_count: int = 3,
+        probe_interval: float = 5.0,
+        max_block_lag: int = 5,
+        failure_threshold: int = 3,
+        ewma_alpha: float = 0.3,
+        error_penalty: float = 10.0,
+    ):
+        """
+        Initialize the router.
+
+        Args:
+            endpoints: Endpoints to route over, in order of preference
+                       until their latencies are known
+            build_provider: Creates the provider of an endpoint from its URL
+                            and request keyword arguments; it should not
+                            retry failed calls itself, the router fails over
+            broadcast_count: Endpoints each raw transaction is sent to
+            probe_interval: Seconds between health probes; 0 disables them
+            max_block_lag: Blocks an endpoint may trail the highest probed
+                           block before it is taken out of rotation
+            failure_threshold: Consecutive failures that take an endpoint
+                               out of rotation until it answers a probe
+            ewma_alpha: Weight of the newest sample in latency and error rate
+            error_penalty: How much an error rate of 1 multiplies latency by,
+                           on top of the latency itself
+        """
+        super().__init__()
+        if not endpoints:
+            raise ValueError("At least one RPC endpoint is required")
+        self.endpoints = endpoints
+        self.build_provider = build_provider
+        self.broadcast_count = broadcast_count
+        self.probe_interval = probe_interval
+        self.max_block_lag = max_block_lag
+        self.failure_threshold = failure_threshold
+        self.ewma_alpha = ewma_alpha
+        self.error_penalty = error_penalty
+        self._probe_task: Optional[asyncio.Task[None]] = None
+        self._broadcasts: set[asyncio.Future[RPCResponse]] = set()
+        self._failovers = 0
+        self._broadcast_count = 0
+        self._probes = 0
+        for endpoint in endpoints:
+            endpoint.provider = build_provider(
+                endpoint.url, endpoint.pool.request_kwargs()
+            )
+
+    async def connect(self) -> None:
+        """Attach the connection pools and start health probing."""
+        for endpoint in self.endpoints:
+            assert endpoint.provider is not None
+            await endpoint.pool.attach(endpoint.provider)
+        if self.probe_interval > 0 and self._probe_task is None:
+            self._probe_task = asyncio.create_task(self._probe_loop())
+
+    async def reconnect(self) -> None:
+        """Replace every endpoint's provider and sessions, keeping health."""
+        for endpoint in self.endpoints:
+            if endpoint.provider is not None:
+                await endpoint.provider.disconnect()
+            endpoint.provider = self.build_provider(
+                endpoint.url, endpoint.pool.request_kwargs()
+            )
+            await endpoint.pool.attach(endpoint.provider)
+
+    async def disconnect(self) -> None:
+        """Stop probing, let broadcasts finish and close every endpoint."""
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._probe_task
+            self._probe_task = None
+        await asyncio.gather(*self._broadcasts, return_exceptions=True)
+        for endpoint in self.endpoints:
+            if endpoint.provider is not None:
+                await endpoint.provider.disconnect()
+
+    def _available(self, endpoint: RpcEndpoint, head: Optional[int]) -> bool:
+        if endpoint.consecutive_failures >= self.failure_threshold:
+            return False
+        if head is None or endpoint.block_number is None:
+            return True
+        return head - endpoint.block_number <= self.max_block_lag
+
+    def _score(self, endpoint: RpcEndpoint) -> float:
+        if endpoint.latency is None:
+            # Untried endpoints go first so each gets measured
+            return 0.0 if endpoint.error_rate == 0 else float("inf")
+        return endpoint.latency * (1 + self.error_penalty * endpoint.error_rate)
+
+    def ranked(self) -> list[RpcEndpoint]:
+        """Endpoints in the order calls try them, available ones first."""
+        head = max(
+            (e.block_number for e in self.endpoints if e.block_number is not None),
+            default=None,
+        )
+        return sorted(
+            self.endpoints,
+            key=lambda e: (not self._available(e, head), self._score(e)),
+        )
+
+    def _record(self, endpoint: RpcEndpoint, seconds: Optional[float]) -> None:
+        """Update an endpoint's health with a call's latency, None if it failed."""
+        alpha = self.ewma_alpha
+        if seconds is None:
+            endpoint.failures += 1
+            endpoint.consecutive_failures += 1
+            endpoint.error_rate += alpha * (1 - endpoint.error_rate)
+            return
+        endpoint.consecutive_failures = 0
+        endpoint.error_rate -= alpha * endpoint.error_rate
+        if endpoint.latency is None:
+            endpoint.latency = seconds
+        else:
+            endpoint.latency += alpha * (seconds - endpoint.latency)
+
+    async def _timed(
+        self, endpoint: RpcEndpoint, method: RPCEndpoint, params: Any
+    ) -> RPCResponse:
+        """Make a call on one endpoint and record how it went."""
+        assert endpoint.provider is not None
+        endpoint.calls += 1
+        start = time.monotonic()
+        try:
+            response = await endpoint.provider.make_request(method, params)
+        except _FAILOVER_ERRORS:
+            self._record(endpoint, None)
+            raise
+        if _is_rate_limited(response):
+            self._record(endpoint, None)
+        else:
+            self._record(endpoint, time.monotonic() - start)
+        return response
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """Send a call to the best endpoint, or broadcast a raw transaction."""
+        if method in _BROADCAST_METHODS:
+            return await self._broadcast(method, params)
+
+        failure: Optional[BaseException] = None
+        rate_limited: Optional[RPCResponse] = None
+        for attempt, endpoint in enumerate(self.ranked()):
+            if attempt:
+                self._failovers += 1
+            try:
+                response = await self._timed(endpoint, method, params)
+            except _FAILOVER_ERRORS as e:
+                failure = e
+                continue
+            if not _is_rate_limited(response):
+                return response
+            rate_limited = response
+
+        # Every endpoint failed: report the rate limit, else the last error
+        if rate_limited is not None:
+            return rate_limited
+        assert failure is not None
+        raise failure
+
+    async def _broadcast(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """
+        Send a call to the best few endpoints at once.
+
+        Returns the first success. Without one, returns the best endpoint's
+        response, so errors such as "nonce too low" reach the caller as if
+        only that endpoint had been used. Sends still running when this
+        returns are left to complete, spreading the transaction further.
+        """
+        self._broadcast_count += 1
+        sends = [
+            asyncio.ensure_future(self._timed(endpoint, method, params))
+            for endpoint in self.ranked()[: self.broadcast_count]
+        ]
+        for send in sends:
+            self._broadcasts.add(send)
+            send.add_done_callback(self._broadcasts.discard)
+
+        for next_done in asyncio.as_completed(sends):
+            try:
+                response = await next_done
+            except _FAILOVER_ERRORS:
+                continue
+            if "error" not in response:
+                return response
+
+        for send in sends:
+            if send.exception() is None:
+                return send.result()
+        raise sends[0].exception()  # type: ignore[misc]
+
+    async def probe(self) -> None:
+        """Time ``eth_blockNumber`` on every endpoint."""
+        self._probes += 1
+        await asyncio.gather(*(self._probe(e) for e in self.endpoints))
+
+    async def _probe(self, endpoint: RpcEndpoint) -> None:
+        try:
+            response = await self._timed(endpoint, RPCEndpoint("eth_blockNumber"), [])
+        except Exception:
+            return
+        result = response.get("result")
+        if isinstance(result, str):
+            endpoint.block_number = int(result, 16)
+
+    async def _probe_loop(self) -> None:
+        while True:
+            await self.probe()
+            await asyncio.sleep(self.probe_interval)
+
+    def stats(self) -> dict[str, Any]:
+        """Routing counters and per-endpoint health, for monitoring."""
+        head = max(
+            (e.block_number for e in self.endpoints if e.block_number is not None),
+            default=None,
+        )
+        return {
+            "failovers": self._failovers,
+            "broadcasts": self._broadcast_count,
+            "probes": self._probes,
+            "endpoints": [
+                {
+                    "endpoint": endpoint.name,
+                    "available": self._available(endpoint, head),
+                    "latency_ms": (
+                        endpoint.latency * 1000
+                        if endpoint.latency is not None
+                        else None
+                    ),
+                    "error_rate": endpoint.error_rate,
+                    "consecutive_failures": endpoint.consecutive_failures,
+                    "block_number": endpoint.block_number,
+                    "calls": endpoint.calls,
+                    "failures": endpoint.failures,
+                    "connection_pool": endpoint.pool.stats(),
+                }
+                for endpoint in self.ranked()
+            ],
+        }
@@ -0,0 +1,55 @@
+"""
+Coalescing of identical concurrent reads.
+
+During a gate rush, scanners and the app look up the same token many times
+at once. A :class:`SingleFlight` lets the first caller for a key make the
+RPC while every identical call arriving before it completes awaits the same
+future, so N concurrent lookups cost one node call.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Shares one in-flight call among concurrent callers with the same key."""
+
+    def __init__(self) -> None:
+        self._in_flight: dict[Hashable, asyncio.Future[Any]] = {}
+        self._calls = 0
+        self._collapsed = 0
+
+    async def do(self, key: Hashable, fetch: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run ``fetch`` unless a call for ``key`` is already in flight.
+
+        Args:
+            key: Identifies the read, e.g. ``("ownerOf", token_id)``
+            fetch: Coroutine function performing the read
+
+        Returns:
+            The result of the call, shared by all callers of that flight.
+            If it raises, every caller gets the exception.
+        """
+        self._calls += 1
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self._collapsed += 1
+            # Shielded so one caller's cancellation does not fail the others
+            return await asyncio.shield(in_flight)  # type: ignore[no-any-return]
+
+        future = asyncio.ensure_future(fetch())
+        self._in_flight[key] = future
+        future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(future)
+
+    def stats(self) -> dict[str, Any]:
+        """Call and collapse counters, for monitoring."""
+        return {
+            "calls": self._calls,
+            "collapsed": self._collapsed,
+            "in_flight": len(self._in_flight),
+        }
@@ -0,0 +1,186 @@
+"""
+Bounded queue of transaction submissions, drained by a worker pool.
+
+Without a limit, an on-sale spike lets any number of requests build, sign
+and broadcast transactions at once: latency grows without bound and the
+node starts rejecting calls. Submissions go through a
+:class:`SubmissionQueue` instead. At most ``workers`` broadcasts run at a
+time, at most ``max_depth`` wait behind them, and anything beyond that is
+rejected immediately with :class:`ServiceBusyError` so the API can answer
+``429`` with a ``Retry-After`` estimate instead of queueing forever.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import math
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, Optional, TypeVar
+
+from .interface import ServiceBusyError
+
+T = TypeVar("T")
+
+# Weight of the newest sample in the moving average of service time
+_EWMA_ALPHA = 0.2
+
+
+class SubmissionQueue:
+    """Bounded FIFO of submissions run by a fixed pool of workers."""
+
+    def __init__(self, max_depth: int = 1000, workers: int = 8):
+        """
+        Initialize the queue; workers start on first use.
+
+        Args:
+            max_depth: Submissions allowed to wait for a worker
+            workers: Submissions run concurrently
+        """
+        self.max_depth = max_depth
+        self.workers = workers
+        self._queue: Optional[
+            asyncio.Queue[
+                tuple[
+                    Callable[[], Awaitable[Any]],
+                    contextvars.Context,
+                    asyncio.Future[Any],
+                    float,
+                ]
+            ]
+        ] = None
+        self._workers: list[asyncio.Task[None]] = []
+        self._busy = 0
+        self._started_at = time.monotonic()
+        self._busy_seconds = 0.0
+        self._service_seconds: Optional[float] = None
+
+        self._submitted = 0
+        self._rejected = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+
+    async def submit(self, job: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run ``job`` on a worker once one is free, in the caller's context.
+
+        Args:
+            job: Coroutine function performing the submission
+
+        Returns:
+            The job's result
+
+        Raises:
+            ServiceBusyError: If ``max_depth`` submissions are already waiting
+        """
+        if self._queue is None:
+            self._start()
+        assert self._queue is not None
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait(
+                (job, contextvars.copy_context(), future, time.monotonic())
+            )
+        except asyncio.QueueFull:
+            self._rejected += 1
+            raise ServiceBusyError(
+                f"Transaction queue is full ({self.max_depth} waiting)",
+                retry_after=self.retry_after(),
+            ) from None
+        self._submitted += 1
+        return await future
+
+    def retry_after(self) -> float:
+        """Seconds until the queue has likely drained, at least one."""
+        depth = self._queue.qsize() if self._queue is not None else 0
+        service = self._service_seconds or 0.0
+        return float(max(1, math.ceil(depth * service / self.workers)))
+
+    def _start(self) -> None:
+        self._queue = asyncio.Queue(maxsize=self.max_depth)
+        self._started_at = time.monotonic()
+        self._workers = [
+            asyncio.create_task(
+                self._work(), name=f"tx-submitter-{i}", context=contextvars.Context()
+            )
+            for i in range(self.workers)
+        ]
+
+    async def _work(self) -> None:
+        assert self._queue is not None
+        while True:
+            job, context, future, enqueued_at = await self._queue.get()
+            started = time.monotonic()
+            waited = started - enqueued_at
+            self._wait_seconds_total += waited
+            self._wait_seconds_max = max(self._wait_seconds_max, waited)
+
+            if future.cancelled():
+                # The caller gave up while waiting; do not send its transaction
+                continue
+            self._busy += 1
+            try:
+                # Context variables (e.g. the calling API route) follow the job
+                result = await asyncio.create_task(_call(job), context=context)
+                if not future.done():
+                    future.set_result(result)
+            except asyncio.CancelledError:
+                future.cancel()
+                # Only stop if the worker itself is being cancelled, not when
+                # the job was cancelled from within
+                worker = asyncio.current_task()
+                if worker is not None and worker.cancelling():
+                    raise
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                self._busy -= 1
+                elapsed = time.monotonic() - started
+                self._busy_seconds += elapsed
+                self._service_seconds = (
+                    elapsed
+                    if self._service_seconds is None
+                    else _EWMA_ALPHA * elapsed
+                    + (1 - _EWMA_ALPHA) * self._service_seconds
+                )
+
+    async def close(self) -> None:
+        """Stop the workers and fail submissions still waiting."""
+        for task in self._workers:
+            task.cancel()
+        for task in self._workers:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._workers = []
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, _, future, _ = self._queue.get_nowait()
+                if not future.done():
+                    future.set_exception(ConnectionError("Service is shutting down"))
+            self._queue = None
+
+    def stats(self) -> dict[str, Any]:
+        """Depth, wait time and worker utilization, for monitoring."""
+        uptime = time.monotonic() - self._started_at
+        dequeued = self._submitted - (self._queue.qsize() if self._queue else 0)
+        return {
+            "depth": self._queue.qsize() if self._queue is not None else 0,
+            "max_depth": self.max_depth,
+            "workers": self.workers,
+            "busy_workers": self._busy,
+            "submitted": self._submitted,
+            "rejected": self._rejected,
+            "wait_seconds_avg": (
+                self._wait_seconds_total / dequeued if dequeued else None
+            ),
+            "wait_seconds_max": self._wait_seconds_max,
+            "service_seconds_avg": self._service_seconds,
+            "utilization": (
+                self._busy_seconds / (self.workers * uptime) if uptime > 0 else None
+            ),
+        }
+
+
+async def _call(job: Callable[[], Awaitable[T]]) -> T:
+    return await job()
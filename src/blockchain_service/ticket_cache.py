@@ -0,0 +1,116 @@
+"""
+Read-through cache of on-chain ticket owners and statuses.
+
+The backend signs every ticket write itself, so after one of its transactions
+is mined it already knows the new owner or status, and the ``ownerOf`` /
+``ticketStatuses`` reads that follow can be answered locally. Writes made by
+anyone else are picked up from contract logs, which drop the affected
+entries. Entries also expire after a fixed age, which bounds how stale a read
+can be if a log is missed.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass
+class _Entry:
+    value: str
+    stored_at: float
+
+
+class TicketStateCache:
+    """Bounded, time-limited cache of ticket owners and statuses."""
+
+    OWNER = "owner"
+    STATUS = "status"
+
+    def __init__(self, max_entries: int = 100_000, ttl_seconds: float = 30.0):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Number of (token, field) entries to remember; the
+                         least recently used are forgotten first
+            ttl_seconds: Maximum age of a cached value; 0 disables caching
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[int, str], _Entry] = OrderedDict()
+        # Bumped whenever a token changes, so reads racing a change are dropped
+        self._versions: OrderedDict[int, int] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def get(self, token_id: int, field: str) -> Optional[str]:
+        """
+        Get a cached value, or None if it must be read from the chain.
+
+        Args:
+            token_id: On-chain token ID
+            field: ``OWNER`` or ``STATUS``
+        """
+        key = (token_id, field)
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry.stored_at > self.ttl_seconds:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return entry.value
+
+    def version(self, token_id: int) -> int:
+        """Current version of a token; pass it to :meth:`fill` after a read."""
+        return self._versions.get(token_id, 0)
+
+    def fill(self, token_id: int, field: str, value: str, version: int) -> None:
+        """
+        Store a value read from the chain.
+
+        Dropped if the token changed since ``version`` was taken, as the read
+        may have seen the state from before the change.
+        """
+        if self.version(token_id) == version:
+            self._store(token_id, field, value)
+
+    def set(self, token_id: int, field: str, value: str) -> None:
+        """Store a value taken from a mined receipt."""
+        self._bump(token_id)
+        self._store(token_id, field, value)
+
+    def invalidate(self, token_id: int) -> None:
+        """Forget everything cached for a token."""
+        self._bump(token_id)
+        for field in (self.OWNER, self.STATUS):
+            if self._entries.pop((token_id, field), None) is not None:
+                self._invalidations += 1
+
+    def _bump(self, token_id: int) -> None:
+        self._versions[token_id] = self._versions.get(token_id, 0) + 1
+        self._versions.move_to_end(token_id)
+        while len(self._versions) > self.max_entries:
+            self._versions.popitem(last=False)
+
+    def _store(self, token_id: int, field: str, value: str) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        key = (token_id, field)
+        self._entries[key] = _Entry(value, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters and size, for monitoring."""
+        lookups = self._hits + self._misses
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_ratio": self._hits / lookups if lookups else None,
+            "invalidations": self._invalidations,
+            "ttl_seconds": self.ttl_seconds,
+        }
@@ -1,16 +1,85 @@
 """
 Web3 implementation of the blockchain service for real blockchain interactions.
+
+All node I/O goes through ``AsyncWeb3``/``AsyncHTTPProvider`` so that slow RPC
+calls (gas estimation, receipt lookups) yield to the event loop instead of
+blocking every other request handled by the worker.
 """
 
+import asyncio
+import contextlib
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Optional, TypeVar
 
+from aiohttp import ClientConnectionError
 from eth_account import Account
-from web3 import Web3
+from hexbytes import HexBytes
+from web3 import AsyncHTTPProvider, AsyncWeb3, Web3
+from web3.exceptions import (
+    BlockNotFound,
+    ContractLogicError,
+    ProviderConnectionError,
+    TimeExhausted,
+    TransactionNotFound,
+)
+from web3.logs import DISCARD
 from web3.middleware import ExtraDataToPOAMiddleware
+from web3.providers.async_base import AsyncBaseProvider
+from web3.types import FilterParams, TxReceipt
 
 from ..config import get_contract_abi, settings
-from .interface import BlockchainServiceInterface
+from ..metrics import gas_used
+from .batching_provider import BatchingHTTPProvider, RpcBatchStats
+from .block_cache import BlockTimestampCache
+from .connection_pool import RpcConnectionPool
+from .gas_oracle import GasOracle
+from .gas_profile import PROFILED_FUNCTIONS, GasLimitProfile, is_out_of_gas_error
+from .interface import (
+    BlockchainServiceInterface,
+    PendingTransaction,
+    ServiceBusyError,
+    TicketEvent,
+)
+from .nonce_manager import NonceManager, is_nonce_error
+from .receipt_resolver import ReceiptResolver
+from .rpc_metrics import RpcMetricsMiddleware
+from .rpc_router import RpcEndpoint, RpcRouter
+from .single_flight import SingleFlight
+from .submission_queue import SubmissionQueue
+from .ticket_cache import TicketStateCache
+
+T = TypeVar("T")
+
+# Errors raised by the HTTP provider when the node is unreachable
+_CONNECTION_ERRORS = (
+    ConnectionError,
+    ProviderConnectionError,
+    ClientConnectionError,
+)
+
+# Contract events that set a ticket's status
+_STATUS_EVENTS = {
+    "TicketMinted": "Valid",
+    "TicketCheckedIn": "CheckedIn",
+    "TicketInvalidated": "Invalidated",
+}
+
+
+@dataclass(frozen=True)
+class _SentTransaction:
+    """A transaction accepted by the node, pending its receipt."""
+
+    tx_hash: HexBytes
+    # (function selector, calldata size) used for the gas limit profile, or
+    # None for functions always estimated live
+    gas_key: Optional[tuple[str, int]]
+    # Contract function name, to report gas used per function
+    function: str
+    # Nonce the transaction was signed with
+    nonce: int
 
 
 class Web3BlockchainService(BlockchainServiceInterface):
@@ -20,6 +89,11 @@ class Web3BlockchainService(BlockchainServiceInterface):
         """
         Initialize the Web3 blockchain service.
 
+        The service is meant to be created once per application lifetime and
+        shared across requests, so everything that does not depend on the
+        node (ABI, signing account) is prepared here exactly once. No I/O
+        happens in the constructor; call :meth:`connect` before first use.
+
         Args:
             contract_address: Address of the deployed Ticket contract.
                             If not provided, will use from settings.
@@ -32,180 +106,647 @@ class Web3BlockchainService(BlockchainServiceInterface):
                 "DEPLOYER_PRIVATE_KEY environment variable is required but not set"
             )
 
-        # Initialize Web3 connection
-        self.w3 = Web3(Web3.HTTPProvider(settings.rpc_url))
-
-        # Add middleware for PoA networks (like some testnets)
-        self.w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
-
-        # Check connection
-        if not self.w3.is_connected():
-            raise ConnectionError(
-                f"Failed to connect to blockchain node at {settings.rpc_url}"
-            )
-
         # Set up account from private key
         self.account = Account.from_key(settings.deployer_private_key)
 
-        # Load contract
+        # Resolve contract address and load the ABI once
         self.contract_address = contract_address or settings.ticket_contract_address
         if not self.contract_address:
             raise ValueError("Contract address not provided")
+        self._abi = get_contract_abi()
+
+        # Fee quotes refreshed in the background, started on connect
+        self._gas_oracle = GasOracle(
+            fee_history=lambda count, newest, percentiles: self._call(
+                lambda: self.w3.eth.fee_history(count, newest, percentiles)
+            ),
+            gas_price=lambda: self._call(lambda: self.w3.eth.gas_price),
+            block_number=self._poll_latest_block,
+            ttl_seconds=settings.gas_oracle_ttl_seconds,
+            refresh_on_block=settings.gas_oracle_refresh_on_block,
+            history_blocks=settings.gas_fee_history_blocks,
+            priority_percentile=settings.gas_priority_fee_percentile,
+            min_priority_fee=settings.gas_min_priority_fee_wei,
+        )
+
+        # Gas limits learned per contract function
+        self._gas_profile = GasLimitProfile(
+            safety_margin=settings.gas_limit_safety_margin,
+            bucket_bytes=settings.gas_limit_bucket_bytes,
+            headroom=settings.gas_limit_headroom,
+        )
+
+        # Block timestamps shared by every write result
+        self._block_timestamps = BlockTimestampCache(
+            self._fetch_block_timestamp,
+            max_entries=settings.block_timestamp_cache_size,
+        )
+
+        # Receipts of our transactions, found by following new blocks
+        self._receipts = ReceiptResolver(
+            get_block=lambda block_id: self._call(
+                lambda: self.w3.eth.get_block(block_id)
+            ),
+            get_receipt=self._fetch_receipt,
+            get_block_receipts=(
+                self._fetch_block_receipts
+                if settings.receipt_use_block_receipts
+                else None
+            ),
+            on_block=self._block_timestamps.put,
+            confirmations=settings.receipt_confirmations,
+            poll_interval=settings.receipt_poll_seconds,
+        )
+
+        # Owner/status reads, kept fresh from receipts and contract logs
+        self._ticket_cache = TicketStateCache(
+            max_entries=settings.ticket_cache_max_entries,
+            ttl_seconds=settings.ticket_cache_ttl_seconds,
+        )
+        # Concurrent cache misses for the same read share one RPC
+        self._reads = SingleFlight()
+        # Our own mined transactions, whose logs the cache already reflects
+        self._applied_transactions: OrderedDict[HexBytes, None] = OrderedDict()
+        self._log_watcher: Optional[asyncio.Task[None]] = None
+        self._log_watcher_errors = 0
+
+        # Bounded queue in front of the broadcast path, drained by workers
+        self._submissions = SubmissionQueue(
+            max_depth=settings.submission_queue_size,
+            workers=settings.submission_workers,
+        )
+
+        # Local nonce allocation, synced from the node on connect
+        self._nonce_manager = NonceManager(self._fetch_pending_nonce)
+
+        # Node calls made in the same loop iteration share one HTTP request
+        self._rpc_stats = RpcBatchStats()
+
+        # Keep-alive connections to the node, attached to each provider
+        self._connection_pool = self._new_connection_pool()
+
+        # With several node endpoints, calls are routed over all of them
+        self._rpc_urls = list(dict.fromkeys([settings.rpc_url, *settings.rpc_urls]))
+        self._router: Optional[RpcRouter] = None
+        if len(self._rpc_urls) > 1:
+            self._router = RpcRouter(
+                [
+                    RpcEndpoint(url, self._new_connection_pool())
+                    for url in self._rpc_urls
+                ],
+                # The router fails over instead of retrying an endpoint
+                build_provider=lambda url, request_kwargs: self._endpoint_provider(
+                    url, request_kwargs, exception_retry_configuration=None
+                ),
+                broadcast_count=settings.rpc_broadcast_count,
+                probe_interval=settings.rpc_probe_interval_seconds,
+                max_block_lag=settings.rpc_max_block_lag,
+                failure_threshold=settings.rpc_failure_threshold,
+            )
+
+        # Initialize Web3 instance and contract binding
+        self._build_provider()
+
+    def _new_connection_pool(self) -> RpcConnectionPool:
+        return RpcConnectionPool(
+            size=settings.rpc_pool_size,
+            keepalive_seconds=settings.rpc_keepalive_seconds,
+            connect_timeout=settings.rpc_connect_timeout_seconds,
+            read_timeout=settings.rpc_read_timeout_seconds,
+        )
+
+    def _endpoint_provider(
+        self, url: str, request_kwargs: dict[str, Any], **kwargs: Any
+    ) -> AsyncHTTPProvider:
+        """Create the HTTP provider of one node endpoint."""
+        if settings.rpc_batching_enabled:
+            return BatchingHTTPProvider(
+                url,
+                max_batch_size=settings.rpc_batch_max_size,
+                batch_retry_seconds=settings.rpc_batch_retry_seconds,
+                stats=self._rpc_stats,
+                request_kwargs=request_kwargs,
+                **kwargs,
+            )
+        return AsyncHTTPProvider(url, request_kwargs=request_kwargs, **kwargs)
+
+    def _build_provider(self) -> None:
+        """Create the async provider, Web3 instance and contract binding."""
+        provider: AsyncBaseProvider
+        if self._router is not None:
+            provider = self._router
+        else:
+            provider = self._endpoint_provider(
+                settings.rpc_url, self._connection_pool.request_kwargs()
+            )
+        self.w3 = AsyncWeb3(provider)
+
+        # Add middleware for PoA networks (like some testnets)
+        self.w3.middleware_onion.inject(ExtraDataToPOAMiddleware, layer=0)
+        # Time every call by JSON-RPC method for /metrics
+        self.w3.middleware_onion.add(RpcMetricsMiddleware, "rpc_metrics")
 
-        # Initialize contract instance
         self.contract = self.w3.eth.contract(
             address=Web3.to_checksum_address(self.contract_address),
-            abi=get_contract_abi(),
+            abi=self._abi,
         )
 
-        # Cache for gas prices
-        self._last_gas_price: Optional[int] = None
+    async def connect(self) -> None:
+        """Verify the node is reachable and sync the account nonce."""
+        if self._router is not None:
+            await self._router.connect()
+        else:
+            await self._connection_pool.attach(self.w3.provider)
+        if not await self.w3.is_connected():
+            nodes = (
+                ", ".join(e.name for e in self._router.endpoints)
+                if self._router is not None
+                else settings.rpc_url
+            )
+            raise ConnectionError(f"Failed to connect to blockchain node at {nodes}")
+        await self._nonce_manager.sync()
+        await self._gas_oracle.start()
+        if settings.ticket_cache_log_poll_seconds > 0 and self._log_watcher is None:
+            self._log_watcher = asyncio.create_task(
+                self._watch_logs(await self._call(lambda: self.w3.eth.block_number))
+            )
 
-    async def _get_gas_price(self) -> int:
-        """Get current gas price with caching."""
-        # In production, implement proper caching with TTL
-        if self._last_gas_price is None:
-            self._last_gas_price = int(self.w3.eth.gas_price)
-        return self._last_gas_price
+    async def reconnect(self) -> None:
+        """Drop the current provider and its sessions and build a fresh one."""
+        if self._router is not None:
+            # Keeps what the router learned about its endpoints
+            await self._router.reconnect()
+            return
+        await self.w3.provider.disconnect()
+        self._build_provider()
+        await self._connection_pool.attach(self.w3.provider)
+
+    async def _call(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run a node call, reconnecting once if the connection has dropped.
 
-    async def _send_transaction(self, func: Any) -> dict[str, Any]:
+        The callable must resolve ``self.w3``/``self.contract`` when invoked
+        so that the retry runs against the fresh connection.
         """
-        Build, sign, and send a transaction.
+        try:
+            return await fn()
+        except _CONNECTION_ERRORS:
+            await self.reconnect()
+            return await fn()
+
+    async def close(self) -> None:
+        """Release the node connection on application shutdown."""
+        await self._submissions.close()
+        await self._receipts.stop()
+        await self._gas_oracle.stop()
+        if self._log_watcher is not None:
+            self._log_watcher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._log_watcher
+            self._log_watcher = None
+        await self.w3.provider.disconnect()
+
+    def stats(self) -> dict[str, Any]:
+        """Gas, nonce, cache, connection and RPC batching state, for monitoring."""
+        return {
+            "rpc": self._rpc_stats.to_dict(),
+            "connection_pool": (
+                self._connection_pool.stats() if self._router is None else None
+            ),
+            "rpc_routing": self._router.stats() if self._router is not None else None,
+            "block_timestamps": self._block_timestamps.stats(),
+            "gas": self._gas_oracle.stats(),
+            "gas_limits": self._gas_profile.stats(),
+            "nonce": self._nonce_manager.stats(),
+            "submission_queue": self._submissions.stats(),
+            "receipts": self._receipts.stats(),
+            "ticket_cache": {
+                **self._ticket_cache.stats(),
+                "log_watcher_errors": self._log_watcher_errors,
+            },
+            "single_flight": self._reads.stats(),
+        }
+
+    async def _fetch_pending_nonce(self) -> int:
+        """Transaction count of the service account including pending ones."""
+        return int(
+            await self._call(
+                lambda: self.w3.eth.get_transaction_count(
+                    self.account.address, "pending"
+                )
+            )
+        )
+
+    async def _fetch_block_timestamp(self, block_number: int) -> int:
+        """Timestamp of a block, read from the node."""
+        block = await self._call(lambda: self.w3.eth.get_block(block_number))
+        return int(block["timestamp"])
+
+    async def _fetch_receipt(self, tx_hash: HexBytes) -> Optional[TxReceipt]:
+        """Receipt of a transaction, or None if it is not mined yet."""
+        try:
+            return await self._call(
+                lambda: self.w3.eth.get_transaction_receipt(tx_hash)
+            )
+        except TransactionNotFound:
+            return None
+
+    async def _fetch_block_receipts(self, block_number: int) -> list[TxReceipt]:
+        """Every receipt of a block, in one ``eth_getBlockReceipts`` call."""
+        return list(
+            await self._call(lambda: self.w3.eth.get_block_receipts(block_number))
+        )
+
+    async def _poll_latest_block(self) -> int:
+        """Number of the latest block, remembering its timestamp on the way."""
+        block = await self._call(lambda: self.w3.eth.get_block("latest"))
+        self._block_timestamps.put(int(block["number"]), int(block["timestamp"]))
+        return int(block["number"])
+
+    async def _gas_limit(self, func: Any, gas_key: Optional[tuple[str, int]]) -> int:
+        """Gas limit from the learned profile, estimating live on a miss."""
+        if settings.gas_limit_cache_enabled and gas_key is not None:
+            gas_limit = self._gas_profile.get(*gas_key)
+            if gas_limit is not None:
+                return gas_limit
+
+        gas_estimate = await self._call(
+            lambda: func.estimate_gas({"from": self.account.address})
+        )
+        if gas_key is not None:
+            self._gas_profile.record(*gas_key, gas_estimate)
+        return int(gas_estimate * self._gas_profile.safety_margin)
+
+    async def _broadcast_transaction(self, func: Any) -> _SentTransaction:
+        """
+        Queue a transaction for broadcast and wait until it has been sent.
 
         Args:
             func: Contract function to call
 
         Returns:
-            Transaction receipt details
+            The broadcast transaction
+
+        Raises:
+            ServiceBusyError: If the submission queue is full
         """
-        # Get gas price
-        gas_price = await self._get_gas_price()
-
-        # Estimate gas and add buffer
-        gas_estimate = func.estimate_gas({"from": self.account.address})
-        gas_limit = int(gas_estimate * 1.2)  # Add 20% buffer
-
-        # Build transaction
-        tx = func.build_transaction(
-            {
-                "from": self.account.address,
-                "gas": gas_limit,
-                "gasPrice": gas_price,
-                "nonce": self.w3.eth.get_transaction_count(self.account.address),
-                "chainId": settings.chain_id,
-            }
-        )
+        return await self._submissions.submit(lambda: self._send_transaction(func))
 
-        # Sign transaction
-        signed_tx = self.w3.eth.account.sign_transaction(
-            tx, settings.deployer_private_key
-        )
+    async def _send_transaction(self, func: Any) -> _SentTransaction:
+        """
+        Build, sign, and broadcast a transaction without waiting for it.
 
-        # Send transaction
-        tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+        Runs on a submission worker. Nonces come from the local nonce
+        manager, so the workers can have many transactions in flight at once.
+
+        Args:
+            func: Contract function to call
+
+        Returns:
+            The broadcast transaction
+        """
+        # Get fees from the oracle (no RPC on the hot path)
+        fees = await self._gas_oracle.current()
+
+        gas_key: Optional[tuple[str, int]] = None
+        if func.fn_name in PROFILED_FUNCTIONS:
+            calldata = self.contract.encode_abi(func.fn_name, args=func.args)
+            gas_key = (func.selector, len(HexBytes(calldata)))
+        gas_limit = await self._gas_limit(func, gas_key)
+
+        nonce = await self._nonce_manager.allocate()
+        watched: Optional[HexBytes] = None
+        try:
+            # Build transaction
+            tx = await func.build_transaction(
+                {
+                    "from": self.account.address,
+                    "gas": gas_limit,
+                    **fees.transaction_fields(),
+                    "nonce": nonce,
+                    "chainId": settings.chain_id,
+                }
+            )
 
-        # Wait for receipt
-        receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+            # Sign transaction
+            signed_tx = self.account.sign_transaction(tx)
 
+            # Watch for the receipt before the node can mine it
+            watched = signed_tx.hash
+            self._receipts.watch(watched)
+
+            # Send transaction
+            tx_hash: HexBytes = await self._call(
+                lambda: self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+            )
+        except _CONNECTION_ERRORS:
+            # The node may or may not have seen it; re-read the pending count
+            self._nonce_manager.invalidate(nonce)
+            if watched is not None:
+                self._receipts.forget(watched)
+            raise
+        except Exception as e:
+            if watched is not None:
+                self._receipts.forget(watched)
+            if is_nonce_error(e):
+                self._nonce_manager.invalidate(nonce)
+            else:
+                self._nonce_manager.release(nonce)
+            if gas_key is not None and is_out_of_gas_error(e):
+                self._gas_profile.invalidate(*gas_key)
+            raise
+
+        self._nonce_manager.confirm(nonce)
+        return _SentTransaction(
+            tx_hash=tx_hash, gas_key=gas_key, function=func.fn_name, nonce=nonce
+        )
+
+    async def _wait_for_receipt(self, sent: _SentTransaction) -> TxReceipt:
+        """Wait for a transaction to be mined and check it did not revert."""
+        try:
+            receipt: TxReceipt = await self._receipts.wait(
+                sent.tx_hash, settings.receipt_timeout_seconds
+            )
+        except TimeExhausted:
+            # The node may have dropped it, leaving a gap that stalls every
+            # later nonce; resync so the next allocation fills the gap
+            self._nonce_manager.invalidate(sent.nonce)
+            raise
+        gas_used.observe(receipt["gasUsed"], sent.function)
+        if receipt["status"] == 0:
+            if sent.gas_key is not None:
+                # Could be a stale gas limit; estimate live next time
+                self._gas_profile.invalidate(*sent.gas_key)
+            raise Exception(f"Transaction {Web3.to_hex(sent.tx_hash)} reverted")
+        if sent.gas_key is not None:
+            self._gas_profile.record(*sent.gas_key, receipt["gasUsed"])
+        return receipt
+
+    def _apply_receipt(self, receipt: TxReceipt) -> None:
+        """Update cached owners and statuses from one of our mined receipts."""
+        for log in self.contract.events.Transfer().process_receipt(
+            receipt, errors=DISCARD
+        ):
+            self._ticket_cache.set(
+                log["args"]["tokenId"], TicketStateCache.OWNER, log["args"]["to"]
+            )
+        for event_name, status in _STATUS_EVENTS.items():
+            for log in getattr(self.contract.events, event_name)().process_receipt(
+                receipt, errors=DISCARD
+            ):
+                self._ticket_cache.set(
+                    log["args"]["tokenId"], TicketStateCache.STATUS, status
+                )
+
+        self._applied_transactions[receipt["transactionHash"]] = None
+        while len(self._applied_transactions) > settings.ticket_cache_max_entries:
+            self._applied_transactions.popitem(last=False)
+
+    async def _watch_logs(self, from_block: int) -> None:
+        """Invalidate the ticket cache from new contract logs, after ``from_block``."""
+        next_block = from_block + 1
+        while True:
+            await asyncio.sleep(settings.ticket_cache_log_poll_seconds)
+            try:
+                latest = await self._call(lambda: self.w3.eth.block_number)
+                if latest >= next_block:
+                    await self._invalidate_from_logs(next_block, latest)
+                    next_block = latest + 1
+            except Exception:
+                # Cached entries still expire; try again on the next tick
+                self._log_watcher_errors += 1
+
+    async def _invalidate_from_logs(self, from_block: int, to_block: int) -> None:
+        """Drop cached state for tickets changed by transactions we did not send."""
+        for event in await self.get_ticket_events(from_block, to_block):
+            if HexBytes(event.transaction_hash) not in self._applied_transactions:
+                self._ticket_cache.invalidate(event.token_id)
+
+    async def _summarize_receipt(self, receipt: TxReceipt) -> dict[str, Any]:
+        """Fields shared by every write result."""
+        timestamp = await self._block_timestamps.get(receipt["blockNumber"])
         return {
-            "transaction_hash": receipt["transactionHash"].hex(),
+            "transaction_hash": Web3.to_hex(receipt["transactionHash"]),
             "block_number": receipt["blockNumber"],
             "gas_used": receipt["gasUsed"],
+            "timestamp": datetime.fromtimestamp(timestamp).isoformat(),
         }
 
-    async def mint_ticket(
+    def _track(
+        self,
+        sent: _SentTransaction,
+        finalize: Callable[[TxReceipt, dict[str, Any]], Awaitable[dict[str, Any]]],
+        error_message: str,
+    ) -> PendingTransaction:
+        """
+        Resolve a broadcast transaction in the background.
+
+        Args:
+            sent: The broadcast transaction
+            finalize: Builds the operation result from the mined receipt and
+                      its summary
+            error_message: Prefix for errors raised while resolving
+
+        Returns:
+            Handle whose outcome is already being awaited by a task
+        """
+
+        async def resolve() -> dict[str, Any]:
+            try:
+                receipt = await self._wait_for_receipt(sent)
+                self._apply_receipt(receipt)
+                return await finalize(receipt, await self._summarize_receipt(receipt))
+            except Exception as e:
+                raise Exception(f"{error_message}: {str(e)}") from e
+
+        return PendingTransaction(
+            transaction_hash=Web3.to_hex(sent.tx_hash),
+            outcome=asyncio.ensure_future(resolve()),
+        )
+
+    async def submit_mint_ticket(
         self,
         to_address: str,
         token_uri: str,
-    ) -> dict[str, Any]:
-        """Mint a new ticket NFT on the blockchain."""
+    ) -> PendingTransaction:
+        """Broadcast a ticket mint on the blockchain."""
         try:
             # Call the mintTicket function
             func = self.contract.functions.mintTicket(
                 Web3.to_checksum_address(to_address), token_uri
             )
+            sent = await self._broadcast_transaction(func)
+        except ServiceBusyError:
+            raise
+        except Exception as e:
+            raise Exception(f"Failed to mint ticket: {str(e)}") from e
 
-            # Send transaction
-            receipt = await self._send_transaction(func)
-
+        async def finalize(
+            receipt: TxReceipt, summary: dict[str, Any]
+        ) -> dict[str, Any]:
             # Get the token ID from the event logs
             logs = self.contract.events.TicketMinted().process_receipt(
-                self.w3.eth.get_transaction_receipt(receipt["transaction_hash"])
+                receipt, errors=DISCARD
             )
 
             if logs:
                 token_id = logs[0]["args"]["tokenId"]
             else:
                 # Fallback: calculate token ID (assumes sequential minting)
-                token_id = self.contract.functions.totalSupply().call() - 1
+                token_id = (
+                    await self._call(
+                        lambda: self.contract.functions.totalSupply().call()
+                    )
+                    - 1
+                )
 
-            block = self.w3.eth.get_block(receipt["block_number"])
-            timestamp_iso = datetime.fromtimestamp(block["timestamp"]).isoformat()
+            return {"token_id": token_id, **summary}
 
-            return {
-                "token_id": token_id,
-                "transaction_hash": receipt["transaction_hash"],
-                "block_number": receipt["block_number"],
-                "gas_used": receipt["gas_used"],
-                "timestamp": timestamp_iso,
-            }
+        return self._track(sent, finalize, "Failed to mint ticket")
 
+    async def submit_batch_mint_tickets(
+        self,
+        to_addresses: list[str],
+        token_uris: list[str],
+    ) -> PendingTransaction:
+        """Broadcast a batch mint of several tickets in one transaction."""
+        try:
+            if len(to_addresses) != len(token_uris):
+                raise ValueError("to_addresses and token_uris differ in length")
+
+            # Call the batchMintTicket function
+            recipients = [Web3.to_checksum_address(a) for a in to_addresses]
+            func = self.contract.functions.batchMintTicket(recipients, token_uris)
+            sent = await self._broadcast_transaction(func)
+        except ServiceBusyError:
+            raise
         except Exception as e:
-            raise Exception(f"Failed to mint ticket: {str(e)}") from e
+            raise Exception(f"Failed to batch mint tickets: {str(e)}") from e
 
-    async def check_in_ticket(self, token_id: int) -> dict[str, Any]:
-        """Check in a ticket by updating its on-chain state."""
+        async def finalize(
+            receipt: TxReceipt, summary: dict[str, Any]
+        ) -> dict[str, Any]:
+            # The contract mints in input order, one TicketMinted log each
+            logs = self.contract.events.TicketMinted().process_receipt(
+                receipt, errors=DISCARD
+            )
+            if len(logs) != len(recipients):
+                raise Exception(
+                    f"Expected {len(recipients)} TicketMinted events, got {len(logs)}"
+                )
+            for log, recipient in zip(logs, recipients, strict=True):
+                if log["args"]["to"] != recipient:
+                    raise Exception("TicketMinted events out of input order")
+
+            return {"token_ids": [log["args"]["tokenId"] for log in logs], **summary}
+
+        return self._track(sent, finalize, "Failed to batch mint tickets")
+
+    async def submit_check_in_ticket(self, token_id: int) -> PendingTransaction:
+        """Broadcast a ticket check-in on the blockchain."""
         try:
             # Call the checkIn function
             func = self.contract.functions.checkIn(token_id)
+            sent = await self._broadcast_transaction(func)
+        except ServiceBusyError:
+            raise
+        except Exception as e:
+            raise Exception(f"Failed to check in ticket: {str(e)}") from e
 
-            # Send transaction
-            receipt = await self._send_transaction(func)
+        async def finalize(
+            receipt: TxReceipt, summary: dict[str, Any]
+        ) -> dict[str, Any]:
+            return {**summary, "new_status": "CheckedIn"}
 
-            block = self.w3.eth.get_block(receipt["block_number"])
-            timestamp_iso = datetime.fromtimestamp(block["timestamp"]).isoformat()
+        return self._track(sent, finalize, "Failed to check in ticket")
 
-            return {
-                "transaction_hash": receipt["transaction_hash"],
-                "block_number": receipt["block_number"],
-                "gas_used": receipt["gas_used"],
-                "timestamp": timestamp_iso,
-                "new_status": "CheckedIn",
-            }
+    async def submit_invalidate_ticket(self, token_id: int) -> PendingTransaction:
+        """Broadcast a ticket invalidation on the blockchain."""
+        try:
+            # Call the invalidate function
+            func = self.contract.functions.invalidate(token_id)
+            sent = await self._broadcast_transaction(func)
+        except ServiceBusyError:
+            raise
+        except Exception as e:
+            raise Exception(f"Failed to invalidate ticket: {str(e)}") from e
 
+        async def finalize(
+            receipt: TxReceipt, summary: dict[str, Any]
+        ) -> dict[str, Any]:
+            return {**summary, "new_status": "Invalidated"}
+
+        return self._track(sent, finalize, "Failed to invalidate ticket")
+
+    async def submit_batch_check_in_tickets(
+        self, token_ids: list[int]
+    ) -> PendingTransaction:
+        """Broadcast a check-in of several tickets in one transaction."""
+        try:
+            func = self.contract.functions.batchCheckIn(token_ids)
+            sent = await self._broadcast_transaction(func)
+        except ServiceBusyError:
+            raise
         except Exception as e:
-            raise Exception(f"Failed to check in ticket: {str(e)}") from e
+            raise Exception(f"Failed to batch check in tickets: {str(e)}") from e
+
+        return self._track(
+            sent,
+            self._batch_finalizer(token_ids, "TicketCheckedIn", "CheckedIn"),
+            "Failed to batch check in tickets",
+        )
 
-    async def invalidate_ticket(self, token_id: int) -> dict[str, Any]:
-        """Invalidate a ticket by updating its on-chain state."""
+    async def submit_batch_invalidate_tickets(
+        self, token_ids: list[int]
+    ) -> PendingTransaction:
+        """Broadcast an invalidation of several tickets in one transaction."""
         try:
-            # Call the invalidate function
-            func = self.contract.functions.invalidate(token_id)
+            func = self.contract.functions.batchInvalidate(token_ids)
+            sent = await self._broadcast_transaction(func)
+        except ServiceBusyError:
+            raise
+        except Exception as e:
+            raise Exception(f"Failed to batch invalidate tickets: {str(e)}") from e
 
-            # Send transaction
-            receipt = await self._send_transaction(func)
+        return self._track(
+            sent,
+            self._batch_finalizer(token_ids, "TicketInvalidated", "Invalidated"),
+            "Failed to batch invalidate tickets",
+        )
+
+    def _batch_finalizer(
+        self, token_ids: list[int], event_name: str, new_status: str
+    ) -> Callable[[TxReceipt, dict[str, Any]], Awaitable[dict[str, Any]]]:
+        """
+        Build the finalizer for a batch state change.
 
-            block = self.w3.eth.get_block(receipt["block_number"])
-            timestamp_iso = datetime.fromtimestamp(block["timestamp"]).isoformat()
+        The contract emits ``event_name`` only for tickets it changed, so the
+        remaining token IDs are the ones it skipped.
+        """
 
+        async def finalize(
+            receipt: TxReceipt, summary: dict[str, Any]
+        ) -> dict[str, Any]:
+            logs = getattr(self.contract.events, event_name)().process_receipt(
+                receipt, errors=DISCARD
+            )
+            changed = {log["args"]["tokenId"] for log in logs}
             return {
-                "transaction_hash": receipt["transaction_hash"],
-                "block_number": receipt["block_number"],
-                "gas_used": receipt["gas_used"],
-                "timestamp": timestamp_iso,
-                "new_status": "Invalidated",
+                "succeeded": [t for t in token_ids if t in changed],
+                "failed": [t for t in token_ids if t not in changed],
+                **summary,
+                "new_status": new_status,
             }
 
-        except Exception as e:
-            raise Exception(f"Failed to invalidate ticket: {str(e)}") from e
+        return finalize
 
-    async def transfer_ticket(
+    async def submit_transfer_ticket(
         self,
         token_id: int,
         from_address: str,
         to_address: str,
-    ) -> dict[str, Any]:
-        """Transfer a ticket NFT from one address to another."""
+    ) -> PendingTransaction:
+        """Broadcast a ticket transfer on the blockchain."""
         try:
             # Use owner-controlled transfer function
             func = self.contract.functions.ownerTransfer(
@@ -213,49 +754,146 @@ class Web3BlockchainService(BlockchainServiceInterface):
                 Web3.to_checksum_address(to_address),
                 token_id,
             )
-
-            # Send transaction
-            receipt = await self._send_transaction(func)
-
-            block = self.w3.eth.get_block(receipt["block_number"])
-            timestamp_iso = datetime.fromtimestamp(block["timestamp"]).isoformat()
-
-            return {
-                "transaction_hash": receipt["transaction_hash"],
-                "block_number": receipt["block_number"],
-                "gas_used": receipt["gas_used"],
-                "timestamp": timestamp_iso,
-                "from": from_address,
-                "to": to_address,
-            }
-
+            sent = await self._broadcast_transaction(func)
+        except ServiceBusyError:
+            raise
         except Exception as e:
             raise Exception(f"Failed to transfer ticket: {str(e)}") from e
 
+        async def finalize(
+            receipt: TxReceipt, summary: dict[str, Any]
+        ) -> dict[str, Any]:
+            return {**summary, "from": from_address, "to": to_address}
+
+        return self._track(sent, finalize, "Failed to transfer ticket")
+
     async def get_ticket_status(self, token_id: int) -> str:
         """Get the current status of a ticket."""
-        try:
-            # Call the ticketStatuses mapping
-            status_code = self.contract.functions.ticketStatuses(token_id).call()
-
-            # Map status code to string
-            status_map = {
-                0: "Valid",
-                1: "CheckedIn",
-                2: "Invalidated",
-            }
-
-            return str(status_map.get(status_code, "Unknown"))
+        cached = self._ticket_cache.get(token_id, TicketStateCache.STATUS)
+        if cached is not None:
+            return cached
 
+        try:
+            return await self._reads.do(
+                ("ticketStatuses", token_id),
+                lambda: self._fetch_ticket_status(token_id),
+            )
         except Exception as e:
             raise Exception(f"Failed to get ticket status: {str(e)}") from e
 
+    async def _fetch_ticket_status(self, token_id: int) -> str:
+        """Read a ticket's status from the node and fill the cache."""
+        version = self._ticket_cache.version(token_id)
+
+        # Call the ticketStatuses mapping
+        status_code = await self._call(
+            lambda: self.contract.functions.ticketStatuses(token_id).call()
+        )
+
+        # Map status code to string
+        status_map = {
+            0: "Valid",
+            1: "CheckedIn",
+            2: "Invalidated",
+        }
+
+        status = str(status_map.get(status_code, "Unknown"))
+        self._ticket_cache.fill(token_id, TicketStateCache.STATUS, status, version)
+        return status
+
     async def get_ticket_owner(self, token_id: int) -> str:
         """Get the current owner of a ticket."""
-        try:
-            # Call the ownerOf function
-            owner = self.contract.functions.ownerOf(token_id).call()
-            return str(owner)
+        cached = self._ticket_cache.get(token_id, TicketStateCache.OWNER)
+        if cached is not None:
+            return cached
 
+        try:
+            return await self._reads.do(
+                ("ownerOf", token_id), lambda: self._fetch_ticket_owner(token_id)
+            )
         except Exception as e:
             raise Exception(f"Failed to get ticket owner: {str(e)}") from e
+
+    async def _fetch_ticket_owner(self, token_id: int) -> str:
+        """Read a ticket's owner from the node and fill the cache."""
+        version = self._ticket_cache.version(token_id)
+
+        # Call the ownerOf function
+        owner = str(
+            await self._call(lambda: self.contract.functions.ownerOf(token_id).call())
+        )
+        self._ticket_cache.fill(token_id, TicketStateCache.OWNER, owner, version)
+        return owner
+
+    async def get_token_uri(self, token_id: int) -> Optional[str]:
+        """Get the metadata URI of a ticket, or None if it does not exist."""
+        try:
+            return str(
+                await self._call(
+                    lambda: self.contract.functions.tokenURI(token_id).call()
+                )
+            )
+        except ContractLogicError:
+            # "Ticket does not exist"
+            return None
+        except Exception as e:
+            raise Exception(f"Failed to get token URI: {str(e)}") from e
+
+    async def get_block_number(self) -> int:
+        """Get the number of the latest block."""
+        try:
+            return int(await self._call(lambda: self.w3.eth.block_number))
+        except Exception as e:
+            raise Exception(f"Failed to get block number: {str(e)}") from e
+
+    async def get_block_hash(self, block_number: int) -> Optional[str]:
+        """Get the hash of a block, or None if it does not exist."""
+        try:
+            block = await self._call(lambda: self.w3.eth.get_block(block_number))
+        except BlockNotFound:
+            return None
+        except Exception as e:
+            raise Exception(f"Failed to get block: {str(e)}") from e
+        return Web3.to_hex(block["hash"])
+
+    async def get_ticket_events(
+        self, from_block: int, to_block: int
+    ) -> list[TicketEvent]:
+        """Get the Ticket contract's events in a block range."""
+        events_by_topic = {
+            event.topic: event
+            for event in (
+                getattr(self.contract.events, name)()
+                for name in ("Transfer", *_STATUS_EVENTS)
+            )
+        }
+        log_filter: FilterParams = {
+            "address": self.contract.address,
+            "fromBlock": from_block,
+            "toBlock": to_block,
+            "topics": [list(events_by_topic)],
+        }
+        try:
+            logs = await self._call(lambda: self.w3.eth.get_logs(log_filter))
+        except Exception as e:
+            raise Exception(f"Failed to get ticket events: {str(e)}") from e
+
+        ticket_events = []
+        for log in logs:
+            event = events_by_topic.get(Web3.to_hex(log["topics"][0]))
+            if event is None:
+                continue
+            args = event.process_log(log)["args"]
+            ticket_events.append(
+                TicketEvent(
+                    name=event.event_name,
+                    token_id=args["tokenId"],
+                    block_number=log["blockNumber"],
+                    block_hash=Web3.to_hex(log["blockHash"]),
+                    transaction_hash=Web3.to_hex(log["transactionHash"]),
+                    log_index=log["logIndex"],
+                    to_address=args.get("to"),
+                )
+            )
+        ticket_events.sort(key=lambda e: (e.block_number, e.log_index))
+        return ticket_events
@@ -24,6 +24,46 @@ class Settings(BaseSettings):
     rpc_url: str = "http://localhost:8545"
     chain_id: int = 31337
 
+    # Further node endpoints, as a JSON list: reads go to the fastest healthy
+    # endpoint and raw transactions are sent to several at once
+    rpc_urls: list[str] = []
+    rpc_broadcast_count: int = 3
+    rpc_probe_interval_seconds: float = 5.0  # 0 disables health probes
+    rpc_max_block_lag: int = 5  # blocks behind the best endpoint
+    rpc_failure_threshold: int = 3  # consecutive failures that pause an endpoint
+
+    # Keep-alive HTTP connection pool to each node endpoint
+    rpc_pool_size: int = 32
+    rpc_keepalive_seconds: float = 30.0
+    rpc_connect_timeout_seconds: float = 5.0  # includes waiting for the pool
+    rpc_read_timeout_seconds: float = 30.0
+
+    # JSON-RPC batching of concurrent node calls
+    rpc_batching_enabled: bool = True
+    rpc_batch_max_size: int = 100
+    rpc_batch_retry_seconds: float = 60.0  # unbatched after a rejected batch
+
+    # Gas fee oracle
+    gas_oracle_ttl_seconds: float = 5.0
+    gas_oracle_refresh_on_block: bool = False  # refresh on new blocks instead
+    gas_fee_history_blocks: int = 10
+    gas_priority_fee_percentile: float = 50.0
+    gas_min_priority_fee_wei: int = 0
+
+    # Gas limits: learned per single-ticket function instead of estimate_gas
+    gas_limit_cache_enabled: bool = True
+    gas_limit_safety_margin: float = 1.2
+    gas_limit_bucket_bytes: int = 256
+    gas_limit_headroom: int = 25_000  # a first-time holder's balance slot
+
+    # Block timestamps remembered for write results
+    block_timestamp_cache_size: int = 1024
+
+    # Cache of on-chain ticket owners and statuses
+    ticket_cache_ttl_seconds: float = 30.0  # staleness bound; 0 disables
+    ticket_cache_max_entries: int = 100_000
+    ticket_cache_log_poll_seconds: float = 2.0  # 0 disables the log watcher
+
     # Contract Configuration
     ticket_contract_address: Optional[str] = None
     ticket_contract_abi_path: str = "artifacts/contracts/Ticket.sol/Ticket.json"
@@ -36,8 +76,56 @@ class Settings(BaseSettings):
     # Database Configuration
     database_url: str = "sqlite:///./data/ticketchain.db"
 
+    # Ticket metadata: "inline" puts a base64 data URI on-chain; "offchain"
+    # puts a short content-addressed URI there and serves the JSON from
+    # /metadata, which needs a persistent store and a public base URL
+    token_metadata_storage: str = "inline"
+    metadata_store_path: Optional[str] = None  # None means in-memory only
+    metadata_base_url: str = "http://localhost:8000"  # public URL of this API
+
     # Registry Configuration
+    ticket_registry_backend: str = "memory"  # or "sqlite", stored at database_url
     ticket_registry_path: Optional[str] = None  # None means in-memory only
+    ticket_registry_compact_every: int = 100_000  # journal records per snapshot
+    ticket_registry_compact: bool = False  # typed-array layout for 10M+ tickets
+    ticket_registry_capacity: int = 0  # expected tickets, presizes the compact map
+
+    # Contract event indexer; set the database path and the contract's
+    # deployment block when enabling it, or every start re-reads the chain
+    indexer_enabled: bool = False  # run the indexer inside the API process
+    indexer_db_path: Optional[str] = None  # None means in-memory only
+    indexer_start_block: int = 0  # e.g. the contract's deployment block
+    indexer_chunk_size: int = 2000
+    indexer_reorg_depth: int = 12
+    indexer_poll_seconds: float = 2.0
+
+    # Transaction submission: broadcasts run concurrently, and waiting behind
+    # them before new writes get 429
+    submission_workers: int = 8
+    submission_queue_size: int = 1000
+
+    # Receipts: found by following new blocks rather than polled per transaction
+    receipt_confirmations: int = 1  # blocks including the transaction's own
+    receipt_poll_seconds: float = 0.5
+    receipt_timeout_seconds: float = 120.0
+    receipt_use_block_receipts: bool = False  # eth_getBlockReceipts if supported
+
+    # Batch operations: tickets per on-chain transaction
+    batch_chunk_size: int = 100
+
+    # Deduplication of retried writes (Idempotency-Key or ticket ID)
+    idempotency_ttl_seconds: float = 3600.0
+    idempotency_max_entries: int = 10_000
+
+    # Streaming exports: tickets read from the registry and index per page
+    export_page_size: int = 1000
+
+    # Asynchronous write tracking
+    transaction_tracker_max_entries: int = 10_000
+    webhook_timeout_seconds: float = 5.0
+    # Hosts webhooks may be sent to, as a JSON list; when empty, any host
+    # except loopback, private and other non-public addresses is allowed
+    webhook_allowed_hosts: list[str] = []
 
     model_config = {
         "env_file": ".env",
@@ -0,0 +1,154 @@
+"""
+Memory-compact mapping from ticket ID to token ID.
+
+A ``dict[str, int]`` costs well over 100 bytes per ticket once the ``str``
+and ``int`` objects and the dict slot are counted, in every worker process.
+:class:`CompactTicketMap` keeps the same mapping in a handful of flat
+buffers instead:
+
+- ticket IDs concatenated as UTF-8 in one ``bytearray``, with their end
+  offsets in an ``array('Q')``
+- token IDs in an ``array('q')`` and 32-bit key hashes in an ``array('I')``
+- an open-addressing (linear probing) table of entry numbers in an
+  ``array('I')``
+
+That is roughly the key length plus 30 bytes per ticket. Lookups compare
+the stored hash first and the key bytes only on a hash match, so there are
+no false positives. The price is a lookup implemented in Python rather than
+C, so point lookups are slower than a dict (still microseconds), and the
+table is rebuilt when it grows, so presize it with ``capacity`` when the
+final size is known.
+"""
+
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Optional, Union
+
+_MAX_LOAD = 0.7
+
+
+class CompactTicketMap:
+    """Open-addressing hash table of ticket ID -> token ID in typed arrays."""
+
+    def __init__(self, capacity: int = 0):
+        """
+        Initialize an empty map.
+
+        Args:
+            capacity: Number of entries to reserve table space for
+        """
+        self._keys = bytearray()
+        self._ends = array("Q")
+        self._tokens = array("q")
+        self._hashes = array("I")
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        size = 8
+        while size * _MAX_LOAD < capacity:
+            size *= 2
+        self._slots = array("I", bytes(4 * size))
+        self._mask = size - 1
+        # Rebuild the table from the stored hashes; keys are not rehashed
+        slots, mask = self._slots, self._mask
+        for entry, key_hash in enumerate(self._hashes):
+            i = key_hash & mask
+            while slots[i]:
+                i = (i + 1) & mask
+            slots[i] = entry + 1
+
+    def _find(self, key: bytes, key_hash: int) -> tuple[int, int]:
+        """Slot for ``key`` and its entry number, or -1 if absent."""
+        slots, hashes, ends, keys = self._slots, self._hashes, self._ends, self._keys
+        mask = self._mask
+        i = key_hash & mask
+        while True:
+            entry = slots[i]
+            if not entry:
+                return i, -1
+            entry -= 1
+            if hashes[entry] == key_hash:
+                start = ends[entry - 1] if entry else 0
+                if keys[start : ends[entry]] == key:
+                    return i, entry
+            i = (i + 1) & mask
+
+    def __setitem__(self, ticket_id: str, token_id: int) -> None:
+        key = ticket_id.encode()
+        key_hash = hash(ticket_id) & 0xFFFFFFFF
+        slot, entry = self._find(key, key_hash)
+        if entry >= 0:
+            self._tokens[entry] = token_id
+            return
+        self._keys += key
+        self._ends.append(len(self._keys))
+        self._tokens.append(token_id)
+        self._hashes.append(key_hash)
+        self._slots[slot] = len(self._tokens)
+        if len(self._tokens) > len(self._slots) * _MAX_LOAD:
+            self._allocate(len(self._slots))
+
+    def _entry(self, ticket_id: str) -> int:
+        return self._find(ticket_id.encode(), hash(ticket_id) & 0xFFFFFFFF)[1]
+
+    def __getitem__(self, ticket_id: str) -> int:
+        entry = self._entry(ticket_id)
+        if entry < 0:
+            raise KeyError(ticket_id)
+        return self._tokens[entry]
+
+    def get(self, ticket_id: str, default: Optional[int] = None) -> Optional[int]:
+        """Token ID of a ticket, or ``default``."""
+        entry = self._entry(ticket_id)
+        return self._tokens[entry] if entry >= 0 else default
+
+    def __contains__(self, ticket_id: object) -> bool:
+        return isinstance(ticket_id, str) and self._entry(ticket_id) >= 0
+
+    def __len__(self) -> int:
+        return len(self._tokens)
+
+    def __iter__(self) -> Iterator[str]:
+        return (ticket_id for ticket_id, _ in self.items())
+
+    def key_at(self, entry: int) -> str:
+        """Ticket ID of an entry; entries are numbered in insertion order."""
+        start = self._ends[entry - 1] if entry else 0
+        return self._keys[start : self._ends[entry]].decode()
+
+    def items(self) -> Iterator[tuple[str, int]]:
+        """(ticket ID, token ID) pairs in insertion order."""
+        start = 0
+        for end, token_id in zip(self._ends, self._tokens, strict=True):
+            yield self._keys[start:end].decode(), token_id
+            start = end
+
+    def update(
+        self, mappings: Union[Mapping[str, int], Iterable[tuple[str, int]]]
+    ) -> None:
+        """Insert or overwrite many entries."""
+        pairs = mappings.items() if isinstance(mappings, Mapping) else mappings
+        for ticket_id, token_id in pairs:
+            self[ticket_id] = token_id
+
+    def clear(self) -> None:
+        """Remove every entry and release the table."""
+        self.__init__()  # type: ignore[misc]
+
+    def copy(self) -> "CompactTicketMap":
+        """Independent copy; the buffers are copied wholesale, not rehashed."""
+        clone = CompactTicketMap.__new__(CompactTicketMap)
+        clone._keys = self._keys[:]
+        clone._ends = self._ends[:]
+        clone._tokens = self._tokens[:]
+        clone._hashes = self._hashes[:]
+        clone._slots = self._slots[:]
+        clone._mask = self._mask
+        return clone
+
+    def nbytes(self) -> int:
+        """Bytes held by the buffers."""
+        return len(self._keys) + sum(
+            a.itemsize * len(a)
+            for a in (self._ends, self._tokens, self._hashes, self._slots)
+        )
@@ -0,0 +1,287 @@
+"""
+Append-only journal with group commit for the file-backed ticket registry.
+
+Registry changes are appended to ``<storage_path>.journal`` as JSON lines
+instead of rewriting the whole registry file on every change. A writer
+thread drains all changes queued since its last pass, writes them with one
+``write`` and makes them durable with one ``fsync`` (group commit), so the
+event loop never waits on disk I/O. Once the journal grows past a threshold,
+the writer compacts it into a snapshot at ``storage_path``, which bounds
+replay time at startup. The snapshot is the JSON object the registry has
+always used, mapping each ticket ID to its token ID, or to
+``[token_id, event_id, metadata]`` for tickets registered with details.
+"""
+
+import asyncio
+import json
+import os
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Any, Optional, TextIO
+
+# A journal record: ["set", ticket_id, token_id, event_id?, metadata?] or ["clear"]
+Record = list[Any]
+
+# Snapshot content: (ticket_id, token_id or [token_id, event_id, metadata]) pairs
+SnapshotState = Iterable[tuple[str, Any]]
+
+_WHITESPACE = " \t\r\n"
+
+
+class RegistryJournal:
+    """Durable, group-committed change log for the in-memory registry."""
+
+    def __init__(
+        self,
+        snapshot_path: str,
+        snapshot_state: Callable[[], SnapshotState],
+        compact_every: int = 100_000,
+    ):
+        """
+        Initialize the journal.
+
+        Args:
+            snapshot_path: Path of the JSON snapshot; the journal lives next
+                           to it with a ``.journal`` suffix
+            snapshot_state: Returns the snapshot entries of a copy of the
+                            current registry state, called by the writer
+                            when compacting
+            compact_every: Journal records after which it is compacted
+        """
+        self.snapshot_path = Path(snapshot_path)
+        self.journal_path = Path(f"{snapshot_path}.journal")
+        self.compact_every = compact_every
+        self._snapshot_state = snapshot_state
+
+        self._cond = threading.Condition()
+        self._pending: list[Record] = []
+        self._appended_seq = 0
+        self._durable_seq = 0
+        self._journal_records = 0
+        self._waiters: list[tuple[int, asyncio.Future[None]]] = []
+        self._writer: Optional[threading.Thread] = None
+        self._closing = False
+
+        self._commits = 0
+        self._compactions = 0
+        self._last_error: Optional[str] = None
+
+    def load(self, apply: Callable[[Record], None]) -> None:
+        """Read the snapshot and replay the journal on top of it via ``apply``."""
+        if self.snapshot_path.exists():
+            with open(self.snapshot_path) as f:
+                for ticket_id, value in _read_snapshot(f):
+                    details = value if isinstance(value, list) else [value]
+                    apply(["set", ticket_id, *details])
+        if self.journal_path.exists():
+            intact = 0  # bytes up to the end of the last complete record
+            with open(self.journal_path, "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        break
+                    apply(record)
+                    self._journal_records += 1
+                    intact += len(line)
+                torn = f.seek(0, os.SEEK_END) > intact
+            if torn:
+                # A write torn by a crash; cut it off so that new records are
+                # appended on a line of their own instead of onto it
+                with open(self.journal_path, "r+b") as f:
+                    f.truncate(intact)
+                    os.fsync(f.fileno())
+
+    def append(self, record: Record) -> int:
+        """
+        Queue a change for the writer.
+
+        Returns:
+            Sequence number to pass to :meth:`wait_durable`
+        """
+        with self._cond:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._run, name="registry-journal", daemon=True
+                )
+                self._writer.start()
+            self._pending.append(record)
+            self._appended_seq += 1
+            self._cond.notify()
+            return self._appended_seq
+
+    async def wait_durable(self, seq: Optional[int] = None) -> None:
+        """
+        Wait until a change (by default, every change so far) is on disk.
+
+        Concurrent callers share the writer's next ``fsync``.
+        """
+        loop = asyncio.get_running_loop()
+        with self._cond:
+            target = self._appended_seq if seq is None else seq
+            if self._durable_seq >= target:
+                return
+            future = loop.create_future()
+            self._waiters.append((target, future))
+        await future
+
+    def close(self) -> None:
+        """Write everything queued and stop the writer."""
+        with self._cond:
+            self._closing = True
+            self._cond.notify()
+            writer = self._writer
+        if writer is not None:
+            writer.join()
+        with self._cond:
+            self._writer = None
+            self._closing = False
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closing:
+                    self._cond.wait()
+                if not self._pending and self._closing:
+                    return
+                batch, self._pending = self._pending, []
+                seq = self._appended_seq
+                compact = self._journal_records + len(batch) >= self.compact_every
+
+            # Copied without holding the condition, so append() is not held up
+            # by compaction. The copy covers every change up to seq since the
+            # registry applies a change before journaling it; changes queued
+            # meanwhile may be in it too, and replaying a record twice is
+            # harmless.
+            state = self._snapshot_state() if compact else None
+            try:
+                if state is not None:
+                    self._write_snapshot(state)
+                else:
+                    self._append_batch(batch)
+                self._commits += 1
+            except OSError as e:
+                # Keep the changes queued and retry on the next pass
+                self._last_error = str(e)
+                print(f"Warning: Registry journal write failed ({e})")
+                with self._cond:
+                    self._pending[:0] = batch
+                    self._cond.wait(timeout=1.0)
+                continue
+
+            with self._cond:
+                self._durable_seq = seq
+                ready = [(s, f) for s, f in self._waiters if s <= seq]
+                self._waiters = [(s, f) for s, f in self._waiters if s > seq]
+            for _, future in ready:
+                future.get_loop().call_soon_threadsafe(_resolve, future)
+
+    def _append_batch(self, batch: list[Record]) -> None:
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        data = "".join(json.dumps(record) + "\n" for record in batch)
+        with open(self.journal_path, "a") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        self._journal_records += len(batch)
+
+    def _write_snapshot(self, state: SnapshotState) -> None:
+        """Atomically replace the snapshot, then start an empty journal."""
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.snapshot_path.with_name(self.snapshot_path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            # Streamed pair by pair so the state is never expanded to a dict
+            f.write("{")
+            separator = ""
+            for ticket_id, value in state:
+                f.write(f"{separator}{json.dumps(ticket_id)}: {json.dumps(value)}")
+                separator = ", "
+            f.write("}")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        # The snapshot covers every journal record, old and queued
+        with open(self.journal_path, "w") as f:
+            os.fsync(f.fileno())
+        self._journal_records = 0
+        self._compactions += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Journal size and write counters, for monitoring."""
+        return {
+            "journal_records": self._journal_records,
+            "pending": len(self._pending),
+            "commits": self._commits,
+            "compactions": self._compactions,
+            "last_error": self._last_error,
+        }
+
+
+def _read_snapshot(f: TextIO, chunk_size: int = 1 << 16) -> Iterator[tuple[str, Any]]:
+    """
+    Yield the snapshot's pairs, decoding the file chunk by chunk.
+
+    Unlike ``json.load``, this never holds more than one chunk and one entry
+    in memory, so loading does not need room for the whole registry twice.
+
+    Raises:
+        ValueError: If the snapshot is not a JSON object
+    """
+    decoder = json.JSONDecoder()
+    buf, pos, eof = "", 0, False
+
+    def peek() -> str:
+        # Next non-whitespace character, reading more as needed
+        nonlocal buf, pos, eof
+        while True:
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buf):
+                return buf[pos]
+            if eof:
+                raise ValueError("Truncated registry snapshot")
+            chunk = f.read(chunk_size)
+            buf, pos, eof = buf[pos:] + chunk, 0, not chunk
+
+    def expect(chars: str) -> str:
+        nonlocal pos
+        char = peek()
+        if char not in chars:
+            raise ValueError(f"Malformed registry snapshot at {char!r}")
+        pos += 1
+        return char
+
+    def value() -> Any:
+        nonlocal buf, pos, eof
+        peek()
+        while True:
+            try:
+                result, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            else:
+                # A number at the end of the buffer may continue in the next chunk
+                if end < len(buf) or eof:
+                    pos = end
+                    return result
+            chunk = f.read(chunk_size)
+            buf, pos, eof = buf[pos:] + chunk, 0, not chunk
+
+    expect("{")
+    if peek() == "}":
+        return
+    while True:
+        ticket_id = value()
+        expect(":")
+        yield ticket_id, value()
+        if expect(",}") == "}":
+            return
+
+
+def _resolve(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
@@ -0,0 +1,195 @@
+"""
+Content-addressed store for ticket metadata.
+
+Putting the metadata JSON itself in the token URI makes every mint pay
+calldata and ``SSTORE`` gas for the whole document, since the contract keeps
+the URI string in storage. The store below keeps the JSON off-chain, keyed
+by the SHA-256 of its canonical encoding. Only a short URI naming that hash
+goes on-chain, and ``GET /metadata/...`` serves the document. A given hash
+always names the same bytes, so responses can be cached forever.
+
+Off-chain storage is enabled with ``TOKEN_METADATA_STORAGE=offchain``. Token
+URIs are permanent, so it requires ``METADATA_STORE_PATH`` to keep documents
+on disk (one file each, named by hash) and a ``METADATA_BASE_URL`` other
+clients can reach. Without a path, documents are kept in memory, which only
+suits tests.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import ipaddress
+import json
+import os
+import re
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+from src.config import settings
+
+_DIGEST = re.compile(r"^[0-9a-f]{64}$")
+_URI_DIGEST = re.compile(r"/metadata/([0-9a-f]{64})$")
+
+
+def canonical_json(metadata: dict[str, Any]) -> bytes:
+    """Encoding hashed for the content address: sorted keys, no whitespace."""
+    return json.dumps(metadata, sort_keys=True, separators=(",", ":")).encode()
+
+
+def is_digest(value: str) -> bool:
+    """Whether a string is a content address (64 lowercase hex characters)."""
+    return bool(_DIGEST.match(value))
+
+
+def digest_from_uri(token_uri: str) -> Optional[str]:
+    """Content address named by a metadata URI, or None for other URIs."""
+    match = _URI_DIGEST.search(token_uri)
+    return match.group(1) if match else None
+
+
+class MetadataStore:
+    """Metadata documents keyed by content hash, with token ID links."""
+
+    def __init__(self, directory: Optional[str] = None, max_links: int = 100_000):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Directory to keep documents in; None keeps them in memory
+            max_links: Token ID to hash links to remember; links can always be
+                       recovered from the token URI on-chain
+        """
+        self.directory = Path(directory) if directory else None
+        self.max_links = max_links
+        self._documents: dict[str, bytes] = {}
+        self._links: OrderedDict[int, str] = OrderedDict()
+        self._writes = 0
+
+    async def put(self, metadata: dict[str, Any]) -> str:
+        """
+        Store a metadata document.
+
+        On disk, the document is durable before this returns, since its URI
+        goes on-chain right after. The write runs on a worker thread so the
+        event loop does not wait on the fsyncs.
+
+        Args:
+            metadata: JSON-serializable document
+
+        Returns:
+            Its content address (hex SHA-256 of the canonical encoding)
+        """
+        document = canonical_json(metadata)
+        digest = hashlib.sha256(document).hexdigest()
+        if self.directory is None:
+            self._documents[digest] = document
+            return digest
+
+        await asyncio.to_thread(self._write, self._path(digest), document)
+        return digest
+
+    def _write(self, path: Path, document: bytes) -> None:
+        """Atomically and durably write a document unless it exists."""
+        if path.exists():
+            return
+        if not path.parent.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _fsync_directory(path.parent.parent)
+        # Unique per writer; same hash means same bytes, so whichever racing
+        # writer replaces last is harmless
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(document)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_name, path)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(tmp_name)
+            raise
+        # Makes the rename itself survive a crash
+        _fsync_directory(path.parent)
+        self._writes += 1
+
+    def get(self, digest: str) -> Optional[bytes]:
+        """Get a document by content address, or None if unknown."""
+        if not is_digest(digest):
+            return None
+        if self.directory is None:
+            return self._documents.get(digest)
+        try:
+            return self._path(digest).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _path(self, digest: str) -> Path:
+        assert self.directory is not None
+        # Fan out over 256 subdirectories to keep directories small
+        return self.directory / digest[:2] / f"{digest}.json"
+
+    def uri(self, digest: str) -> str:
+        """Token URI naming a document; this is what goes on-chain."""
+        return f"{settings.metadata_base_url.rstrip('/')}/metadata/{digest}"
+
+    def link_token(self, token_id: int, digest: str) -> None:
+        """Remember which document a minted token's URI names."""
+        self._links[token_id] = digest
+        self._links.move_to_end(token_id)
+        while len(self._links) > self.max_links:
+            self._links.popitem(last=False)
+
+    def digest_for_token(self, token_id: int) -> Optional[str]:
+        """Document linked to a token, if remembered."""
+        return self._links.get(token_id)
+
+    def stats(self) -> dict[str, Any]:
+        """Store size, for monitoring."""
+        return {
+            "backend": "file" if self.directory else "memory",
+            "documents": len(self._documents) if self.directory is None else None,
+            "file_writes": self._writes,
+            "token_links": len(self._links),
+        }
+
+
+def _fsync_directory(directory: Path) -> None:
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def check_offchain_settings() -> None:
+    """
+    Refuse off-chain metadata that would not outlive the process or host.
+
+    Raises:
+        ValueError: If off-chain storage is enabled without a store path or
+                    with a base URL only this machine can reach
+    """
+    if settings.token_metadata_storage != "offchain":
+        return
+    if not settings.metadata_store_path:
+        raise ValueError(
+            "TOKEN_METADATA_STORAGE=offchain requires METADATA_STORE_PATH, "
+            "or token URIs put on-chain would break on restart"
+        )
+    host = urlsplit(settings.metadata_base_url).hostname or ""
+    try:
+        local = ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        local = host == "localhost" or host.endswith(".localhost")
+    if not host or local:
+        raise ValueError(
+            "TOKEN_METADATA_STORAGE=offchain requires METADATA_BASE_URL to be "
+            f"the API's public URL, not {settings.metadata_base_url!r}"
+        )
+
+
+# Global metadata store instance
+metadata_store = MetadataStore(settings.metadata_store_path)
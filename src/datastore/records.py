@@ -0,0 +1,26 @@
+"""
+Records returned by the ticket registries.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+
+@dataclass(frozen=True)
+class RegisteredTicket:
+    """A ticket as recorded at mint time."""
+
+    ticket_id: str
+    token_id: int
+    event_id: Optional[str] = None
+    metadata: Optional[dict[str, Any]] = None
+
+
+@dataclass(frozen=True)
+class TicketPage:
+    """One page of an event's tickets."""
+
+    tickets: list[RegisteredTicket] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+    # Cursor resuming right after each ticket of the page
+    cursors: list[str] = field(default_factory=list)
@@ -0,0 +1,240 @@
+"""
+SQLite-backed ticket registry.
+
+Drop-in replacement for :class:`~src.datastore.ticket_registry.TicketRegistry`
+for registries too large to keep in memory or rewrite as one JSON file on
+every change. The database runs in WAL mode so reads are not blocked by
+writes, and every statement is a constant SQL string so the connection's
+statement cache reuses its prepared form.
+"""
+
+import json
+import sqlite3
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Optional
+
+from .records import RegisteredTicket, TicketPage
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tickets (
+    ticket_id TEXT PRIMARY KEY,
+    token_id INTEGER NOT NULL,
+    event_id TEXT,
+    metadata TEXT
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS tickets_token_id ON tickets (token_id);
+DROP INDEX IF EXISTS tickets_event_id;
+CREATE INDEX IF NOT EXISTS tickets_event_ticket ON tickets (event_id, ticket_id);
+"""
+
+_UPSERT = (
+    "INSERT OR REPLACE INTO tickets (ticket_id, token_id, event_id, metadata) "
+    "VALUES (?, ?, ?, ?)"
+)
+_GET_TOKEN_ID = "SELECT token_id FROM tickets WHERE ticket_id = ?"
+_GET_TICKET = "SELECT token_id, event_id, metadata FROM tickets WHERE ticket_id = ?"
+_EXISTS = "SELECT 1 FROM tickets WHERE ticket_id = ?"
+# Keyset pagination on the (event_id, ticket_id) index
+_EVENT_PAGE = (
+    "SELECT ticket_id, token_id, metadata FROM tickets "
+    "WHERE event_id = ? AND ticket_id > ? ORDER BY ticket_id LIMIT ?"
+)
+
+# SQLite's default limit on bound parameters is 999 on older builds
+_MAX_PARAMS = 500
+
+
+def sqlite_path_from_url(database_url: str) -> str:
+    """Turn ``sqlite:///./data/x.db`` into ``./data/x.db``."""
+    prefix = "sqlite:///"
+    if not database_url.startswith(prefix):
+        raise ValueError(f"Not a SQLite database URL: {database_url}")
+    return database_url[len(prefix) :] or ":memory:"
+
+
+class SQLiteTicketRegistry:
+    """Registry mapping ticket IDs to token IDs, stored in SQLite."""
+
+    def __init__(self, path: str):
+        """
+        Open (and create if needed) the registry database.
+
+        Args:
+            path: SQLite database file, or ``":memory:"``
+        """
+        self.path = path
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            # Durable at checkpoints; a crash loses at most the last commits
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            columns = {
+                row[1] for row in self._conn.execute("PRAGMA table_info(tickets)")
+            }
+            if columns and "metadata" not in columns:
+                # Databases created before metadata was recorded
+                self._conn.execute("ALTER TABLE tickets ADD COLUMN metadata TEXT")
+            self._conn.executescript(_SCHEMA)
+            # Counted once; kept up to date by writes so stats never scan
+            (self._count,) = self._conn.execute(
+                "SELECT COUNT(*) FROM tickets"
+            ).fetchone()
+
+    def register_ticket(
+        self,
+        ticket_id: str,
+        token_id: int,
+        event_id: Optional[str] = None,
+        metadata: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """Register a mapping from ticket ID to token ID, with its event."""
+        self.register_tickets(
+            [RegisteredTicket(ticket_id, token_id, event_id, metadata)]
+        )
+
+    def register_many(
+        self, mappings: dict[str, int], event_id: Optional[str] = None
+    ) -> None:
+        """Register many ticket ID to token ID mappings in one transaction."""
+        self.register_tickets(
+            RegisteredTicket(ticket_id, token_id, event_id)
+            for ticket_id, token_id in mappings.items()
+        )
+
+    def register_tickets(self, tickets: Iterable[RegisteredTicket]) -> None:
+        """Register many tickets, each with its own event and metadata."""
+        tickets = list(tickets)
+        ticket_ids = list({ticket.ticket_id for ticket in tickets})
+        with self._lock, self._conn:
+            # Re-registered tickets are replaced, not added
+            existing = 0
+            for start in range(0, len(ticket_ids), _MAX_PARAMS):
+                chunk = ticket_ids[start : start + _MAX_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                (found,) = self._conn.execute(
+                    f"SELECT COUNT(*) FROM tickets WHERE ticket_id IN ({placeholders})",
+                    chunk,
+                ).fetchone()
+                existing += found
+            self._conn.executemany(
+                _UPSERT,
+                (
+                    (
+                        ticket.ticket_id,
+                        ticket.token_id,
+                        ticket.event_id,
+                        _encode_metadata(ticket.metadata),
+                    )
+                    for ticket in tickets
+                ),
+            )
+            self._count += len(ticket_ids) - existing
+
+    async def flush(self) -> None:
+        """Changes are committed as they are made; nothing to wait for."""
+        return None
+
+    def get_token_id(self, ticket_id: str) -> Optional[int]:
+        """Get the token ID for a given ticket ID."""
+        with self._lock:
+            row = self._conn.execute(_GET_TOKEN_ID, (ticket_id,)).fetchone()
+        return int(row[0]) if row else None
+
+    def get_many(self, ticket_ids: Iterable[str]) -> dict[str, int]:
+        """Get the token IDs of many tickets; unknown tickets are left out."""
+        ticket_ids = list(ticket_ids)
+        found: dict[str, int] = {}
+        with self._lock:
+            for start in range(0, len(ticket_ids), _MAX_PARAMS):
+                chunk = ticket_ids[start : start + _MAX_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                found.update(
+                    self._conn.execute(
+                        "SELECT ticket_id, token_id FROM tickets "
+                        f"WHERE ticket_id IN ({placeholders})",
+                        chunk,
+                    ).fetchall()
+                )
+        return found
+
+    def get_ticket(self, ticket_id: str) -> Optional[RegisteredTicket]:
+        """Get a ticket with the event and metadata recorded at mint time."""
+        with self._lock:
+            row = self._conn.execute(_GET_TICKET, (ticket_id,)).fetchone()
+        if row is None:
+            return None
+        token_id, event_id, metadata = row
+        return RegisteredTicket(
+            ticket_id, int(token_id), event_id, _decode_metadata(metadata)
+        )
+
+    def list_event_tickets(
+        self, event_id: str, cursor: Optional[str] = None, limit: int = 100
+    ) -> TicketPage:
+        """
+        List an event's tickets in ticket ID order, one page at a time.
+
+        Each page is one range scan of the (event_id, ticket_id) index
+        starting after the cursor, so its cost does not grow with the
+        number of tickets before it.
+
+        Args:
+            event_id: Event to list
+            cursor: ``next_cursor`` of the previous page, None for the first
+            limit: Maximum number of tickets in the page
+
+        Returns:
+            The page; its ``next_cursor`` is None on the last page
+        """
+        with self._lock:
+            # One extra row tells whether another page follows
+            rows = self._conn.execute(
+                _EVENT_PAGE, (event_id, cursor or "", limit + 1)
+            ).fetchall()
+        tickets = [
+            RegisteredTicket(ticket_id, int(token_id), event_id, _decode_metadata(m))
+            for ticket_id, token_id, m in rows[:limit]
+        ]
+        more = len(rows) > limit
+        return TicketPage(
+            tickets=tickets,
+            next_cursor=tickets[-1].ticket_id if more else None,
+            cursors=[ticket.ticket_id for ticket in tickets],
+        )
+
+    def exists(self, ticket_id: str) -> bool:
+        """Check if a ticket ID is registered."""
+        with self._lock:
+            return self._conn.execute(_EXISTS, (ticket_id,)).fetchone() is not None
+
+    def count(self) -> int:
+        """Number of registered tickets, without scanning the table."""
+        return int(self._count)
+
+    def stats(self) -> dict[str, Any]:
+        """Registry size, for monitoring."""
+        return {"tickets": self.count()}
+
+    def clear(self) -> None:
+        """Clear all entries from the registry. Used for testing."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM tickets")
+            self._count = 0
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def _encode_metadata(metadata: Optional[dict[str, Any]]) -> Optional[str]:
+    return json.dumps(metadata, separators=(",", ":")) if metadata is not None else None
+
+
+def _decode_metadata(metadata: Optional[str]) -> Optional[dict[str, Any]]:
+    return json.loads(metadata) if metadata is not None else None
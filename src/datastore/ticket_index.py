@@ -0,0 +1,248 @@
+"""
+Local index of on-chain ticket state, built from contract events.
+
+The event indexer writes every ``TicketMinted``, ``Transfer``,
+``TicketCheckedIn`` and ``TicketInvalidated`` log here together with the
+materialized owner and status of each ticket, so reads can be answered
+without calling the node. Events are kept so that the state of tickets
+touched by orphaned blocks can be rebuilt after a reorganization.
+"""
+
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from ..blockchain_service.interface import TicketEvent
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tickets (
+    token_id INTEGER PRIMARY KEY,
+    owner TEXT,
+    status TEXT NOT NULL,
+    minted_block INTEGER,
+    updated_block INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS events (
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    block_hash TEXT NOT NULL,
+    transaction_hash TEXT NOT NULL,
+    name TEXT NOT NULL,
+    token_id INTEGER NOT NULL,
+    to_address TEXT,
+    PRIMARY KEY (block_number, log_index)
+);
+CREATE INDEX IF NOT EXISTS events_token_id ON events (token_id);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    block_number INTEGER PRIMARY KEY,
+    block_hash TEXT NOT NULL
+);
+"""
+
+# SQLite's default limit on bound parameters is 999 on older builds
+_MAX_PARAMS = 500
+
+# How far back checkpoints are kept, far beyond any reorg depth
+_CHECKPOINT_RETENTION_BLOCKS = 10_000
+
+# Status set by each event; Transfer only changes the owner
+_EVENT_STATUS = {
+    "TicketMinted": "Valid",
+    "TicketCheckedIn": "CheckedIn",
+    "TicketInvalidated": "Invalidated",
+}
+
+
+@dataclass(frozen=True)
+class IndexedTicket:
+    """Materialized state of one ticket."""
+
+    token_id: int
+    owner: Optional[str]
+    status: str
+    minted_block: Optional[int]
+    updated_block: int
+
+
+class TicketIndex:
+    """SQLite store of indexed contract events and ticket state."""
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        Open (and create if needed) the index.
+
+        Args:
+            path: SQLite database file, or ``":memory:"`` for tests
+        """
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        # Written from the indexer's worker thread, read from the event loop
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            if path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    def checkpoint(self) -> Optional[tuple[int, str]]:
+        """Last indexed block and its hash, or None if nothing is indexed."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT block_number, block_hash FROM checkpoints "
+                "ORDER BY block_number DESC LIMIT 1"
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def apply(
+        self, events: list[TicketEvent], block_number: int, block_hash: str
+    ) -> None:
+        """
+        Record a chunk of events and advance the checkpoint, atomically.
+
+        Args:
+            events: Events of the chunk in chain order
+            block_number: Last block of the chunk
+            block_hash: Hash of that block, checked later for reorgs
+        """
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        e.block_number,
+                        e.log_index,
+                        e.block_hash,
+                        e.transaction_hash,
+                        e.name,
+                        e.token_id,
+                        e.to_address,
+                    )
+                    for e in events
+                ],
+            )
+            for event in events:
+                self._apply_event(event)
+            self._set_checkpoint(block_number, block_hash)
+
+    def _set_checkpoint(self, block_number: int, block_hash: str) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO checkpoints VALUES (?, ?)",
+            (block_number, block_hash),
+        )
+        # Only recent checkpoints are ever compared against the chain
+        self._conn.execute(
+            "DELETE FROM checkpoints WHERE block_number < ?",
+            (block_number - _CHECKPOINT_RETENTION_BLOCKS,),
+        )
+
+    def _apply_event(self, event: TicketEvent) -> None:
+        status = _EVENT_STATUS.get(event.name)
+        if event.name == "TicketMinted":
+            self._conn.execute(
+                "INSERT INTO tickets VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (token_id) DO UPDATE SET owner = excluded.owner, "
+                "status = excluded.status, minted_block = excluded.minted_block, "
+                "updated_block = excluded.updated_block",
+                (
+                    event.token_id,
+                    event.to_address,
+                    status,
+                    event.block_number,
+                    event.block_number,
+                ),
+            )
+        elif event.name == "Transfer":
+            # The mint's Transfer comes before its TicketMinted
+            self._conn.execute(
+                "INSERT INTO tickets VALUES (?, ?, 'Valid', NULL, ?) "
+                "ON CONFLICT (token_id) DO UPDATE SET owner = excluded.owner, "
+                "updated_block = excluded.updated_block",
+                (event.token_id, event.to_address, event.block_number),
+            )
+        elif status is not None:
+            self._conn.execute(
+                "UPDATE tickets SET status = ?, updated_block = ? WHERE token_id = ?",
+                (status, event.block_number, event.token_id),
+            )
+
+    def rollback(self, block_number: int, block_hash: Optional[str]) -> None:
+        """
+        Forget everything after a block, e.g. after a reorganization.
+
+        Tickets touched by the dropped events are rebuilt from the events
+        that remain, and the block becomes the new checkpoint.
+
+        Args:
+            block_number: Last block to keep
+            block_hash: Current hash of that block, or None to resume from
+                        the latest checkpoint still kept
+        """
+        with self._lock, self._conn:
+            affected = [
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT DISTINCT token_id FROM events WHERE block_number > ?",
+                    (block_number,),
+                )
+            ]
+            self._conn.execute(
+                "DELETE FROM events WHERE block_number > ?", (block_number,)
+            )
+            self._conn.execute(
+                "DELETE FROM checkpoints WHERE block_number > ?", (block_number,)
+            )
+            for token_id in affected:
+                self._conn.execute(
+                    "DELETE FROM tickets WHERE token_id = ?", (token_id,)
+                )
+                for row in self._conn.execute(
+                    "SELECT block_number, log_index, block_hash, transaction_hash, "
+                    "name, token_id, to_address FROM events WHERE token_id = ? "
+                    "ORDER BY block_number, log_index",
+                    (token_id,),
+                ).fetchall():
+                    self._apply_event(TicketEvent(*row))
+            if block_hash is not None:
+                self._set_checkpoint(block_number, block_hash)
+
+    def get_ticket(self, token_id: int) -> Optional[IndexedTicket]:
+        """Get the indexed state of a ticket, or None if not indexed yet."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT token_id, owner, status, minted_block, updated_block "
+                "FROM tickets WHERE token_id = ?",
+                (token_id,),
+            ).fetchone()
+        return IndexedTicket(*row) if row else None
+
+    def get_tickets(self, token_ids: list[int]) -> dict[int, IndexedTicket]:
+        """Get the indexed state of many tickets; unindexed ones are left out."""
+        found: dict[int, IndexedTicket] = {}
+        with self._lock:
+            for start in range(0, len(token_ids), _MAX_PARAMS):
+                chunk = token_ids[start : start + _MAX_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                for row in self._conn.execute(
+                    "SELECT token_id, owner, status, minted_block, updated_block "
+                    f"FROM tickets WHERE token_id IN ({placeholders})",
+                    chunk,
+                ):
+                    found[row[0]] = IndexedTicket(*row)
+        return found
+
+    def stats(self) -> dict[str, Any]:
+        """Index size and progress, for monitoring."""
+        checkpoint = self.checkpoint()
+        with self._lock:
+            (tickets,) = self._conn.execute("SELECT COUNT(*) FROM tickets").fetchone()
+        return {
+            "tickets": tickets,
+            "checkpoint_block": checkpoint[0] if checkpoint else None,
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -1,82 +1,280 @@
 """
 Ticket registry for mapping off-chain ticket IDs to on-chain token IDs.
 
-This module provides a simple in-memory storage for development.
-In production, this would be replaced with a proper database.
+This module provides a simple in-memory storage for development. Each
+ticket's event and mint-time metadata are recorded alongside its token ID,
+with an event -> tickets index for paginated listing. Set
+``TICKET_REGISTRY_COMPACT=true`` to hold it in a
+:class:`~src.datastore.compact_map.CompactTicketMap` instead of a dict
+(several times smaller at millions of tickets, slower point lookups), or
+``TICKET_REGISTRY_BACKEND=sqlite`` to use the SQLite registry at
+``DATABASE_URL`` instead.
 """
 
-import json
-from pathlib import Path
-from typing import Optional
+import threading
+from collections.abc import Iterable
+from typing import Any, Optional, Union
 
 from src.config import settings
 
+from .compact_map import CompactTicketMap
+from .journal import Record, RegistryJournal, SnapshotState
+from .records import RegisteredTicket, TicketPage
+from .sqlite_registry import SQLiteTicketRegistry, sqlite_path_from_url
+from .ticket_table import TicketTable
+
 
 class TicketRegistry:
     """Simple registry for mapping ticket IDs to blockchain token IDs."""
 
-    def __init__(self, storage_path: Optional[str] = None):
+    def __init__(
+        self,
+        storage_path: Optional[str] = None,
+        compact: bool = False,
+        capacity: int = 0,
+    ):
         """
         Initialize the ticket registry.
 
         Args:
             storage_path: Optional path to persist the registry to disk
+            compact: Store ticket IDs in a CompactTicketMap instead of a dict
+            capacity: Expected number of tickets, to presize a compact map
         """
+        self._compact = compact
+        self._capacity = capacity
+        # Taken by every change and by the journal writer's snapshot copy
+        self._lock = threading.Lock()
+        self._reset()
+        self._journal: Optional[RegistryJournal] = None
         self.storage_path = storage_path
-        self._registry: dict[str, int] = {}
 
-        # Load existing data if storage path provided
-        if self.storage_path and Path(self.storage_path).exists():
+    def _reset(self) -> None:
+        # Ticket ID -> row number in the ticket table. The compact map numbers
+        # its entries in insertion order, which is also the row order, so it
+        # can turn rows back into ticket IDs; the dict needs a list for that.
+        self._rows: Union[dict[str, int], CompactTicketMap] = (
+            CompactTicketMap(self._capacity) if self._compact else {}
+        )
+        self._ticket_ids: Optional[list[str]] = None if self._compact else []
+        self._table = TicketTable()
+
+    @property
+    def storage_path(self) -> Optional[str]:
+        """Snapshot path the registry is persisted to, if any."""
+        return self._storage_path
+
+    @storage_path.setter
+    def storage_path(self, storage_path: Optional[str]) -> None:
+        if self._journal is not None:
+            self._journal.close()
+        self._storage_path = storage_path
+        self._journal = None
+        if storage_path:
+            self._journal = RegistryJournal(
+                storage_path,
+                snapshot_state=self._snapshot_state,
+                compact_every=settings.ticket_registry_compact_every,
+            )
             self._load_from_disk()
 
-    def register_ticket(self, ticket_id: str, token_id: int) -> None:
-        """Register a mapping from ticket ID to token ID."""
-        self._registry[ticket_id] = token_id
-        if self.storage_path:
-            self._save_to_disk()
+    def register_ticket(
+        self,
+        ticket_id: str,
+        token_id: int,
+        event_id: Optional[str] = None,
+        metadata: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """Register a mapping from ticket ID to token ID, with its event."""
+        self.register_tickets(
+            [RegisteredTicket(ticket_id, token_id, event_id, metadata)]
+        )
+
+    def register_many(
+        self, mappings: dict[str, int], event_id: Optional[str] = None
+    ) -> None:
+        """Register many ticket ID to token ID mappings in one write."""
+        self.register_tickets(
+            RegisteredTicket(ticket_id, token_id, event_id)
+            for ticket_id, token_id in mappings.items()
+        )
+
+    def register_tickets(self, tickets: Iterable[RegisteredTicket]) -> None:
+        """Register many tickets, each with its own event and metadata."""
+        records = []
+        with self._lock:
+            for ticket in tickets:
+                self._set(
+                    ticket.ticket_id, ticket.token_id, ticket.event_id, ticket.metadata
+                )
+                records.append(_set_record(ticket))
+        if self._journal is not None:
+            for record in records:
+                self._journal.append(record)
+
+    def _set(
+        self,
+        ticket_id: str,
+        token_id: int,
+        event_id: Optional[str] = None,
+        metadata: Optional[dict[str, Any]] = None,
+    ) -> None:
+        row = self._rows.get(ticket_id)
+        if row is None:
+            self._rows[ticket_id] = self._table.append(token_id, event_id, metadata)
+            if self._ticket_ids is not None:
+                self._ticket_ids.append(ticket_id)
+        else:
+            self._table.update(row, token_id, event_id, metadata)
+
+    async def flush(self) -> None:
+        """
+        Wait until every change so far is on disk.
+
+        Changes are written by a background thread that batches concurrent
+        writers into one fsync, so awaiting this does not block the loop.
+        """
+        if self._journal is not None:
+            await self._journal.wait_durable()
 
     def get_token_id(self, ticket_id: str) -> Optional[int]:
         """Get the token ID for a given ticket ID."""
-        return self._registry.get(ticket_id)
+        row = self._rows.get(ticket_id)
+        return self._table.token_id(row) if row is not None else None
+
+    def get_many(self, ticket_ids: Iterable[str]) -> dict[str, int]:
+        """Get the token IDs of many tickets; unknown tickets are left out."""
+        rows, table = self._rows, self._table
+        found = {}
+        for ticket_id in ticket_ids:
+            row = rows.get(ticket_id)
+            if row is not None:
+                found[ticket_id] = table.token_id(row)
+        return found
+
+    def get_ticket(self, ticket_id: str) -> Optional[RegisteredTicket]:
+        """Get a ticket with the event and metadata recorded at mint time."""
+        row = self._rows.get(ticket_id)
+        return self._ticket_at(row, ticket_id) if row is not None else None
+
+    def _ticket_at(self, row: int, ticket_id: str) -> RegisteredTicket:
+        table = self._table
+        return RegisteredTicket(
+            ticket_id, table.token_id(row), table.event_id(row), table.metadata(row)
+        )
+
+    def _ticket_id_at(self, row: int) -> str:
+        if self._ticket_ids is not None:
+            return self._ticket_ids[row]
+        assert isinstance(self._rows, CompactTicketMap)
+        return self._rows.key_at(row)
+
+    def list_event_tickets(
+        self, event_id: str, cursor: Optional[str] = None, limit: int = 100
+    ) -> TicketPage:
+        """
+        List an event's tickets in registration order, one page at a time.
+
+        Args:
+            event_id: Event to list
+            cursor: ``next_cursor`` of the previous page, None for the first
+            limit: Maximum number of tickets in the page
+
+        Returns:
+            The page; its ``next_cursor`` is None on the last page
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        position = _parse_cursor(cursor)
+        rows, next_position = self._table.event_rows(event_id, position, limit)
+        return TicketPage(
+            tickets=[self._ticket_at(row, self._ticket_id_at(row)) for row in rows],
+            next_cursor=str(next_position) if next_position is not None else None,
+            cursors=[str(position + i) for i in range(1, len(rows) + 1)],
+        )
 
     def exists(self, ticket_id: str) -> bool:
         """Check if a ticket ID is registered."""
-        return ticket_id in self._registry
+        return ticket_id in self._rows
 
     def clear(self) -> None:
         """Clear all entries from the registry. Used for testing."""
-        self._registry.clear()
-        if self.storage_path:
-            self._save_to_disk()
+        with self._lock:
+            self._reset()
+        if self._journal is not None:
+            self._journal.append(["clear"])
+
+    def close(self) -> None:
+        """Write out queued changes and stop the journal writer."""
+        if self._journal is not None:
+            self._journal.close()
+
+    def stats(self) -> dict[str, Any]:
+        """Registry size, memory layout and journal state, for monitoring."""
+        rows = self._rows
+        return {
+            "tickets": len(rows),
+            **self._table.stats(),
+            "layout": "compact" if self._compact else "dict",
+            "compact_bytes": (
+                rows.nbytes() if isinstance(rows, CompactTicketMap) else None
+            ),
+            "journal": self._journal.stats() if self._journal else None,
+        }
+
+    def _snapshot_state(self) -> SnapshotState:
+        """Snapshot entries of a copy of the registry, for the journal."""
+        with self._lock:
+            rows, table = self._rows.copy(), self._table.copy()
+        return (
+            (ticket_id, table.snapshot_value(row)) for ticket_id, row in rows.items()
+        )
+
+    def _apply(self, record: Record) -> None:
+        if record[0] == "set":
+            self._set(*record[1:])
+        elif record[0] == "clear":
+            self._reset()
 
     def _load_from_disk(self) -> None:
-        """Load registry from disk."""
-        if self.storage_path is None:
-            self._registry = {}
-            return
-
-        try:
-            with open(self.storage_path) as f:
-                self._registry = json.load(f)
-        except Exception:
-            # If loading fails, start with empty registry
-            self._registry = {}
-
-    def _save_to_disk(self) -> None:
-        """Save registry to disk."""
-        if self.storage_path is None:
-            return
-
-        try:
-            # Ensure directory exists
-            Path(self.storage_path).parent.mkdir(parents=True, exist_ok=True)
-
-            with open(self.storage_path, "w") as f:
-                json.dump(self._registry, f, indent=2)
-        except Exception:
-            # Silently fail for now - in production, log this
-            pass
+        """Load the snapshot and replay the journal."""
+        assert self._journal is not None
+        with self._lock:
+            self._reset()
+            try:
+                self._journal.load(self._apply)
+            except Exception:
+                # If loading fails, start with empty registry
+                self._reset()
+
+
+def _set_record(ticket: RegisteredTicket) -> Record:
+    """Journal record for a registration."""
+    record: Record = ["set", ticket.ticket_id, ticket.token_id]
+    if ticket.event_id is not None or ticket.metadata is not None:
+        record += [ticket.event_id, ticket.metadata]
+    return record
+
+
+def _parse_cursor(cursor: Optional[str]) -> int:
+    if cursor is None:
+        return 0
+    if not cursor.isdigit():
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return int(cursor)
+
+
+def create_ticket_registry() -> Union[TicketRegistry, SQLiteTicketRegistry]:
+    """Build the registry selected by ``TICKET_REGISTRY_BACKEND``."""
+    if settings.ticket_registry_backend == "sqlite":
+        return SQLiteTicketRegistry(sqlite_path_from_url(settings.database_url))
+    return TicketRegistry(
+        storage_path=settings.ticket_registry_path,
+        compact=settings.ticket_registry_compact,
+        capacity=settings.ticket_registry_capacity,
+    )
 
 
 # Global registry instance - None for tests, file-based for dev
-ticket_registry = TicketRegistry(storage_path=settings.ticket_registry_path)
+ticket_registry = create_ticket_registry()
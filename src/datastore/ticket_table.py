@@ -0,0 +1,150 @@
+"""
+Row-indexed ticket details and the event -> tickets index.
+
+The in-memory registry numbers tickets in registration order and keeps
+everything but the ticket ID in typed columns indexed by that row number:
+token IDs, an interned event number, and metadata as compact JSON in one
+``bytearray``. Each event keeps the row numbers of its tickets in an
+``array('I')`` in registration order, so a page of an event's tickets is a
+slice of that array rather than a scan of the registry.
+"""
+
+import json
+from array import array
+from typing import Any, Optional
+
+_NO_EVENT = 0
+
+
+class TicketTable:
+    """Typed columns of per-ticket details, indexed by row number."""
+
+    def __init__(self) -> None:
+        self._token_ids = array("q")
+        self._events = array("I")  # event number + 1, 0 for none
+        self._metadata = bytearray()
+        self._metadata_start = array("Q")
+        self._metadata_end = array("Q")
+        self._event_names: list[str] = []
+        self._event_numbers: dict[str, int] = {}
+        self._event_rows: list[array] = []
+
+    def __len__(self) -> int:
+        return len(self._token_ids)
+
+    def append(
+        self,
+        token_id: int,
+        event_id: Optional[str] = None,
+        metadata: Optional[dict[str, Any]] = None,
+    ) -> int:
+        """Add a row and return its number."""
+        row = len(self._token_ids)
+        self._token_ids.append(token_id)
+        self._events.append(_NO_EVENT)
+        self._metadata_start.append(0)
+        self._metadata_end.append(0)
+        self.update(row, token_id, event_id, metadata)
+        return row
+
+    def update(
+        self,
+        row: int,
+        token_id: int,
+        event_id: Optional[str] = None,
+        metadata: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """Overwrite a row, moving it to another event if needed."""
+        self._token_ids[row] = token_id
+
+        event = self._intern(event_id) if event_id is not None else _NO_EVENT
+        previous = self._events[row]
+        if event != previous:
+            if previous != _NO_EVENT:
+                # Rare (a ticket re-registered under another event): O(event size)
+                self._event_rows[previous - 1].remove(row)
+            if event != _NO_EVENT:
+                self._event_rows[event - 1].append(row)
+            self._events[row] = event
+
+        if metadata is None:
+            self._metadata_start[row] = self._metadata_end[row] = 0
+        else:
+            # Append-only; an overwritten row's old metadata stays unreferenced
+            encoded = json.dumps(metadata, separators=(",", ":")).encode()
+            self._metadata_start[row] = len(self._metadata)
+            self._metadata += encoded
+            self._metadata_end[row] = len(self._metadata)
+
+    def _intern(self, event_id: str) -> int:
+        event = self._event_numbers.get(event_id)
+        if event is None:
+            self._event_names.append(event_id)
+            self._event_rows.append(array("I"))
+            event = self._event_numbers[event_id] = len(self._event_names)
+        return event
+
+    def token_id(self, row: int) -> int:
+        """Token ID of a row."""
+        return self._token_ids[row]
+
+    def event_id(self, row: int) -> Optional[str]:
+        """Event ID of a row, if recorded."""
+        event = self._events[row]
+        return self._event_names[event - 1] if event != _NO_EVENT else None
+
+    def metadata(self, row: int) -> Optional[dict[str, Any]]:
+        """Metadata of a row, if recorded."""
+        start, end = self._metadata_start[row], self._metadata_end[row]
+        return json.loads(self._metadata[start:end]) if end else None
+
+    def event_rows(
+        self, event_id: str, position: int, limit: int
+    ) -> tuple[list[int], Optional[int]]:
+        """
+        Rows of an event's tickets in registration order.
+
+        Args:
+            event_id: Event to list
+            position: Position in the event's list to start at
+            limit: Maximum number of rows
+
+        Returns:
+            The rows, and the position of the next page or None at the end
+        """
+        event = self._event_numbers.get(event_id)
+        if event is None:
+            return [], None
+        rows = self._event_rows[event - 1]
+        page = rows[position : position + limit].tolist()
+        end = position + len(page)
+        return page, end if end < len(rows) else None
+
+    def event_size(self, event_id: str) -> int:
+        """Number of tickets recorded for an event."""
+        event = self._event_numbers.get(event_id)
+        return len(self._event_rows[event - 1]) if event is not None else 0
+
+    def snapshot_value(self, row: int) -> Any:
+        """A row in the journal snapshot format."""
+        event_id, metadata = self.event_id(row), self.metadata(row)
+        if event_id is None and metadata is None:
+            return self._token_ids[row]
+        return [self._token_ids[row], event_id, metadata]
+
+    def copy(self) -> "TicketTable":
+        """Independent copy; the columns are copied wholesale."""
+        clone = TicketTable.__new__(TicketTable)
+        clone._token_ids = self._token_ids[:]
+        clone._events = self._events[:]
+        clone._metadata = self._metadata[:]
+        clone._metadata_start = self._metadata_start[:]
+        clone._metadata_end = self._metadata_end[:]
+        clone._event_names = self._event_names[:]
+        clone._event_numbers = self._event_numbers.copy()
+        clone._event_rows = [rows[:] for rows in self._event_rows]
+        return clone
+
+    def stats(self) -> dict[str, Any]:
+        """Table size, for monitoring."""
+        return {"events": len(self._event_names), "metadata_bytes": len(self._metadata)}
@@ -0,0 +1,5 @@
+"""Contract event indexer feeding the local ticket index."""
+
+from .event_indexer import EventIndexer
+
+__all__ = ["EventIndexer"]
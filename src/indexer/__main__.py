@@ -0,0 +1,57 @@
+"""
+Run the contract event indexer as its own process.
+
+Usage:
+    poetry run python -m src.indexer
+
+Set ``INDEXER_DB_PATH`` so the index is shared with the API, and
+``INDEXER_ENABLED=false`` for the API so only this process writes to it.
+The indexer always reads the configured node; it exits with an error rather
+than index anything else into the shared database.
+"""
+
+import asyncio
+
+from ..blockchain_service import Web3BlockchainService
+from ..config import settings
+from ..datastore.ticket_index import TicketIndex
+from .event_indexer import EventIndexer
+
+
+async def main() -> None:
+    """Index contract events until interrupted."""
+    if not settings.indexer_db_path:
+        raise SystemExit("INDEXER_DB_PATH must be set to run the indexer")
+
+    try:
+        service = Web3BlockchainService()
+    except Exception as e:
+        raise SystemExit(f"Cannot index contract events: {e}") from e
+    try:
+        await service.connect()
+    except Exception as e:
+        await service.close()
+        raise SystemExit(f"Cannot index contract events: {e}") from e
+
+    index = TicketIndex(settings.indexer_db_path)
+    indexer = EventIndexer(
+        service,
+        index,
+        start_block=settings.indexer_start_block,
+        chunk_size=settings.indexer_chunk_size,
+        reorg_depth=settings.indexer_reorg_depth,
+        poll_interval=settings.indexer_poll_seconds,
+    )
+    await indexer.start()
+    try:
+        while True:
+            await asyncio.sleep(60)
+            print(f"Indexer: {indexer.stats()}")
+    finally:
+        await indexer.stop()
+        index.close()
+        await service.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,171 @@
+"""
+Background indexer following the Ticket contract's events.
+
+Logs are read in block-range chunks starting from the checkpoint persisted in
+the :class:`~src.datastore.ticket_index.TicketIndex`, so a restart resumes
+where the last run stopped. Before each pass the hash of the checkpoint block
+is compared with the chain; if it changed, a reorganization orphaned indexed
+blocks and the index is rolled back ``reorg_depth`` blocks and re-read. Within
+a pass, a chunk is only applied if every block it has events in still has the
+hash its events carry.
+"""
+
+import asyncio
+import contextlib
+import time
+from typing import Any, Optional
+
+from ..blockchain_service.interface import BlockchainServiceInterface, TicketEvent
+from ..datastore.ticket_index import TicketIndex
+
+
+class EventIndexer:
+    """Streams contract events from a blockchain service into a ticket index."""
+
+    def __init__(
+        self,
+        source: BlockchainServiceInterface,
+        index: TicketIndex,
+        start_block: int = 0,
+        chunk_size: int = 2000,
+        reorg_depth: int = 12,
+        poll_interval: float = 2.0,
+    ):
+        """
+        Initialize the indexer.
+
+        Args:
+            source: Blockchain service providing blocks and events
+            index: Store receiving events and ticket state
+            start_block: First block to index (e.g. the deployment block)
+            chunk_size: Most blocks requested in one ``get_ticket_events``
+            reorg_depth: Blocks rolled back when a reorganization is detected
+            poll_interval: Seconds between passes once caught up
+        """
+        self.source = source
+        self.index = index
+        self.start_block = start_block
+        self.chunk_size = chunk_size
+        self.reorg_depth = reorg_depth
+        self.poll_interval = poll_interval
+
+        self._task: Optional[asyncio.Task[None]] = None
+        self._head: Optional[int] = None
+        self._events_indexed = 0
+        self._reorgs = 0
+        self._error_count = 0
+        self._last_error: Optional[str] = None
+        self._last_sync_at: Optional[float] = None
+
+    async def start(self) -> None:
+        """Start indexing in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background indexing."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def sync(self) -> int:
+        """
+        Index everything up to the current head.
+
+        Returns:
+            Number of events indexed
+        """
+        await self._check_reorg()
+        head = await self.source.get_block_number()
+        self._head = head
+
+        indexed = 0
+        checkpoint = self.index.checkpoint()
+        next_block = checkpoint[0] + 1 if checkpoint else self.start_block
+        while next_block <= head:
+            to_block = min(next_block + self.chunk_size - 1, head)
+            block_hash = await self.source.get_block_hash(to_block)
+            events = await self.source.get_ticket_events(next_block, to_block)
+            if block_hash is None or not await self._on_chain(
+                events, to_block, block_hash
+            ):
+                # The chain changed under us; retry on the next pass
+                break
+            await asyncio.to_thread(self.index.apply, events, to_block, block_hash)
+            indexed += len(events)
+            next_block = to_block + 1
+
+        self._events_indexed += indexed
+        self._last_sync_at = time.monotonic()
+        return indexed
+
+    async def _on_chain(
+        self, events: list[TicketEvent], to_block: int, block_hash: str
+    ) -> bool:
+        """Whether every block the events were read from is still canonical."""
+        numbers = sorted({e.block_number for e in events} - {to_block})
+        hashes = dict(
+            zip(
+                numbers,
+                await asyncio.gather(*(self.source.get_block_hash(n) for n in numbers)),
+                strict=True,
+            )
+        )
+        hashes[to_block] = block_hash
+        return all(hashes[e.block_number] == e.block_hash for e in events)
+
+    async def _check_reorg(self) -> None:
+        """Roll back if the checkpoint block is no longer on the chain."""
+        checkpoint = self.index.checkpoint()
+        if checkpoint is None:
+            return
+        block_number, block_hash = checkpoint
+        if await self.source.get_block_hash(block_number) == block_hash:
+            return
+
+        safe_block = max(block_number - self.reorg_depth, self.start_block - 1)
+        safe_hash = (
+            await self.source.get_block_hash(safe_block)
+            if safe_block >= self.start_block
+            else None
+        )
+        await asyncio.to_thread(self.index.rollback, safe_block, safe_hash)
+        self._reorgs += 1
+        print(
+            f"Warning: Reorg detected at block {block_number}, "
+            f"indexer rolled back to block {safe_block}"
+        )
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sync()
+            except Exception as e:
+                # Keep serving the index as it is; try again on the next tick
+                self._error_count += 1
+                self._last_error = str(e)
+            await asyncio.sleep(self.poll_interval)
+
+    def stats(self) -> dict[str, Any]:
+        """Indexing progress, for monitoring."""
+        index_stats = self.index.stats()
+        checkpoint_block = index_stats["checkpoint_block"]
+        return {
+            **index_stats,
+            "head_block": self._head,
+            "lag_blocks": (
+                self._head - checkpoint_block
+                if self._head is not None and checkpoint_block is not None
+                else None
+            ),
+            "events_indexed": self._events_indexed,
+            "reorgs": self._reorgs,
+            "errors": self._error_count,
+            "last_error": self._last_error,
+            "seconds_since_sync": (
+                time.monotonic() - self._last_sync_at if self._last_sync_at else None
+            ),
+        }
@@ -0,0 +1,355 @@
+"""
+Prometheus metrics for TicketChain.
+
+Hot paths (HTTP requests, JSON-RPC calls, mined transactions) record into
+the counters and histograms below. An observation is one bisect and a few
+increments, cheap enough to leave on at full load. Everything else (queue
+depths, registry size, cache hit ratios) is read from the components'
+``stats()`` only when ``/metrics`` is scraped, so it costs nothing in
+between. The text exposition format is written here to avoid a dependency.
+"""
+
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, Optional
+
+# Seconds; from a cached read to a slow RPC call
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+# Gas; from a check-in to a 100-ticket batch mint
+GAS_BUCKETS = (
+    25_000,
+    50_000,
+    100_000,
+    200_000,
+    500_000,
+    1_000_000,
+    2_500_000,
+    5_000_000,
+    10_000_000,
+    30_000_000,
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic count per label set."""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        """Add to the count of a label set."""
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> Iterator[str]:
+        """Exposition lines of the counter."""
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} counter"
+        for labels, value in self._values.items():
+            yield f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}"
+
+
+class _Series:
+    __slots__ = ("counts", "sum")
+
+    def __init__(self, buckets: int):
+        self.counts = [0] * (buckets + 1)  # last one is +Inf
+        self.sum: float = 0
+
+
+class Histogram:
+    """Distribution of observations per label set, in fixed buckets."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._series: dict[tuple[str, ...], _Series] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        """Record one observation for a label set."""
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series.setdefault(labels, _Series(len(self.buckets)))
+        series.counts[bisect_left(self.buckets, value)] += 1
+        series.sum += value
+
+    def count(self, *labels: str) -> int:
+        """Number of observations of a label set."""
+        series = self._series.get(labels)
+        return sum(series.counts) if series is not None else 0
+
+    def render(self) -> Iterator[str]:
+        """Exposition lines of the histogram, with cumulative buckets."""
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} histogram"
+        for labels, series in self._series.items():
+            cumulative = 0
+            for bound, count in zip(
+                (*self.buckets, float("inf")), series.counts, strict=True
+            ):
+                cumulative += count
+                le = f'le="{_number(bound)}"'
+                yield (
+                    f"{self.name}_bucket{_labels(self.labelnames, labels, le)} "
+                    f"{cumulative}"
+                )
+            label_text = _labels(self.labelnames, labels)
+            yield f"{self.name}_sum{label_text} {_number(series.sum)}"
+            yield f"{self.name}_count{label_text} {cumulative}"
+
+
+def gauge(
+    name: str,
+    documentation: str,
+    samples: Iterable[tuple[dict[str, str], Optional[float]]],
+    kind: str = "gauge",
+) -> Iterator[str]:
+    """
+    Exposition lines of a metric read at scrape time.
+
+    Args:
+        name: Metric name
+        documentation: HELP text
+        samples: Label set and value of each sample; None values are skipped
+        kind: Prometheus type, ``gauge`` or ``counter``
+    """
+    lines = [
+        f"{name}{_labels(list(labels), list(labels.values()))} {_number(value)}"
+        for labels, value in samples
+        if value is not None
+    ]
+    if not lines:
+        return
+    yield f"# HELP {name} {documentation}"
+    yield f"# TYPE {name} {kind}"
+    yield from lines
+
+
+class MetricsRegistry:
+    """Metrics recorded by the process, rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: list[Counter | Histogram] = []
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        """Create and register a counter."""
+        metric = Counter(name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Create and register a histogram."""
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def render(self, stats: Optional[dict[str, Any]] = None) -> str:
+        """
+        Text exposition of every metric.
+
+        Args:
+            stats: The service state reported by ``/api/v1/stats``, turned
+                   into gauges
+        """
+        lines: list[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        if stats is not None:
+            lines.extend(_state_metrics(stats))
+        return "\n".join(lines) + "\n"
+
+
+def _get(stats: Optional[dict[str, Any]], *path: str) -> Any:
+    value: Any = stats
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def _state_metrics(stats: dict[str, Any]) -> Iterator[str]:
+    """Gauges read from the ``/api/v1/stats`` dict."""
+    chain = stats.get("blockchain") or {}
+
+    yield from gauge(
+        "ticketchain_registry_tickets",
+        "Tickets in the ticket registry.",
+        [({}, _get(stats, "registry", "tickets"))],
+    )
+    yield from gauge(
+        "ticketchain_nonce_in_flight",
+        "Nonces handed out and not yet confirmed or released.",
+        [({}, _get(chain, "nonce", "in_flight"))],
+    )
+    yield from gauge(
+        "ticketchain_nonce_gaps",
+        "Released nonces waiting to be reused.",
+        [({}, _get(chain, "nonce", "gaps"))],
+    )
+    yield from gauge(
+        "ticketchain_submission_queue_depth",
+        "Transactions waiting for a submission worker.",
+        [({}, _get(chain, "submission_queue", "depth"))],
+    )
+    yield from gauge(
+        "ticketchain_submission_workers_busy",
+        "Submission workers broadcasting a transaction.",
+        [({}, _get(chain, "submission_queue", "busy_workers"))],
+    )
+    yield from gauge(
+        "ticketchain_submission_rejected_total",
+        "Writes rejected with 429 because the submission queue was full.",
+        [({}, _get(chain, "submission_queue", "rejected"))],
+        kind="counter",
+    )
+    yield from gauge(
+        "ticketchain_receipts_waiting",
+        "Broadcast transactions waiting for a confirmed receipt.",
+        [({}, _get(chain, "receipts", "waiting"))],
+    )
+    yield from gauge(
+        "ticketchain_transactions_pending",
+        "Asynchronous writes whose outcome is not known yet.",
+        [({}, _get(stats, "transactions", "pending"))],
+    )
+    yield from gauge(
+        "ticketchain_idempotency_entries",
+        "Write operations remembered for deduplication.",
+        [({}, _get(stats, "idempotency", "entries"))],
+    )
+    yield from gauge(
+        "ticketchain_indexer_lag_blocks",
+        "Blocks the event indexer is behind the chain head.",
+        [({}, _get(stats, "indexer", "lag_blocks"))],
+    )
+
+    caches = {
+        "ticket_state": _get(chain, "ticket_cache"),
+        "block_timestamps": _get(chain, "block_timestamps"),
+        "gas_limits": _get(chain, "gas_limits"),
+    }
+    for metric, key, documentation in (
+        ("hits", "hits", "Lookups served from the cache."),
+        ("misses", "misses", "Lookups that went to the node."),
+    ):
+        yield from gauge(
+            f"ticketchain_cache_{metric}_total",
+            documentation,
+            [({"cache": name}, _get(cache, key)) for name, cache in caches.items()],
+            kind="counter",
+        )
+    yield from gauge(
+        "ticketchain_cache_hit_ratio",
+        "Share of lookups served from the cache.",
+        [({"cache": name}, _get(cache, "hit_ratio")) for name, cache in caches.items()],
+    )
+    yield from gauge(
+        "ticketchain_rpc_reads_collapsed_total",
+        "Reads served by joining an identical call already in flight.",
+        [({}, _get(chain, "single_flight", "collapsed"))],
+        kind="counter",
+    )
+
+    pools = [({"endpoint": "default"}, _get(chain, "connection_pool"))] + [
+        ({"endpoint": endpoint["endpoint"]}, endpoint["connection_pool"])
+        for endpoint in _get(chain, "rpc_routing", "endpoints") or []
+    ]
+    yield from gauge(
+        "ticketchain_rpc_pool_utilization",
+        "Share of the node connection pool in use.",
+        [(labels, _get(pool, "utilization")) for labels, pool in pools],
+    )
+    endpoints = _get(chain, "rpc_routing", "endpoints") or []
+    yield from gauge(
+        "ticketchain_rpc_endpoint_latency_seconds",
+        "EWMA latency of each node endpoint.",
+        [
+            (
+                {"endpoint": e["endpoint"]},
+                e["latency_ms"] / 1000 if e["latency_ms"] is not None else None,
+            )
+            for e in endpoints
+        ],
+    )
+    yield from gauge(
+        "ticketchain_rpc_endpoint_available",
+        "Whether each node endpoint is in rotation.",
+        [({"endpoint": e["endpoint"]}, int(e["available"])) for e in endpoints],
+    )
+
+
+# Process-wide registry and the metrics recorded on hot paths
+registry = MetricsRegistry()
+
+http_request_seconds = registry.histogram(
+    "ticketchain_http_request_duration_seconds",
+    "Time to handle an API request, by route template.",
+    ("method", "route", "status"),
+)
+rpc_request_seconds = registry.histogram(
+    "ticketchain_rpc_request_duration_seconds",
+    "Time for a JSON-RPC call to the node, by method.",
+    ("method",),
+)
+rpc_errors = registry.counter(
+    "ticketchain_rpc_errors_total",
+    "JSON-RPC calls that raised or returned an error, by method.",
+    ("method",),
+)
+gas_used = registry.histogram(
+    "ticketchain_gas_used",
+    "Gas used by mined transactions, by contract function.",
+    ("function",),
+    buckets=GAS_BUCKETS,
+)
@@ -60,6 +60,48 @@ describe('Ticket', function () {
     });
   });
 
+  describe('Batch Minting', function () {
+    it('Should mint one ticket per recipient in a single transaction', async function () {
+      const { ticket, addr1, addr2 } = await loadFixture(deployTicketFixture);
+
+      await expect(ticket.batchMintTicket([addr1.address, addr2.address], ['uri0', 'uri1']))
+        .to.emit(ticket, 'TicketMinted')
+        .withArgs(0, addr1.address)
+        .and.to.emit(ticket, 'TicketMinted')
+        .withArgs(1, addr2.address);
+
+      expect(await ticket.ownerOf(0)).to.equal(addr1.address);
+      expect(await ticket.ownerOf(1)).to.equal(addr2.address);
+      expect(await ticket.tokenURI(1)).to.equal('uri1');
+      expect(await ticket.ticketStatuses(1)).to.equal(0); // TicketStatus.Valid
+    });
+
+    it('Should continue token IDs after single mints', async function () {
+      const { ticket, addr1 } = await loadFixture(deployTicketFixture);
+
+      await ticket.mintTicket(addr1.address, 'uri0');
+      await ticket.batchMintTicket([addr1.address], ['uri1']);
+
+      expect(await ticket.tokenURI(1)).to.equal('uri1');
+    });
+
+    it('Should revert on mismatched array lengths', async function () {
+      const { ticket, addr1 } = await loadFixture(deployTicketFixture);
+
+      await expect(ticket.batchMintTicket([addr1.address], [])).to.be.revertedWith(
+        'Array length mismatch'
+      );
+    });
+
+    it('Should not allow non-owner to batch mint tickets', async function () {
+      const { ticket, addr1 } = await loadFixture(deployTicketFixture);
+
+      await expect(
+        ticket.connect(addr1).batchMintTicket([addr1.address], ['uri'])
+      ).to.be.revertedWithCustomError(ticket, 'OwnableUnauthorizedAccount');
+    });
+  });
+
   describe('State Changes', function () {
     async function mintTicketFixture() {
       const { ticket, owner, addr1, addr2 } = await loadFixture(deployTicketFixture);
@@ -146,6 +188,56 @@ describe('Ticket', function () {
     });
   });
 
+  describe('Batch State Changes', function () {
+    async function mintThreeTicketsFixture() {
+      const { ticket, owner, addr1 } = await loadFixture(deployTicketFixture);
+      await ticket.batchMintTicket(
+        [addr1.address, addr1.address, addr1.address],
+        ['uri0', 'uri1', 'uri2']
+      );
+      return { ticket, owner, addr1 };
+    }
+
+    it('Should check in valid tickets and skip the rest', async function () {
+      const { ticket } = await loadFixture(mintThreeTicketsFixture);
+      await ticket.checkIn(1);
+
+      const tx = ticket.batchCheckIn([0, 1, 2, 999]);
+      await expect(tx).to.emit(ticket, 'TicketCheckedIn').withArgs(0);
+      await expect(tx).to.emit(ticket, 'TicketCheckedIn').withArgs(2);
+
+      expect(await ticket.ticketStatuses(0)).to.equal(1); // TicketStatus.CheckedIn
+      expect(await ticket.ticketStatuses(2)).to.equal(1);
+      expect(await ticket.batchCheckIn.staticCall([0, 1, 2])).to.equal(0);
+    });
+
+    it('Should invalidate valid tickets and skip the rest', async function () {
+      const { ticket } = await loadFixture(mintThreeTicketsFixture);
+      await ticket.checkIn(0);
+
+      expect(await ticket.batchInvalidate.staticCall([0, 1, 2, 999])).to.equal(2);
+      await expect(ticket.batchInvalidate([0, 1, 2]))
+        .to.emit(ticket, 'TicketInvalidated')
+        .withArgs(1);
+
+      expect(await ticket.ticketStatuses(0)).to.equal(1); // still CheckedIn
+      expect(await ticket.ticketStatuses(1)).to.equal(2); // TicketStatus.Invalidated
+    });
+
+    it('Should not allow non-owner to batch check in or invalidate', async function () {
+      const { ticket, addr1 } = await loadFixture(mintThreeTicketsFixture);
+
+      await expect(ticket.connect(addr1).batchCheckIn([0])).to.be.revertedWithCustomError(
+        ticket,
+        'OwnableUnauthorizedAccount'
+      );
+      await expect(ticket.connect(addr1).batchInvalidate([0])).to.be.revertedWithCustomError(
+        ticket,
+        'OwnableUnauthorizedAccount'
+      );
+    });
+  });
+
   describe('Token URI', function () {
     it('Should return correct token URI', async function () {
       const { ticket, addr1 } = await loadFixture(deployTicketFixture);
@@ -0,0 +1,96 @@
+"""Unit tests for batch ticket endpoints."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.main import app
+from src.config import settings
+from src.datastore import ticket_registry
+
+
+def _sold_ticket(ticket_id: str) -> dict:
+    return {
+        "event_id": "event-1",
+        "ticket_id": ticket_id,
+        "user_id": "user-1",
+        "price": 100,
+        "to_address": "0x70997970C51812dc3A010C7d01b50e0d17dc79C8",
+    }
+
+
+@pytest.fixture
+def client():
+    """Create a test client that runs the app lifespan."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_batch_mint_chunks_and_registers(client, monkeypatch):
+    """Test a batch is minted one transaction per chunk and fully registered."""
+    monkeypatch.setattr(settings, "batch_chunk_size", 2)
+    tickets = [_sold_ticket(f"batch-{i}") for i in range(3)]
+
+    response = client.post("/api/v1/tickets/sold/batch", json={"tickets": tickets})
+    assert response.status_code == 201
+    data = response.json()
+
+    assert [t["ticket_id"] for t in data["tickets"]] == [
+        "batch-0",
+        "batch-1",
+        "batch-2",
+    ]
+    assert data["failed"] == []
+    assert len({t["token_id"] for t in data["tickets"]}) == 3
+    assert len({t["transaction_hash"] for t in data["tickets"]}) == 2
+
+    for ticket in data["tickets"]:
+        assert ticket_registry.get_token_id(ticket["ticket_id"]) == ticket["token_id"]
+
+
+def test_batch_mint_rejects_duplicate_ticket_ids(client):
+    """Test a batch mentioning the same ticket twice is rejected."""
+    tickets = [_sold_ticket("dup"), _sold_ticket("dup")]
+
+    response = client.post("/api/v1/tickets/sold/batch", json={"tickets": tickets})
+    assert response.status_code == 422
+
+
+def test_batch_check_in_reports_per_ticket_results(client):
+    """Test one already checked-in or unknown ticket does not fail the batch."""
+    tickets = [_sold_ticket(f"gate-{i}") for i in range(3)]
+    client.post("/api/v1/tickets/sold/batch", json={"tickets": tickets})
+    client.post("/api/v1/tickets/checked-in", json={"ticket_id": "gate-1"})
+
+    response = client.post(
+        "/api/v1/tickets/checked-in/batch",
+        json={"ticket_ids": ["gate-0", "gate-1", "gate-2", "missing"]},
+    )
+    assert response.status_code == 200
+    data = response.json()
+
+    assert data["status"] == "checked_in"
+    assert data["succeeded"] == 2
+    assert data["failed"] == 2
+    success = {r["ticket_id"]: r["success"] for r in data["results"]}
+    assert success == {
+        "gate-0": True,
+        "gate-1": False,
+        "gate-2": True,
+        "missing": False,
+    }
+
+
+def test_batch_invalidate(client, monkeypatch):
+    """Test batch invalidation spread over several chunks."""
+    monkeypatch.setattr(settings, "batch_chunk_size", 2)
+    tickets = [_sold_ticket(f"refund-{i}") for i in range(5)]
+    client.post("/api/v1/tickets/sold/batch", json={"tickets": tickets})
+
+    response = client.post(
+        "/api/v1/tickets/invalidated/batch",
+        json={"ticket_ids": [t["ticket_id"] for t in tickets]},
+    )
+    data = response.json()
+
+    assert data["succeeded"] == 5
+    assert len({r["transaction_hash"] for r in data["results"]}) == 3
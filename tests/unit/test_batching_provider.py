@@ -0,0 +1,158 @@
+"""Unit tests for the JSON-RPC batching provider."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from web3 import AsyncWeb3
+from web3.exceptions import Web3RPCError
+
+from src.blockchain_service.batching_provider import (
+    BatchingHTTPProvider,
+    calling_route,
+)
+
+
+class StubNode:
+    """JSON-RPC stub that records every HTTP request it receives."""
+
+    def __init__(self, accept_batches: bool = True):
+        self.accept_batches = accept_batches
+        self.http_requests: list[Any] = []
+
+    def answer(self, request: dict[str, Any]) -> dict[str, Any]:
+        if request["method"] == "eth_getBalance":
+            return {
+                "jsonrpc": "2.0",
+                "id": request["id"],
+                "error": {"code": -32000, "message": "header not found"},
+            }
+        return {"jsonrpc": "2.0", "id": request["id"], "result": "0x2a"}
+
+    async def handle(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        self.http_requests.append(payload)
+        if isinstance(payload, list):
+            if not self.accept_batches:
+                return web.json_response(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": None,
+                        "error": {"code": -32600, "message": "batch not supported"},
+                    }
+                )
+            # Out of order on purpose: responses are matched by id
+            return web.json_response([self.answer(r) for r in reversed(payload)])
+        return web.json_response(self.answer(payload))
+
+
+async def _serve(node: StubNode) -> AsyncIterator[AsyncWeb3]:
+    app = web.Application()
+    app.router.add_post("/", node.handle)
+    server = TestServer(app)
+    await server.start_server()
+    w3 = AsyncWeb3(BatchingHTTPProvider(str(server.make_url("/"))))
+    yield w3
+    await w3.provider.disconnect()
+    await server.close()
+
+
+@pytest.fixture
+async def node_and_w3() -> AsyncIterator[tuple[StubNode, AsyncWeb3]]:
+    node = StubNode()
+    async for w3 in _serve(node):
+        yield node, w3
+
+
+async def test_calls_in_the_same_tick_share_one_request(node_and_w3):
+    """Test concurrent calls go out as one batch and each gets its result."""
+    node, w3 = node_and_w3
+
+    results = await asyncio.gather(
+        w3.eth.block_number, w3.eth.chain_id, w3.eth.gas_price
+    )
+
+    assert results == [42, 42, 42]
+    assert len(node.http_requests) == 1
+    assert len(node.http_requests[0]) == 3
+    stats = w3.provider.stats.to_dict()
+    assert stats["round_trips_saved"] == 2
+    assert stats["methods"]["eth_chainId"] == {"calls": 1, "batched": 1}
+
+
+async def test_round_trips_saved_are_counted_per_route(node_and_w3):
+    """Test calls are attributed to the API route they were made for."""
+    node, w3 = node_and_w3
+
+    async def read(route: str) -> int:
+        calling_route.set(route)
+        return await w3.eth.block_number
+
+    await asyncio.gather(
+        asyncio.create_task(read("/a")),
+        asyncio.create_task(read("/a")),
+        asyncio.create_task(read("/b")),
+        asyncio.create_task(read("/b")),
+    )
+    await w3.eth.chain_id
+
+    routes = w3.provider.stats.to_dict()["routes"]
+    assert routes["/a"] == {"calls": 2, "batched": 2, "round_trips_saved": 1.5}
+    assert routes["/b"]["round_trips_saved"] == 1.5
+    assert routes["background"] == {"calls": 1, "batched": 0, "round_trips_saved": 0}
+
+
+async def test_errors_are_raised_only_to_their_caller(node_and_w3):
+    """Test one failing call in a batch does not fail the others."""
+    node, w3 = node_and_w3
+
+    balance, block_number = await asyncio.gather(
+        w3.eth.get_balance("0x" + "11" * 20),
+        w3.eth.block_number,
+        return_exceptions=True,
+    )
+
+    assert isinstance(balance, Web3RPCError)
+    assert block_number == 42
+    assert len(node.http_requests) == 1
+
+
+async def test_a_lone_call_is_sent_unbatched(node_and_w3):
+    """Test a single call is not wrapped in a batch."""
+    node, w3 = node_and_w3
+
+    assert await w3.eth.block_number == 42
+
+    assert isinstance(node.http_requests[0], dict)
+
+
+async def test_falls_back_when_the_node_rejects_batches():
+    """Test nodes without batch support still get every call answered."""
+    node = StubNode(accept_batches=False)
+    async for w3 in _serve(node):
+        first = await asyncio.gather(w3.eth.block_number, w3.eth.chain_id)
+        second = await asyncio.gather(w3.eth.block_number, w3.eth.chain_id)
+
+        assert first == second == [42, 42]
+        assert w3.provider.batching_supported is False
+        # One rejected batch, then every call on its own
+        assert len(node.http_requests) == 1 + 2 + 2
+
+
+async def test_batching_resumes_after_a_rejected_batch():
+    """Test a single error reply to a batch only pauses batching for a while."""
+    node = StubNode(accept_batches=False)
+    async for w3 in _serve(node):
+        w3.provider.batch_retry_seconds = 0.05
+        await asyncio.gather(w3.eth.block_number, w3.eth.chain_id)
+        assert w3.provider.batching_supported is False
+
+        await asyncio.sleep(0.06)
+        node.accept_batches = True
+        assert await asyncio.gather(w3.eth.block_number, w3.eth.chain_id) == [42, 42]
+        assert w3.provider.batching_supported is True
+        # Rejected batch, two calls on their own, then one accepted batch
+        assert len(node.http_requests) == 1 + 2 + 1
@@ -0,0 +1,57 @@
+"""Unit tests for the block timestamp cache."""
+
+import asyncio
+
+from src.blockchain_service.block_cache import BlockTimestampCache
+
+
+class FakeNode:
+    """Stands in for get_block(number)["timestamp"]."""
+
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+
+    async def timestamp(self, block_number: int) -> int:
+        self.calls.append(block_number)
+        await asyncio.sleep(0)
+        return 1_700_000_000 + block_number
+
+
+async def test_receipts_in_the_same_block_share_one_lookup():
+    """Test concurrent and repeated lookups of one block hit the node once."""
+    node = FakeNode()
+    cache = BlockTimestampCache(node.timestamp)
+
+    timestamps = await asyncio.gather(*(cache.get(42) for _ in range(10)))
+    assert await cache.get(42) == 1_700_000_042
+
+    assert set(timestamps) == {1_700_000_042}
+    assert node.calls == [42]
+    assert cache.stats()["hits"] == 1
+
+
+async def test_put_fills_the_cache_without_a_lookup():
+    """Test blocks seen by a watcher are served without calling the node."""
+    node = FakeNode()
+    cache = BlockTimestampCache(node.timestamp)
+
+    cache.put(7, 123)
+
+    assert await cache.get(7) == 123
+    assert node.calls == []
+
+
+async def test_least_recently_used_blocks_are_evicted():
+    """Test the cache stays within its bound."""
+    node = FakeNode()
+    cache = BlockTimestampCache(node.timestamp, max_entries=2)
+
+    await cache.get(1)
+    await cache.get(2)
+    await cache.get(1)  # 2 is now the least recently used
+    await cache.get(3)
+
+    assert cache.stats()["entries"] == 2
+    await cache.get(1)
+    await cache.get(2)
+    assert node.calls == [1, 2, 3, 2]
@@ -0,0 +1,114 @@
+"""Unit tests for the keep-alive RPC connection pool."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from web3 import AsyncHTTPProvider, AsyncWeb3
+
+from src.blockchain_service.batching_provider import BatchingHTTPProvider
+from src.blockchain_service.connection_pool import RpcConnectionPool
+
+
+class StubNode:
+    """JSON-RPC stub that records the client connection of each request."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.connections: list[tuple[str, int]] = []
+
+    async def handle(self, request: web.Request) -> web.Response:
+        assert request.transport is not None
+        self.connections.append(request.transport.get_extra_info("peername"))
+        payload = await request.json()
+        await asyncio.sleep(self.delay)
+        return web.json_response(
+            {"jsonrpc": "2.0", "id": payload["id"], "result": "0x2a"}
+        )
+
+
+@pytest.fixture
+async def node() -> AsyncIterator[tuple[StubNode, str]]:
+    stub = StubNode()
+    app = web.Application()
+    app.router.add_post("/", stub.handle)
+    server = TestServer(app)
+    await server.start_server()
+    yield stub, str(server.make_url("/"))
+    await server.close()
+
+
+async def _web3(url: str, pool: RpcConnectionPool, **kwargs: Any) -> AsyncWeb3:
+    provider = AsyncHTTPProvider(url, request_kwargs=pool.request_kwargs(), **kwargs)
+    await pool.attach(provider)
+    return AsyncWeb3(provider)
+
+
+async def test_calls_reuse_one_connection(node):
+    """Test sequential calls share a kept-alive connection."""
+    stub, url = node
+    pool = RpcConnectionPool(size=4)
+    w3 = await _web3(url, pool)
+
+    for _ in range(5):
+        assert await w3.eth.block_number == 42
+    await w3.provider.disconnect()
+
+    assert len(set(stub.connections)) == 1
+    stats = pool.stats()
+    assert stats["connections_created"] == 1
+    assert stats["connections_reused"] == 4
+    assert stats["reuse_ratio"] == 0.8
+    assert stats["in_flight"] == 0
+
+
+async def test_pool_size_bounds_connections(node):
+    """Test concurrent calls beyond the pool size wait for a connection."""
+    stub, url = node
+    stub.delay = 0.05
+    pool = RpcConnectionPool(size=2)
+    w3 = await _web3(url, pool)
+
+    results = await asyncio.gather(*(w3.eth.block_number for _ in range(6)))
+    await w3.provider.disconnect()
+
+    assert results == [42] * 6
+    assert len(set(stub.connections)) == 2
+    stats = pool.stats()
+    assert stats["connections_created"] == 2
+    assert stats["queued_for_connection"] >= 4
+    assert stats["peak_in_flight"] == 6
+
+
+async def test_read_timeout_fails_slow_calls(node):
+    """Test a call is cut off once the node is slower than the read timeout."""
+    stub, url = node
+    stub.delay = 0.3
+    pool = RpcConnectionPool(read_timeout=0.05)
+    w3 = await _web3(url, pool, exception_retry_configuration=None)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await w3.eth.block_number
+    await w3.provider.disconnect()
+
+    assert pool.stats()["in_flight"] == 0
+
+
+async def test_pool_survives_reconnects(node):
+    """Test a new provider gets a fresh session and the counters carry on."""
+    stub, url = node
+    pool = RpcConnectionPool()
+    for _ in range(2):
+        provider = BatchingHTTPProvider(url, request_kwargs=pool.request_kwargs())
+        await pool.attach(provider)
+        # Attaching again keeps the session the provider already has
+        await pool.attach(provider)
+        assert await AsyncWeb3(provider).eth.block_number == 42
+        await provider.disconnect()
+
+    stats = pool.stats()
+    assert stats["sessions_created"] == 2
+    assert stats["connections_created"] == 2
@@ -0,0 +1,149 @@
+"""Unit tests for the contract event indexer, run against the mock backend."""
+
+import time
+from dataclasses import replace
+
+from fastapi.testclient import TestClient
+
+from src.api.main import app
+from src.blockchain_service.interface import TicketEvent
+from src.blockchain_service.mock_service import MockBlockchainService
+from src.config import settings
+from src.datastore.ticket_index import TicketIndex
+from src.indexer import EventIndexer
+
+ALICE = "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"
+BOB = "0x3C44CdDdB6a900fa2b585dd299e03d12FA4293BC"
+
+
+class ForkingMockService(MockBlockchainService):
+    """Mock backend whose latest blocks can be replaced by a competing fork."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._fork_of_block: dict[int, int] = {}
+
+    def _block_hash(self, block_number: int) -> str:
+        fork = self._fork_of_block.get(block_number, 0)
+        return f"0x{block_number:056x}{fork:04x}b10c"
+
+    def reorg(self, depth: int) -> None:
+        """Orphan the last ``depth`` blocks; new blocks get new hashes."""
+        del self._blocks[-depth:]
+        for block_number in range(len(self._blocks), len(self._blocks) + depth):
+            self._fork_of_block[block_number] = (
+                self._fork_of_block.get(block_number, 0) + 1
+            )
+
+
+async def test_indexes_ticket_state_in_chunks():
+    """Test mints, transfers and check-ins end up as materialized state."""
+    service = MockBlockchainService()
+    index = TicketIndex()
+    indexer = EventIndexer(service, index, chunk_size=2)
+
+    await service.batch_mint_tickets([ALICE, ALICE], ["uri-1", "uri-2"])
+    await service.transfer_ticket(1, ALICE, BOB)
+    await service.check_in_ticket(2)
+
+    assert await indexer.sync() == 6
+    ticket_1, ticket_2 = index.get_ticket(1), index.get_ticket(2)
+    assert (ticket_1.owner, ticket_1.status) == (BOB, "Valid")
+    assert (ticket_2.owner, ticket_2.status) == (ALICE, "CheckedIn")
+    assert index.checkpoint()[0] == await service.get_block_number()
+
+
+async def test_resumes_from_the_persisted_checkpoint(tmp_path):
+    """Test a restarted indexer only reads blocks it has not indexed."""
+    service = MockBlockchainService()
+    path = str(tmp_path / "index.db")
+    await service.mint_ticket(ALICE, "uri-1")
+    first = TicketIndex(path)
+    await EventIndexer(service, first).sync()
+    first.close()
+
+    await service.invalidate_ticket(1)
+    restarted = TicketIndex(path)
+
+    assert await EventIndexer(service, restarted).sync() == 1
+    assert restarted.get_ticket(1).status == "Invalidated"
+
+
+async def test_rolls_back_orphaned_blocks_on_reorg():
+    """Test state from orphaned blocks is undone and the fork is indexed."""
+    service = ForkingMockService()
+    index = TicketIndex()
+    indexer = EventIndexer(service, index, reorg_depth=3)
+
+    await service.mint_ticket(ALICE, "uri-1")
+    await service.transfer_ticket(1, ALICE, BOB)
+    await service.check_in_ticket(1)
+    await indexer.sync()
+    assert index.get_ticket(1).status == "CheckedIn"
+
+    # The transfer and check-in are orphaned; the fork invalidates instead
+    service.reorg(depth=2)
+    await service.invalidate_ticket(1)
+    await indexer.sync()
+
+    ticket = index.get_ticket(1)
+    assert (ticket.owner, ticket.status) == (ALICE, "Invalidated")
+    assert indexer.stats()["reorgs"] == 1
+
+
+async def test_chunk_with_stale_events_is_not_applied():
+    """Test events from an orphaned block inside a chunk are not indexed."""
+    service = ForkingMockService()
+    index = TicketIndex()
+    indexer = EventIndexer(service, index, chunk_size=10)
+    await service.mint_ticket(ALICE, "uri-1")
+    await service.check_in_ticket(1)
+    await service.mint_ticket(ALICE, "uri-2")
+
+    # Logs served by a node still on another fork of the first block
+    fresh_events = service.get_ticket_events
+
+    async def stale_events(from_block: int, to_block: int) -> list[TicketEvent]:
+        return [
+            replace(e, block_hash="0xorphaned") if e.block_number == 1 else e
+            for e in await fresh_events(from_block, to_block)
+        ]
+
+    service.get_ticket_events = stale_events
+    assert await indexer.sync() == 0
+    assert index.checkpoint() is None
+
+    service.get_ticket_events = fresh_events
+    assert await indexer.sync() == 5
+    assert index.get_ticket(1).status == "CheckedIn"
+
+
+def test_ticket_reads_are_served_from_the_index(monkeypatch):
+    """Test the read endpoint answers from the index once it has caught up."""
+    monkeypatch.setattr(settings, "indexer_enabled", True)
+    monkeypatch.setattr(settings, "indexer_poll_seconds", 0.01)
+    with TestClient(app) as client:
+        client.post(
+            "/api/v1/tickets/sold",
+            json={
+                "event_id": "event-1",
+                "ticket_id": "indexed-1",
+                "user_id": "user-1",
+                "price": 100,
+                "to_address": ALICE,
+            },
+        )
+
+        deadline = time.monotonic() + 5
+        while True:
+            response = client.get("/api/v1/tickets/indexed-1")
+            if response.json()["source"] == "index" or time.monotonic() > deadline:
+                break
+            time.sleep(0.01)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["source"] == "index"
+        assert data["status"] == "valid"
+        assert data["owner_address"] == ALICE
+        assert client.get("/api/v1/stats").json()["indexer"]["tickets"] >= 1
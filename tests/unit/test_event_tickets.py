@@ -0,0 +1,129 @@
+"""Unit tests for event-level ticket listing and recorded sale details."""
+
+import json
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.main import app
+from src.config import settings
+
+ALICE = "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"
+BOB = "0x3C44CdDdB6a900fa2b585dd299e03d12FA4293BC"
+
+
+def _sold_ticket(ticket_id: str, event_id: str) -> dict:
+    return {
+        "event_id": event_id,
+        "ticket_id": ticket_id,
+        "user_id": "user-1",
+        "price": 100,
+        "to_address": ALICE,
+    }
+
+
+@pytest.fixture
+def client():
+    """Create a test client that runs the app lifespan."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_event_tickets_are_paginated(client):
+    """Test an event's tickets are listed page by page without overlap."""
+    tickets = [_sold_ticket(f"concert-{i}", "concert") for i in range(5)]
+    tickets.append(_sold_ticket("play-0", "play"))
+    client.post("/api/v1/tickets/sold/batch", json={"tickets": tickets})
+
+    listed, cursor = [], None
+    for _ in range(3):
+        params = {"limit": 2} | ({"cursor": cursor} if cursor else {})
+        response = client.get("/api/v1/events/concert/tickets", params=params)
+        assert response.status_code == 200
+        page = response.json()
+        listed += [ticket["ticket_id"] for ticket in page["tickets"]]
+        cursor = page["next_cursor"]
+
+    assert listed == [f"concert-{i}" for i in range(5)]
+    assert cursor is None
+    first = client.get("/api/v1/events/concert/tickets").json()["tickets"][0]
+    assert first["metadata"] == {"user_id": "user-1", "price": 100, "to_address": ALICE}
+
+
+def test_unknown_event_and_bad_cursor(client):
+    """Test an unknown event is an empty page and a bad cursor a 400."""
+    response = client.get("/api/v1/events/nothing/tickets")
+    assert response.json() == {
+        "event_id": "nothing",
+        "tickets": [],
+        "next_cursor": None,
+    }
+
+    response = client.get("/api/v1/events/nothing/tickets", params={"cursor": "x"})
+    assert response.status_code == 400
+
+
+def test_state_changes_report_the_recorded_event(client):
+    """Test resale and check-in responses carry the event recorded at mint."""
+    client.post("/api/v1/tickets/sold", json=_sold_ticket("gala-1", "gala"))
+
+    resold = client.post(
+        "/api/v1/tickets/resold",
+        json={
+            "ticket_id": "gala-1",
+            "user_id": "user-2",
+            "price": 150,
+            "to_address": BOB,
+        },
+    )
+    checked_in = client.post("/api/v1/tickets/checked-in", json={"ticket_id": "gala-1"})
+
+    assert resold.json()["event_id"] == "gala"
+    assert checked_in.json()["event_id"] == "gala"
+
+
+def test_export_streams_ndjson_and_resumes(client, monkeypatch):
+    """Test the export spans several pages and resumes from a row's cursor."""
+    monkeypatch.setattr(settings, "export_page_size", 2)
+    tickets = [_sold_ticket(f"fest-{i}", "fest") for i in range(5)]
+    client.post("/api/v1/tickets/sold/batch", json={"tickets": tickets})
+
+    response = client.get(
+        "/api/v1/events/fest/tickets/export", headers={"Accept-Encoding": "identity"}
+    )
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert "content-encoding" not in response.headers
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["ticket_id"] for row in rows] == [f"fest-{i}" for i in range(5)]
+    assert rows[0]["metadata"]["price"] == 100
+
+    resumed = client.get(
+        "/api/v1/events/fest/tickets/export", params={"cursor": rows[2]["cursor"]}
+    )
+    assert [json.loads(line)["ticket_id"] for line in resumed.text.splitlines()] == [
+        "fest-3",
+        "fest-4",
+    ]
+
+
+def test_export_is_gzipped_and_includes_indexed_state(monkeypatch):
+    """Test gzip is negotiated and rows carry owner and status from the index."""
+    monkeypatch.setattr(settings, "indexer_enabled", True)
+    monkeypatch.setattr(settings, "indexer_poll_seconds", 0.01)
+    with TestClient(app) as client:
+        client.post("/api/v1/tickets/sold", json=_sold_ticket("zip-1", "zip"))
+
+        deadline = time.monotonic() + 5
+        while True:
+            response = client.get(
+                "/api/v1/events/zip/tickets/export",
+                headers={"Accept-Encoding": "gzip"},
+            )
+            row = json.loads(response.text)
+            if row["status"] is not None or time.monotonic() > deadline:
+                break
+            time.sleep(0.01)
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert (row["owner_address"], row["status"]) == (ALICE, "valid")
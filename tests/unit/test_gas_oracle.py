@@ -0,0 +1,93 @@
+"""Unit tests for the gas fee oracle."""
+
+import asyncio
+
+from src.blockchain_service.gas_oracle import GasOracle
+
+GWEI = 10**9
+
+
+class FakeNode:
+    """Serves fee history, gas price and block number like a node would."""
+
+    def __init__(self, base_fee: int = 30 * GWEI, supports_1559: bool = True):
+        self.base_fee = base_fee
+        self.supports_1559 = supports_1559
+        self.block = 100
+        self.fee_history_calls = 0
+
+    async def fee_history(self, count, newest, percentiles):
+        self.fee_history_calls += 1
+        if not self.supports_1559:
+            raise ValueError("the method eth_feeHistory does not exist")
+        return {
+            "baseFeePerGas": [self.base_fee] * (count + 1),
+            "reward": [[1 * GWEI], [2 * GWEI], [3 * GWEI]],
+        }
+
+    async def gas_price(self):
+        return 50 * GWEI
+
+    async def block_number(self):
+        return self.block
+
+
+def _oracle(node: FakeNode, **kwargs) -> GasOracle:
+    return GasOracle(node.fee_history, node.gas_price, node.block_number, **kwargs)
+
+
+async def test_eip1559_quote_from_fee_history():
+    """Test fees are derived from the base fee and median priority reward."""
+    oracle = _oracle(FakeNode())
+
+    quote = await oracle.current()
+
+    assert quote.is_eip1559
+    assert quote.max_priority_fee_per_gas == 2 * GWEI
+    assert quote.max_fee_per_gas == 2 * 30 * GWEI + 2 * GWEI
+    assert quote.transaction_fields() == {
+        "maxFeePerGas": 62 * GWEI,
+        "maxPriorityFeePerGas": 2 * GWEI,
+    }
+
+
+async def test_legacy_fallback_and_priority_floor():
+    """Test nodes without fee history get a legacy gas price."""
+    oracle = _oracle(FakeNode(supports_1559=False))
+    assert (await oracle.current()).transaction_fields() == {"gasPrice": 50 * GWEI}
+
+    floored = _oracle(FakeNode(), min_priority_fee=25 * GWEI)
+    assert (await floored.current()).max_priority_fee_per_gas == 25 * GWEI
+
+
+async def test_current_is_served_from_memory():
+    """Test the hot path does not hit the node once a quote exists."""
+    node = FakeNode()
+    oracle = _oracle(node)
+
+    await oracle.current()
+    await oracle.current()
+
+    assert node.fee_history_calls == 1
+    assert oracle.stats()["age_seconds"] >= 0
+
+
+async def test_background_refresh_tracks_fee_changes():
+    """Test the TTL loop picks up a fee spike and only on new blocks if asked."""
+    node = FakeNode()
+    oracle = _oracle(node, ttl_seconds=0.01, refresh_on_block=True)
+    await oracle.start()
+
+    node.base_fee = 100 * GWEI
+    await asyncio.sleep(0.05)
+    # First tick refreshes (no block seen yet); later ticks wait for a new block
+    calls = node.fee_history_calls
+    await asyncio.sleep(0.05)
+    assert node.fee_history_calls == calls
+
+    node.block += 1
+    node.base_fee = 10 * GWEI
+    await asyncio.sleep(0.05)
+    await oracle.stop()
+
+    assert (await oracle.current()).base_fee_per_gas == 10 * GWEI
@@ -0,0 +1,78 @@
+"""Unit tests for the learned gas limit profile."""
+
+from src.blockchain_service.gas_profile import (
+    PROFILED_FUNCTIONS,
+    GasLimitProfile,
+    is_out_of_gas_error,
+)
+
+CHECK_IN = "0xe95a644f"
+MINT = "0x5388842c"
+
+
+def test_miss_until_observed_then_served_with_margin():
+    """Test a function is estimated once and then served from the profile."""
+    profile = GasLimitProfile(safety_margin=1.2)
+
+    assert profile.get(CHECK_IN, 36) is None
+    profile.record(CHECK_IN, 36, 50_000)
+
+    assert profile.get(CHECK_IN, 36) == 60_000
+    assert profile.stats()["hits"] == 1
+    assert profile.stats()["misses"] == 1
+
+
+def test_headroom_covers_a_first_time_holder():
+    """Test served limits leave room for a zero-to-nonzero balance write."""
+    profile = GasLimitProfile(safety_margin=1.0, headroom=20_000)
+    # Learned from a mint to a holder who already had tickets
+    profile.record(MINT, 164, 120_000)
+
+    # A first-time holder costs about 17k more
+    assert profile.get(MINT, 164) >= 120_000 + 17_100
+
+
+def test_larger_calldata_than_observed_is_estimated():
+    """Test a call bigger than anything seen in its bucket is not guessed."""
+    profile = GasLimitProfile(bucket_bytes=256)
+    profile.record(CHECK_IN, 100, 80_000)
+
+    assert profile.get(CHECK_IN, 90) is not None
+    assert profile.get(CHECK_IN, 120) is None
+    # Other buckets are learned separately
+    assert profile.get(CHECK_IN, 300) is None
+
+
+def test_keeps_the_largest_gas_seen():
+    """Test receipts using less gas than the estimate do not lower the limit."""
+    profile = GasLimitProfile(safety_margin=1.0)
+    profile.record(CHECK_IN, 36, 50_000)
+    profile.record(CHECK_IN, 36, 42_000)
+
+    assert profile.get(CHECK_IN, 36) == 50_000
+
+
+def test_invalidate_forces_a_fresh_estimate():
+    """Test a revert or out-of-gas error drops the learned limit."""
+    profile = GasLimitProfile()
+    profile.record(CHECK_IN, 36, 50_000)
+
+    profile.invalidate(CHECK_IN, 36)
+
+    assert profile.get(CHECK_IN, 36) is None
+    assert profile.stats()["invalidations"] == 1
+
+
+def test_is_out_of_gas_error():
+    """Test detection of gas limit errors reported by nodes."""
+    assert is_out_of_gas_error(Exception("intrinsic gas too low"))
+    assert is_out_of_gas_error(Exception("execution reverted: out of gas"))
+    assert not is_out_of_gas_error(Exception("nonce too low"))
+
+
+def test_batch_functions_are_estimated_live():
+    """Test batch functions, whose gas depends on ticket state, are not profiled."""
+    assert {"checkIn", "invalidate", "mintTicket"} <= PROFILED_FUNCTIONS
+    assert (
+        not {"batchCheckIn", "batchInvalidate", "batchMintTicket"} & PROFILED_FUNCTIONS
+    )
@@ -0,0 +1,156 @@
+"""Unit tests for deduplication of retried write requests."""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from src.api.idempotency import IdempotencyStore
+from src.api.main import app
+from src.blockchain_service.interface import PendingTransaction
+from src.blockchain_service.mock_service import MockBlockchainService
+
+ALICE = "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"
+
+
+def _sold_ticket(ticket_id: str, price: int = 100) -> dict:
+    return {
+        "event_id": "event-1",
+        "ticket_id": ticket_id,
+        "user_id": "user-1",
+        "price": price,
+        "to_address": ALICE,
+    }
+
+
+@pytest.fixture
+def client():
+    """Create a test client that runs the app lifespan."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+async def test_concurrent_duplicates_share_one_execution():
+    """Test duplicates arriving in flight attach to the running operation."""
+    store = IdempotencyStore()
+    calls = 0
+
+    async def operation() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "minted"
+
+    results = await asyncio.gather(*(store.run("k", "f", operation) for _ in range(5)))
+
+    assert calls == 1
+    assert [r[0] for r in results] == ["minted"] * 5
+    assert sorted(r[1] for r in results) == [False] + [True] * 4
+    assert store.stats()["attached"] == 4
+
+
+async def test_failures_are_not_stored_and_entries_expire():
+    """Test a failed operation runs again on retry, and entries have a TTL."""
+    store = IdempotencyStore(ttl_seconds=0.01)
+
+    async def failing() -> str:
+        raise HTTPException(status_code=500, detail="node down")
+
+    async def succeeding() -> str:
+        return "ok"
+
+    with pytest.raises(HTTPException):
+        await store.run("k", "f", failing)
+    assert await store.run("k", "f", succeeding) == ("ok", False)
+    assert await store.run("k", "f", succeeding) == ("ok", True)
+
+    await asyncio.sleep(0.02)
+    assert await store.run("k", "f", succeeding) == ("ok", False)
+
+
+def test_retried_sale_replays_the_first_response(client):
+    """Test a retried sale returns the same ticket without minting again."""
+    first = client.post("/api/v1/tickets/sold", json=_sold_ticket("idem-1"))
+    retry = client.post("/api/v1/tickets/sold", json=_sold_ticket("idem-1"))
+    other = client.post("/api/v1/tickets/sold", json=_sold_ticket("idem-2"))
+
+    assert retry.json() == first.json()
+    assert retry.headers["idempotent-replayed"] == "true"
+    assert "idempotent-replayed" not in first.headers
+    # No mint happened between the first sale and the next ticket
+    assert other.json()["token_id"] == first.json()["token_id"] + 1
+
+
+def test_idempotency_key_header(client):
+    """Test the header dedupes resales and rejects reuse for another request."""
+    client.post("/api/v1/tickets/sold", json=_sold_ticket("idem-3"))
+    resale = {"ticket_id": "idem-3", "user_id": "u", "price": 1, "to_address": ALICE}
+    headers = {"Idempotency-Key": "resale-1"}
+
+    first = client.post("/api/v1/tickets/resold", json=resale, headers=headers)
+    retry = client.post("/api/v1/tickets/resold", json=resale, headers=headers)
+    reused = client.post(
+        "/api/v1/tickets/sold", json=_sold_ticket("idem-4"), headers=headers
+    )
+
+    assert retry.json()["transaction_hash"] == first.json()["transaction_hash"]
+    assert reused.status_code == 422
+    assert client.get("/api/v1/stats").json()["idempotency"]["replayed"] >= 1
+
+
+def test_async_mode_replays_the_accepted_response(client):
+    """Test a retried wait=false sale gets the same transaction handle."""
+    first = client.post(
+        "/api/v1/tickets/sold", params={"wait": False}, json=_sold_ticket("idem-5")
+    )
+    retry = client.post(
+        "/api/v1/tickets/sold", params={"wait": False}, json=_sold_ticket("idem-5")
+    )
+
+    assert first.status_code == retry.status_code == 202
+    assert retry.json()["transaction_hash"] == first.json()["transaction_hash"]
+    assert retry.headers["idempotent-replayed"] == "true"
+
+
+def test_accepted_response_is_dropped_when_the_transaction_fails(client, monkeypatch):
+    """Test a 202 is not replayed once its background transaction has failed."""
+
+    async def reverted() -> dict:
+        raise Exception("Transaction reverted")
+
+    async def failing_mint(self, to_address: str, token_uri: str):
+        return PendingTransaction(transaction_hash="0xfailed", outcome=reverted())
+
+    monkeypatch.setattr(MockBlockchainService, "submit_mint_ticket", failing_mint)
+    accepted = client.post(
+        "/api/v1/tickets/sold", params={"wait": False}, json=_sold_ticket("idem-6")
+    )
+    assert accepted.status_code == 202
+    assert client.get("/api/v1/transactions/0xfailed").json()["status"] == "failed"
+
+    monkeypatch.undo()
+    retry = client.post(
+        "/api/v1/tickets/sold", params={"wait": False}, json=_sold_ticket("idem-6")
+    )
+
+    assert retry.status_code == 202
+    assert "idempotent-replayed" not in retry.headers
+    assert retry.json()["transaction_hash"] != "0xfailed"
+
+
+def test_query_parameters_are_part_of_the_fingerprint(client):
+    """Test reusing a key with a different wait mode is rejected."""
+    headers = {"Idempotency-Key": "sale-wait"}
+    client.post(
+        "/api/v1/tickets/sold",
+        params={"wait": False},
+        json=_sold_ticket("idem-7"),
+        headers=headers,
+    )
+
+    retry = client.post(
+        "/api/v1/tickets/sold", json=_sold_ticket("idem-7"), headers=headers
+    )
+
+    assert retry.status_code == 422
@@ -4,6 +4,9 @@ import pytest
 from fastapi.testclient import TestClient
 
 from src.api.main import app
+from src.blockchain_service.batching_provider import calling_route
+from src.blockchain_service.mock_service import MockBlockchainService
+from src.config import settings
 
 
 @pytest.fixture
@@ -30,3 +33,63 @@ def test_health_endpoint(client):
     assert data["status"] == "healthy"
     assert data["service"] == "ticketchain-api"
     assert data["version"] == "0.1.0"
+
+
+def test_blockchain_service_is_app_scoped():
+    """Test the lifespan hook creates one service shared across requests."""
+    with TestClient(app) as client:
+        service = app.state.blockchain_service
+        assert service is not None
+
+        client.get("/api/v1/health")
+        client.get("/api/v1/health")
+        assert app.state.blockchain_service is service
+
+    # Service is released on shutdown
+    assert app.state.blockchain_service is None
+
+
+def test_stats_endpoint(client):
+    """Test the monitoring endpoint reports service internals."""
+    response = client.get("/api/v1/stats")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["blockchain_service"] == "MockBlockchainService"
+    assert "blockchain" in data
+    assert data["transactions"]["pending"] == 0
+
+
+def test_node_calls_are_attributed_to_the_route(monkeypatch):
+    """Test a request's route is visible to the node calls it makes."""
+    routes = []
+    stats = MockBlockchainService.stats
+
+    def recording_stats(self):
+        routes.append(calling_route.get())
+        return stats(self)
+
+    monkeypatch.setattr(MockBlockchainService, "stats", recording_stats)
+    with TestClient(app) as client:
+        client.get("/api/v1/stats")
+
+    assert routes == ["/api/v1/stats"]
+    assert calling_route.get() == "background"
+
+
+def test_unreachable_node_fails_startup(monkeypatch, tmp_path, unused_tcp_port):
+    """Test a configured contract never falls back to the mock chain."""
+    abi_path = tmp_path / "Ticket.json"
+    abi_path.write_text('{"abi": []}')
+    monkeypatch.setattr(
+        settings,
+        "ticket_contract_address",
+        "0x5FbDB2315678afecb367f032d93F642f64180aa3",
+    )
+    monkeypatch.setattr(settings, "ticket_contract_abi_path", str(abi_path))
+    monkeypatch.setattr(settings, "deployer_private_key", "0x" + "11" * 32)
+    monkeypatch.setattr(settings, "rpc_url", f"http://127.0.0.1:{unused_tcp_port}")
+
+    with pytest.raises(ConnectionError), TestClient(app):
+        pass
+
+    assert app.state.blockchain_service is None
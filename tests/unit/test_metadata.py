@@ -0,0 +1,210 @@
+"""Unit tests for the content-addressed metadata store and endpoint."""
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import stat
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.main import app
+from src.config import settings
+from src.datastore.metadata_store import (
+    MetadataStore,
+    canonical_json,
+    digest_from_uri,
+)
+
+ALICE = "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"
+
+
+def _sold_ticket(ticket_id: str) -> dict:
+    return {
+        "event_id": "concert",
+        "ticket_id": ticket_id,
+        "user_id": "user-1",
+        "price": 100,
+        "to_address": ALICE,
+        "name": f"Seat {ticket_id}",
+    }
+
+
+@pytest.fixture
+def store(monkeypatch, tmp_path):
+    """Fresh off-chain metadata store, as token IDs restart with each mock chain."""
+    monkeypatch.setattr(settings, "token_metadata_storage", "offchain")
+    monkeypatch.setattr(settings, "metadata_store_path", str(tmp_path))
+    monkeypatch.setattr(settings, "metadata_base_url", "https://tickets.example")
+    store = MetadataStore(str(tmp_path))
+    monkeypatch.setattr("src.api.tickets.metadata_store", store)
+    monkeypatch.setattr("src.api.metadata.metadata_store", store)
+    return store
+
+
+@pytest.fixture
+def client(store):
+    """Create a test client that runs the app lifespan."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+async def test_store_is_content_addressed(tmp_path):
+    """Test equal documents share an address whatever their key order."""
+    store = MetadataStore(str(tmp_path))
+    digest = await store.put({"b": 1, "a": [1, 2]})
+
+    assert await store.put({"a": [1, 2], "b": 1}) == digest
+    assert digest == hashlib.sha256(canonical_json({"a": [1, 2], "b": 1})).hexdigest()
+    assert store.get(digest) == b'{"a":[1,2],"b":1}'
+    assert (tmp_path / digest[:2] / f"{digest}.json").exists()
+    assert store.stats()["file_writes"] == 1
+    assert MetadataStore(str(tmp_path)).get(digest) == b'{"a":[1,2],"b":1}'
+    assert store.get("0" * 64) is None
+    assert store.get("../etc/passwd") is None
+    assert list(tmp_path.rglob("*.tmp")) == []
+
+
+async def test_documents_are_fsynced_off_the_event_loop(tmp_path, monkeypatch):
+    """Test a document and its directory entry are synced on a worker thread."""
+    synced = []
+    fsync = os.fsync
+
+    def recording_fsync(fd: int) -> None:
+        synced.append((stat.S_ISDIR(os.fstat(fd).st_mode), threading.current_thread()))
+        fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", recording_fsync)
+    store = MetadataStore(str(tmp_path))
+
+    await store.put({"durable": True})
+
+    # The file, its fan-out directory's creation, and the rename
+    assert [is_dir for is_dir, _ in synced] == [True, False, True]
+    assert all(thread is not threading.main_thread() for _, thread in synced)
+
+    synced.clear()
+    await store.put({"durable": True})
+    assert synced == []
+
+
+def test_token_links_are_bounded():
+    """Test the oldest token links are forgotten beyond max_links."""
+    store = MetadataStore(max_links=2)
+    for token_id in range(3):
+        store.link_token(token_id, "a" * 64)
+
+    assert store.digest_for_token(0) is None
+    assert store.digest_for_token(2) == "a" * 64
+
+
+def test_sold_ticket_puts_short_uri_on_chain(client):
+    """Test a mint's token URI names the stored document, not the JSON."""
+    response = client.post("/api/v1/tickets/sold", json=_sold_ticket("meta-1"))
+    token_id = response.json()["token_id"]
+    token_uri = client.app.state.blockchain_service._tickets[token_id]["token_uri"]
+
+    digest = digest_from_uri(token_uri)
+    assert digest is not None
+    assert token_uri == f"{settings.metadata_base_url}/metadata/{digest}"
+
+    by_digest = client.get(f"/metadata/{digest}")
+    assert by_digest.status_code == 200
+    assert by_digest.headers["content-type"] == "application/json"
+    assert by_digest.headers["etag"] == f'"{digest}"'
+    assert "immutable" in by_digest.headers["cache-control"]
+    document = by_digest.json()
+    assert document["name"] == "Seat meta-1"
+    assert document["ticket_id"] == "meta-1"
+
+    by_token = client.get(f"/metadata/{token_id}")
+    assert by_token.status_code == 200
+    assert by_token.content == by_digest.content
+
+
+def test_metadata_is_resolved_from_chain_when_unlinked(client, store):
+    """Test a token with no remembered link is resolved via its token URI."""
+    response = client.post("/api/v1/tickets/sold", json=_sold_ticket("meta-2"))
+    token_id = response.json()["token_id"]
+    store._links.clear()
+    digest = asyncio.run(store.put({"moved": True}))
+    client.app.state.blockchain_service._tickets[token_id]["token_uri"] = store.uri(
+        digest
+    )
+
+    response = client.get(f"/metadata/{token_id}")
+
+    assert response.status_code == 200
+    assert response.json() == {"moved": True}
+    assert store.digest_for_token(token_id) == digest
+
+
+def test_metadata_not_modified(client):
+    """Test a matching If-None-Match gets 304 with the caching headers."""
+    response = client.post("/api/v1/tickets/sold", json=_sold_ticket("meta-3"))
+    token_id = response.json()["token_id"]
+    etag = client.get(f"/metadata/{token_id}").headers["etag"]
+
+    response = client.get(f"/metadata/{token_id}", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_unknown_metadata_is_not_found(client):
+    """Test unknown digests, tokens and malformed refs return 404."""
+    assert client.get(f"/metadata/{'0' * 64}").status_code == 404
+    assert client.get("/metadata/999999").status_code == 404
+    assert client.get("/metadata/not-a-ref").status_code == 404
+
+
+@pytest.mark.parametrize(
+    "store_path, base_url",
+    [(None, "https://tickets.example"), ("metadata", "http://localhost:8000")],
+)
+def test_offchain_needs_persistent_public_settings(
+    monkeypatch, tmp_path, store_path, base_url
+):
+    """Test off-chain mode refuses to start with in-memory or local settings."""
+    monkeypatch.setattr(settings, "token_metadata_storage", "offchain")
+    monkeypatch.setattr(
+        settings, "metadata_store_path", store_path and str(tmp_path / store_path)
+    )
+    monkeypatch.setattr(settings, "metadata_base_url", base_url)
+
+    with pytest.raises(ValueError, match="offchain requires"), TestClient(app):
+        pass
+
+
+def test_inline_metadata_is_base64(client, monkeypatch):
+    """Test inline mode embeds real base64 and is still served by token ID."""
+    monkeypatch.setattr(settings, "token_metadata_storage", "inline")
+    response = client.post("/api/v1/tickets/sold", json=_sold_ticket("meta-4"))
+    token_id = response.json()["token_id"]
+    token_uri = client.app.state.blockchain_service._tickets[token_id]["token_uri"]
+
+    prefix = "data:application/json;base64,"
+    assert token_uri.startswith(prefix)
+    document = json.loads(base64.b64decode(token_uri[len(prefix) :]))
+    assert document["ticket_id"] == "meta-4"
+    assert client.get(f"/metadata/{token_id}").json() == document
+
+
+def test_legacy_hex_metadata_is_served(client, store):
+    """Test tokens minted with hex under a base64 label are still readable."""
+    response = client.post("/api/v1/tickets/sold", json=_sold_ticket("meta-5"))
+    token_id = response.json()["token_id"]
+    legacy = json.dumps({"ticket_id": "meta-5"}).encode().hex()
+    store._links.clear()
+    client.app.state.blockchain_service._tickets[token_id][
+        "token_uri"
+    ] = f"data:application/json;base64,{legacy}"
+
+    response = client.get(f"/metadata/{token_id}")
+
+    assert response.status_code == 200
+    assert response.json() == {"ticket_id": "meta-5"}
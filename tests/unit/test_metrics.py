@@ -0,0 +1,104 @@
+"""Unit tests for the Prometheus metrics and the /metrics endpoint."""
+
+from collections.abc import AsyncIterator
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from fastapi.testclient import TestClient
+from web3 import AsyncHTTPProvider, AsyncWeb3
+
+from src.api.main import app
+from src.blockchain_service.rpc_metrics import RpcMetricsMiddleware
+from src.metrics import MetricsRegistry, gauge, rpc_errors, rpc_request_seconds
+
+
+def test_histogram_buckets_are_cumulative():
+    """Test observations land in the right bucket and render cumulatively."""
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency.", ("route",), (0.1, 1))
+    for value in (0.05, 0.1, 0.5, 3):
+        latency.observe(value, "/a")
+
+    text = registry.render()
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 2' in text
+    assert 'latency_seconds_bucket{route="/a",le="1"} 3' in text
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 4' in text
+    assert 'latency_seconds_count{route="/a"} 4' in text
+    assert 'latency_seconds_sum{route="/a"} 3.65' in text
+    assert latency.count("/a") == 4
+    assert latency.count("/b") == 0
+
+
+def test_counter_escapes_label_values():
+    """Test label values are escaped in the exposition."""
+    registry = MetricsRegistry()
+    errors = registry.counter("errors_total", "Errors.", ("method",))
+    errors.inc('say "hi"')
+    errors.inc('say "hi"', amount=2)
+
+    assert "# TYPE errors_total counter" in registry.render()
+    assert 'errors_total{method="say \\"hi\\""} 3' in registry.render()
+
+
+def test_gauge_skips_unknown_values():
+    """Test None samples are left out, and an all-None gauge entirely."""
+    lines = list(
+        gauge("ratio", "Ratio.", [({"cache": "a"}, 0.5), ({"cache": "b"}, None)])
+    )
+
+    assert lines[-1] == 'ratio{cache="a"} 0.5'
+    assert len(lines) == 3
+    assert list(gauge("ratio", "Ratio.", [({}, None)])) == []
+
+
+def test_metrics_endpoint_reports_routes_and_state():
+    """Test /metrics has per-route latency and the service state gauges."""
+    with TestClient(app) as client:
+        assert client.get("/api/v1/tickets/no-such-ticket").status_code == 404
+        response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    assert (
+        "ticketchain_http_request_duration_seconds_count{"
+        'method="GET",route="/api/v1/tickets/{ticket_id}",status="404"}'
+    ) in text
+    assert "ticketchain_registry_tickets " in text
+
+
+@pytest.fixture
+async def node_url() -> AsyncIterator[str]:
+    async def handle(request: web.Request) -> web.Response:
+        payload = await request.json()
+        response = {"jsonrpc": "2.0", "id": payload["id"]}
+        if payload["method"] == "eth_blockNumber":
+            response["result"] = "0x2a"
+        else:
+            response["error"] = {"code": -32601, "message": "method not found"}
+        return web.json_response(response)
+
+    node = web.Application()
+    node.router.add_post("/", handle)
+    server = TestServer(node)
+    await server.start_server()
+    yield str(server.make_url("/"))
+    await server.close()
+
+
+async def test_rpc_calls_are_timed_by_method(node_url):
+    """Test the middleware counts calls and errors per JSON-RPC method."""
+    w3 = AsyncWeb3(AsyncHTTPProvider(node_url, exception_retry_configuration=None))
+    w3.middleware_onion.add(RpcMetricsMiddleware, "rpc_metrics")
+    calls = rpc_request_seconds.count("eth_blockNumber")
+    errors = rpc_errors._values.get(("eth_chainId",), 0)
+
+    assert await w3.eth.block_number == 42
+    assert await w3.eth.block_number == 42
+    with pytest.raises(Exception, match="method not found"):
+        await w3.eth.chain_id
+    await w3.provider.disconnect()
+
+    assert rpc_request_seconds.count("eth_blockNumber") == calls + 2
+    assert rpc_errors._values[("eth_chainId",)] == errors + 1
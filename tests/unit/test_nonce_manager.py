@@ -0,0 +1,76 @@
+"""Unit tests for the local nonce manager."""
+
+import asyncio
+
+from src.blockchain_service.nonce_manager import NonceManager, is_nonce_error
+
+
+class FakeNode:
+    """Stands in for get_transaction_count(address, "pending")."""
+
+    def __init__(self, pending_count: int):
+        self.pending_count = pending_count
+        self.calls = 0
+
+    async def pending_nonce(self) -> int:
+        self.calls += 1
+        await asyncio.sleep(0)
+        return self.pending_count
+
+
+async def test_concurrent_allocations_are_unique_and_sequential():
+    """Test concurrent callers never share a nonce and the node is read once."""
+    node = FakeNode(pending_count=7)
+    manager = NonceManager(node.pending_nonce)
+
+    nonces = await asyncio.gather(*(manager.allocate() for _ in range(50)))
+
+    assert sorted(nonces) == list(range(7, 57))
+    assert node.calls == 1
+
+
+async def test_released_nonce_fills_gap_first():
+    """Test a nonce that never reached the node is reused before new ones."""
+    manager = NonceManager(FakeNode(pending_count=0).pending_nonce)
+
+    first = await manager.allocate()
+    second = await manager.allocate()
+    manager.confirm(second)
+    manager.release(first)
+
+    assert await manager.allocate() == first
+    assert await manager.allocate() == 2
+
+
+async def test_invalidate_resyncs_from_pending_count():
+    """Test a nonce error makes the next allocation re-read the node."""
+    node = FakeNode(pending_count=3)
+    manager = NonceManager(node.pending_nonce)
+
+    nonce = await manager.allocate()
+    assert nonce == 3
+
+    # Another sender consumed nonces behind our back
+    node.pending_count = 10
+    manager.invalidate(nonce)
+
+    assert await manager.allocate() == 10
+    assert node.calls == 2
+
+
+async def test_resync_keeps_nonces_held_by_in_flight_callers():
+    """Test a resync never re-issues a nonce that is still reserved."""
+    node = FakeNode(pending_count=0)
+    manager = NonceManager(node.pending_nonce)
+
+    in_flight = await manager.allocate()
+    await manager.sync()
+
+    assert await manager.allocate() == in_flight + 1
+
+
+def test_is_nonce_error():
+    """Test detection of node errors caused by a stale nonce."""
+    assert is_nonce_error(Exception("nonce too low"))
+    assert is_nonce_error(Exception("replacement transaction underpriced"))
+    assert not is_nonce_error(Exception("insufficient funds for gas"))
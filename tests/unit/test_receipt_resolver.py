@@ -0,0 +1,208 @@
+"""Unit tests for the block-following receipt resolver."""
+
+import asyncio
+from collections import Counter
+from typing import Any, Optional
+
+import pytest
+from web3.exceptions import TimeExhausted
+
+from src.blockchain_service.receipt_resolver import ReceiptResolver
+
+
+class FakeChain:
+    """Serves blocks and receipts like a node would, counting calls."""
+
+    def __init__(self, supports_block_receipts: bool = True):
+        self.supports_block_receipts = supports_block_receipts
+        self.blocks: list[dict[str, Any]] = []
+        self.receipts: dict[str, dict[str, Any]] = {}
+        self.calls: Counter[str] = Counter()
+        self.mine()
+
+    def mine(self, tx_hashes: tuple[str, ...] = (), fork: int = 0) -> int:
+        number = len(self.blocks)
+        block = {
+            "number": number,
+            "hash": f"0x{fork:x}{number:04x}",
+            "timestamp": 1_700_000_000 + number,
+            "transactions": list(tx_hashes),
+        }
+        self.blocks.append(block)
+        for tx_hash in tx_hashes:
+            self.receipts[tx_hash] = {
+                "transactionHash": tx_hash,
+                "blockNumber": number,
+                "blockHash": block["hash"],
+                "status": 1,
+            }
+        return number
+
+    def reorg(self, number: int) -> None:
+        """Replace blocks from ``number`` on with empty blocks of a fork."""
+        dropped = self.blocks[number:]
+        del self.blocks[number:]
+        for block in dropped:
+            for tx_hash in block["transactions"]:
+                del self.receipts[tx_hash]
+            self.mine(fork=1)
+
+    async def get_block(self, block_id: Any) -> dict[str, Any]:
+        self.calls["get_block"] += 1
+        return self.blocks[-1] if block_id == "latest" else self.blocks[block_id]
+
+    async def get_receipt(self, tx_hash: str) -> Optional[dict[str, Any]]:
+        self.calls["get_receipt"] += 1
+        return self.receipts.get(tx_hash)
+
+    async def get_block_receipts(self, number: int) -> list[dict[str, Any]]:
+        self.calls["get_block_receipts"] += 1
+        if not self.supports_block_receipts:
+            raise ValueError("the method eth_getBlockReceipts does not exist")
+        return [r for r in self.receipts.values() if r["blockNumber"] == number]
+
+
+def _resolver(chain: FakeChain, block_receipts: bool = True, **kwargs):
+    return ReceiptResolver(
+        chain.get_block,
+        chain.get_receipt,
+        chain.get_block_receipts if block_receipts else None,
+        poll_interval=kwargs.pop("poll_interval", 0.001),
+        **kwargs,
+    )
+
+
+async def _until(condition) -> None:
+    for _ in range(1000):
+        if condition():
+            return
+        await asyncio.sleep(0.001)
+    raise AssertionError("condition not met")
+
+
+async def test_calls_scale_with_blocks_not_transactions():
+    """Test 500 waiters are resolved with one receipts call per block."""
+    chain = FakeChain()
+    resolver = _resolver(chain)
+    await resolver.poll()
+    tx_hashes = [f"0xtx{i}" for i in range(500)]
+    waiters = [asyncio.ensure_future(resolver.wait(h)) for h in tx_hashes]
+    await asyncio.sleep(0.01)
+
+    for i in range(0, 500, 100):
+        chain.mine(tuple(tx_hashes[i : i + 100]))
+    receipts = await asyncio.gather(*waiters)
+    await resolver.stop()
+
+    assert [r["transactionHash"] for r in receipts] == tx_hashes
+    assert chain.calls["get_block_receipts"] == 5
+    assert chain.calls["get_receipt"] == 0
+    stats = resolver.stats()
+    assert stats["waiting"] == 0
+    assert stats["blocks_scanned"] == 5
+    # One head poll per tick, one header per block the head poll skipped
+    assert chain.calls["get_block"] <= stats["polls"] + 5
+
+
+async def test_receipts_fetched_per_match_without_block_receipts():
+    """Test nodes without eth_getBlockReceipts get only matching receipts."""
+    chain = FakeChain(supports_block_receipts=False)
+    resolver = _resolver(chain)
+    await resolver.poll()
+    waiter = asyncio.ensure_future(resolver.wait("0xmine"))
+    await asyncio.sleep(0.01)
+
+    chain.mine(("0xother", "0xmine", "0xthird"))
+    receipt = await waiter
+    await resolver.stop()
+
+    assert receipt["transactionHash"] == "0xmine"
+    assert chain.calls["get_block_receipts"] == 1
+    assert chain.calls["get_receipt"] == 1
+    assert resolver.stats()["block_receipts_supported"] is False
+
+
+async def test_confirmations_wait_for_deeper_blocks():
+    """Test a receipt is returned once buried under the confirmation depth."""
+    chain = FakeChain()
+    resolver = _resolver(chain, confirmations=3)
+    await resolver.poll()
+    waiter = asyncio.ensure_future(resolver.wait("0xtx"))
+    await asyncio.sleep(0.01)
+
+    mined_in = chain.mine(("0xtx",))
+    chain.mine()
+    await _until(lambda: resolver.stats()["awaiting_confirmations"] == 1)
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    chain.mine()
+    receipt = await waiter
+    await resolver.stop()
+    assert receipt["blockNumber"] == mined_in
+
+
+async def test_reorged_receipt_is_found_again():
+    """Test a receipt whose block was reorged out is not returned."""
+    chain = FakeChain()
+    resolver = _resolver(chain, confirmations=2)
+    await resolver.poll()
+    waiter = asyncio.ensure_future(resolver.wait("0xtx"))
+    await asyncio.sleep(0.01)
+
+    mined_in = chain.mine(("0xtx",))
+    await _until(lambda: resolver.stats()["awaiting_confirmations"] == 1)
+    chain.reorg(mined_in)
+    chain.mine()
+    await _until(lambda: resolver.stats()["reorged"] == 1)
+    assert not waiter.done()
+
+    remined_in = chain.mine(("0xtx",), fork=1)
+    chain.mine(fork=1)
+    receipt = await waiter
+    await resolver.stop()
+    assert receipt["blockNumber"] == remined_in
+    assert receipt["blockHash"] == chain.blocks[remined_in]["hash"]
+
+
+async def test_gap_is_covered_by_direct_lookups():
+    """Test transactions mined before the first poll are still found."""
+    chain = FakeChain()
+    chain.mine(("0xearly",))
+    resolver = _resolver(chain)
+
+    receipt = await resolver.wait("0xearly")
+    await resolver.stop()
+
+    assert receipt["transactionHash"] == "0xearly"
+    assert resolver.stats()["direct_lookups"] == 1
+
+
+async def test_block_timestamps_are_reported():
+    """Test every block seen is passed to on_block."""
+    chain = FakeChain()
+    seen: dict[int, int] = {}
+    resolver = _resolver(chain, on_block=lambda n, t: seen.setdefault(n, t))
+    await resolver.poll()
+    waiter = asyncio.ensure_future(resolver.wait("0xtx"))
+    await asyncio.sleep(0.01)
+
+    chain.mine()
+    number = chain.mine(("0xtx",))
+    await waiter
+    await resolver.stop()
+
+    assert seen[number] == chain.blocks[number]["timestamp"]
+    assert number - 1 in seen
+
+
+async def test_wait_times_out():
+    """Test an unmined transaction times out and stops being watched."""
+    chain = FakeChain()
+    resolver = _resolver(chain)
+
+    with pytest.raises(TimeExhausted):
+        await resolver.wait("0xnever", timeout=0.02)
+    await resolver.stop()
+
+    assert resolver.stats()["waiting"] == 0
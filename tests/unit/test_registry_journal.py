@@ -0,0 +1,141 @@
+"""Unit tests for the registry's append-only journal."""
+
+import asyncio
+import io
+import json
+import threading
+
+import pytest
+
+from src.config import settings
+from src.datastore.journal import _read_snapshot
+from src.datastore.ticket_registry import TicketRegistry
+
+
+async def test_changes_survive_a_restart(tmp_path):
+    """Test registrations are replayed from the journal on startup."""
+    path = str(tmp_path / "registry.json")
+    registry = TicketRegistry(storage_path=path)
+    registry.register_ticket("j-1", 1)
+    registry.register_many({"j-2": 2, "j-3": 3})
+    await registry.flush()
+    registry.close()
+
+    reopened = TicketRegistry(storage_path=path)
+
+    assert reopened.get_many(["j-1", "j-2", "j-3"]) == {"j-1": 1, "j-2": 2, "j-3": 3}
+    reopened.close()
+
+
+async def test_concurrent_writers_share_fsyncs(tmp_path):
+    """Test group commit: many concurrent registrations, few disk commits."""
+    registry = TicketRegistry(storage_path=str(tmp_path / "registry.json"))
+
+    async def register(i: int) -> None:
+        registry.register_ticket(f"g-{i}", i)
+        await registry.flush()
+
+    await asyncio.gather(*(register(i) for i in range(200)))
+
+    journal = registry.stats()["journal"]
+    assert journal["journal_records"] == 200
+    assert journal["commits"] < 200
+    registry.close()
+
+
+async def test_compaction_writes_a_snapshot(tmp_path, monkeypatch):
+    """Test the journal is folded into the snapshot once it grows."""
+    monkeypatch.setattr(settings, "ticket_registry_compact_every", 10)
+    path = tmp_path / "registry.json"
+    registry = TicketRegistry(storage_path=str(path))
+    for i in range(25):
+        registry.register_ticket(f"c-{i}", i)
+        await registry.flush()
+    registry.close()
+
+    assert registry.stats()["journal"]["compactions"] >= 2
+    assert len(json.loads(path.read_text())) >= 20
+    assert (
+        len(
+            TicketRegistry(storage_path=str(path)).get_many(f"c-{i}" for i in range(25))
+        )
+        == 25
+    )
+
+
+def test_torn_journal_tail_and_legacy_snapshot_load(tmp_path):
+    """Test a pretty-printed snapshot plus a crash-torn journal still loads."""
+    path = tmp_path / "registry.json"
+    path.write_text(json.dumps({"old-1": 1}, indent=2))
+    (tmp_path / "registry.json.journal").write_text(
+        '["set", "new-2", 2]\n["clear"]\n["set", "new-3", 3]\n["set", "new-'
+    )
+
+    registry = TicketRegistry(storage_path=str(path))
+
+    assert registry.get_many(["old-1", "new-2", "new-3"]) == {"new-3": 3}
+
+
+async def test_registrations_after_a_torn_tail_survive(tmp_path):
+    """Test a torn journal tail is cut off so later records stay readable."""
+    path = tmp_path / "registry.json"
+    journal = tmp_path / "registry.json.journal"
+    journal.write_text('["set", "a", 1]\n["set", "b"')
+
+    registry = TicketRegistry(storage_path=str(path))
+    registry.register_ticket("c", 3)
+    await registry.flush()
+    registry.close()
+
+    assert journal.read_text() == '["set", "a", 1]\n["set", "c", 3]\n'
+    reopened = TicketRegistry(storage_path=str(path))
+    assert reopened.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+    reopened.close()
+
+
+def test_snapshot_is_decoded_across_chunk_boundaries():
+    """Test the incremental snapshot reader agrees with json.load."""
+    snapshot = {
+        "plain": 1234567,
+        "details": [12, "event-a", {"seat": "A 1", "tags": ["x", "{"]}],
+        'quote"d, id': [7, None, None],
+        "big": 10**30,
+    }
+    text = json.dumps(snapshot, indent=2)
+
+    for chunk_size in (1, 3, 7, 1 << 16):
+        pairs = list(_read_snapshot(io.StringIO(text), chunk_size))
+        assert dict(pairs) == snapshot
+    assert list(_read_snapshot(io.StringIO(" {} "))) == []
+    with pytest.raises(ValueError):
+        list(_read_snapshot(io.StringIO('{"cut": 1'), 4))
+
+
+async def test_compaction_does_not_block_appends(tmp_path, monkeypatch):
+    """Test registrations proceed while the writer copies the registry."""
+    monkeypatch.setattr(settings, "ticket_registry_compact_every", 1)
+    registry = TicketRegistry(storage_path=str(tmp_path / "registry.json"))
+    copying, release = threading.Event(), threading.Event()
+    released = []
+    snapshot_state = registry._journal._snapshot_state
+
+    def slow_snapshot_state():
+        copying.set()
+        released.append(release.wait(5))
+        return snapshot_state()
+
+    registry._journal._snapshot_state = slow_snapshot_state
+    registry.register_ticket("a", 1)
+    assert await asyncio.to_thread(copying.wait, 5)
+
+    # Would wait for the copy if the writer held its lock while copying
+    registry.register_ticket("b", 2)
+    release.set()
+    await registry.flush()
+    registry.close()
+
+    assert released and all(released)
+
+    reopened = TicketRegistry(storage_path=str(tmp_path / "registry.json"))
+    assert reopened.get_many(["a", "b"]) == {"a": 1, "b": 2}
+    reopened.close()
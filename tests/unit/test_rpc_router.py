@@ -0,0 +1,205 @@
+"""Unit tests for latency-aware routing over several RPC endpoints."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any, Optional
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from web3 import AsyncHTTPProvider, AsyncWeb3
+
+from src.blockchain_service.connection_pool import RpcConnectionPool
+from src.blockchain_service.rpc_router import RpcEndpoint, RpcRouter
+
+
+class StubNode:
+    """JSON-RPC stub with configurable latency, height and failures."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.delay = 0.0
+        self.block_number = 100
+        self.http_status = 200
+        self.error: Optional[dict[str, Any]] = None
+        self.methods: list[str] = []
+
+    async def handle(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        self.methods.append(payload["method"])
+        await asyncio.sleep(self.delay)
+        if self.http_status != 200:
+            return web.Response(status=self.http_status)
+        response: dict[str, Any] = {"jsonrpc": "2.0", "id": payload["id"]}
+        if self.error is not None:
+            response["error"] = self.error
+        elif payload["method"] == "eth_blockNumber":
+            response["result"] = hex(self.block_number)
+        elif payload["method"] == "eth_sendRawTransaction":
+            response["result"] = "0x" + "ab" * 32
+        else:
+            response["result"] = self.name
+        return web.json_response(response)
+
+
+@pytest.fixture
+async def nodes() -> AsyncIterator[tuple[list[StubNode], list[str]]]:
+    stubs, servers = [], []
+    for name in ("a", "b", "c"):
+        stub = StubNode(name)
+        app = web.Application()
+        app.router.add_post("/", stub.handle)
+        server = TestServer(app)
+        await server.start_server()
+        stubs.append(stub)
+        servers.append(server)
+    yield stubs, [str(server.make_url("/")) for server in servers]
+    for server in servers:
+        await server.close()
+
+
+def _router(urls: list[str], **kwargs: Any) -> RpcRouter:
+    return RpcRouter(
+        [RpcEndpoint(url, RpcConnectionPool()) for url in urls],
+        build_provider=lambda url, request_kwargs: AsyncHTTPProvider(
+            url, request_kwargs=request_kwargs, exception_retry_configuration=None
+        ),
+        probe_interval=kwargs.pop("probe_interval", 0),
+        **kwargs,
+    )
+
+
+async def _client_version(router: RpcRouter) -> str:
+    return str(await AsyncWeb3(router).client_version)
+
+
+async def test_reads_go_to_the_fastest_endpoint(nodes):
+    """Test reads follow the lowest EWMA latency measured by probes."""
+    stubs, urls = nodes
+    stubs[0].delay = 0.05
+    stubs[2].delay = 0.02
+    router = _router(urls)
+    await router.connect()
+
+    await router.probe()
+    results = [await _client_version(router) for _ in range(5)]
+    await router.disconnect()
+
+    assert results == ["b"] * 5
+    assert stubs[1].methods.count("web3_clientVersion") == 5
+    assert [e.url for e in router.ranked()] == [urls[1], urls[2], urls[0]]
+
+
+async def test_failed_endpoint_fails_over_and_recovers(nodes):
+    """Test HTTP errors fail over, then pause the endpoint until a probe."""
+    stubs, urls = nodes
+    stubs[0].http_status = 503
+    router = _router(urls[:2], failure_threshold=2)
+    await router.connect()
+
+    assert await _client_version(router) == "b"
+    stats = router.stats()
+    assert stats["failovers"] == 1
+    failed = stats["endpoints"][-1]
+    assert failed["failures"] == 1
+    assert failed["available"] is True
+
+    # Unmeasured endpoints with errors rank last, so force it first
+    router.endpoints[0].latency = 0.0
+    router.endpoints[1].latency = 1.0
+    assert await _client_version(router) == "b"
+    assert router.stats()["endpoints"][-1]["available"] is False
+    assert [await _client_version(router) for _ in range(3)] == ["b"] * 3
+    assert stubs[0].methods.count("web3_clientVersion") == 2
+
+    stubs[0].http_status = 200
+    await router.probe()
+    await router.disconnect()
+    assert router.endpoints[0].consecutive_failures == 0
+    assert router.stats()["endpoints"][0]["available"] is True
+
+
+async def test_rate_limited_endpoint_fails_over(nodes):
+    """Test a JSON-RPC limit-exceeded error is retried on another endpoint."""
+    stubs, urls = nodes
+    stubs[0].error = {"code": -32005, "message": "daily request count exceeded"}
+    router = _router(urls[:2])
+    await router.connect()
+
+    assert await _client_version(router) == "b"
+    await router.disconnect()
+    assert router.endpoints[0].failures == 1
+
+
+async def test_lagging_endpoint_is_out_of_rotation(nodes):
+    """Test an endpoint trailing the highest block is not read from."""
+    stubs, urls = nodes
+    stubs[0].block_number = 90
+    router = _router(urls[:2], max_block_lag=5)
+    await router.connect()
+    await router.probe()
+    # Make the lagging endpoint look fastest
+    router.endpoints[0].latency = 0.0
+
+    assert await _client_version(router) == "b"
+    await router.disconnect()
+    assert router.stats()["endpoints"][-1]["block_number"] == 90
+    assert router.stats()["endpoints"][-1]["available"] is False
+
+
+async def test_raw_transactions_are_broadcast(nodes):
+    """Test a raw transaction goes to several endpoints, first success wins."""
+    stubs, urls = nodes
+    stubs[0].error = {"code": -32000, "message": "already known"}
+    stubs[2].delay = 0.05
+    router = _router(urls, broadcast_count=3)
+    await router.connect()
+
+    tx_hash = await AsyncWeb3(router).eth.send_raw_transaction(b"\x01\x02")
+    await router.disconnect()
+
+    assert tx_hash.hex() == "ab" * 32
+    # The slow endpoint still got the transaction after the call returned
+    assert all("eth_sendRawTransaction" in stub.methods for stub in stubs)
+    assert router.stats()["broadcasts"] == 1
+
+
+async def test_broadcast_without_success_returns_best_endpoint_error(nodes):
+    """Test a rejected transaction surfaces the node's error."""
+    stubs, urls = nodes
+    for stub in stubs:
+        stub.error = {"code": -32000, "message": "nonce too low"}
+    router = _router(urls, broadcast_count=2)
+    await router.connect()
+
+    with pytest.raises(Exception, match="nonce too low"):
+        await AsyncWeb3(router).eth.send_raw_transaction(b"\x01\x02")
+    await router.disconnect()
+    assert "eth_sendRawTransaction" not in stubs[2].methods
+
+
+async def test_all_endpoints_down_is_not_connected(unused_tcp_port_factory):
+    """Test the router reports no connection when no endpoint answers."""
+    router = _router(
+        [f"http://127.0.0.1:{unused_tcp_port_factory()}/" for _ in range(2)]
+    )
+    await router.connect()
+
+    assert await AsyncWeb3(router).is_connected() is False
+    await router.disconnect()
+    assert router.stats()["failovers"] == 1
+
+
+async def test_probe_loop_runs_in_background(nodes):
+    """Test connect starts periodic probes and disconnect stops them."""
+    stubs, urls = nodes
+    router = _router(urls[:2], probe_interval=0.01)
+    await router.connect()
+    await asyncio.sleep(0.05)
+    await router.disconnect()
+
+    probes = router.stats()["probes"]
+    assert probes >= 2
+    await asyncio.sleep(0.03)
+    assert router.stats()["probes"] == probes
+    assert 0 < stubs[0].methods.count("eth_blockNumber") <= probes
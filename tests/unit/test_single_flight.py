@@ -0,0 +1,74 @@
+"""Unit tests for coalescing of concurrent identical reads."""
+
+import asyncio
+
+import pytest
+
+from src.blockchain_service.single_flight import SingleFlight
+
+
+async def test_concurrent_calls_share_one_fetch():
+    """Test identical in-flight reads collapse into one call."""
+    flight = SingleFlight()
+    fetches = 0
+
+    async def fetch() -> str:
+        nonlocal fetches
+        fetches += 1
+        await asyncio.sleep(0.01)
+        return "0xabc"
+
+    results = await asyncio.gather(
+        *(flight.do(("ownerOf", 1), fetch) for _ in range(10))
+    )
+
+    assert results == ["0xabc"] * 10
+    assert fetches == 1
+    assert flight.stats() == {"calls": 10, "collapsed": 9, "in_flight": 0}
+
+    # Once the flight has landed, the next read fetches again
+    await flight.do(("ownerOf", 1), fetch)
+    assert fetches == 2
+
+
+async def test_different_keys_are_not_collapsed():
+    """Test reads of different tokens each make their own call."""
+    flight = SingleFlight()
+
+    async def fetch(token_id: int) -> int:
+        await asyncio.sleep(0)
+        return token_id
+
+    results = await asyncio.gather(
+        *(flight.do(("ownerOf", i), lambda i=i: fetch(i)) for i in range(3))
+    )
+
+    assert results == [0, 1, 2]
+    assert flight.stats()["collapsed"] == 0
+
+
+async def test_errors_reach_every_caller_and_cancellation_does_not():
+    """Test a failure is shared, while one cancelled caller leaves others intact."""
+    flight = SingleFlight()
+
+    async def failing() -> str:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("node down")
+
+    results = await asyncio.gather(
+        *(flight.do("k", failing) for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def slow() -> str:
+        await asyncio.sleep(0.02)
+        return "ok"
+
+    first = asyncio.ensure_future(flight.do("k", slow))
+    second = asyncio.ensure_future(flight.do("k", slow))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "ok"
+    with pytest.raises(asyncio.CancelledError):
+        await first
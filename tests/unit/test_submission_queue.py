@@ -0,0 +1,137 @@
+"""Unit tests for the bounded transaction submission queue."""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.main import app
+from src.blockchain_service.batching_provider import calling_route
+from src.blockchain_service.interface import ServiceBusyError
+from src.blockchain_service.submission_queue import SubmissionQueue
+
+ALICE = "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"
+
+
+async def test_jobs_run_in_the_submitters_context():
+    """Test context variables such as the calling route follow each job."""
+    queue = SubmissionQueue(max_depth=10, workers=1)
+
+    async def submit(route: str) -> str:
+        calling_route.set(route)
+        return await queue.submit(lambda: asyncio.sleep(0, calling_route.get()))
+
+    assert await asyncio.gather(submit("/a"), submit("/b")) == ["/a", "/b"]
+    await queue.close()
+
+
+async def test_workers_bound_concurrency():
+    """Test no more than ``workers`` submissions run at once."""
+    queue = SubmissionQueue(max_depth=10, workers=2)
+    running = peak = 0
+
+    async def job(i: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return i
+
+    results = await asyncio.gather(
+        *(queue.submit(lambda i=i: job(i)) for i in range(6))
+    )
+
+    assert results == list(range(6))
+    assert peak == 2
+    stats = queue.stats()
+    assert stats["submitted"] == 6
+    assert stats["wait_seconds_max"] > 0
+    assert 0 < stats["utilization"] <= 1
+    await queue.close()
+
+
+async def test_full_queue_rejects_immediately():
+    """Test submissions beyond the queue depth fail fast with a retry hint."""
+    queue = SubmissionQueue(max_depth=1, workers=1)
+    release = asyncio.Event()
+
+    async def blocked() -> str:
+        await release.wait()
+        return "sent"
+
+    running = asyncio.ensure_future(queue.submit(blocked))
+    await asyncio.sleep(0)  # the worker picks it up
+    waiting = asyncio.ensure_future(queue.submit(blocked))
+    await asyncio.sleep(0)
+
+    with pytest.raises(ServiceBusyError) as excinfo:
+        await queue.submit(blocked)
+    assert excinfo.value.retry_after >= 1
+    assert queue.stats()["rejected"] == 1
+    assert queue.stats()["depth"] == 1
+
+    release.set()
+    assert await asyncio.gather(running, waiting) == ["sent", "sent"]
+    await queue.close()
+
+
+async def test_errors_reach_the_caller_and_close_fails_waiters():
+    """Test a failing job raises in its caller; closing fails queued jobs."""
+    queue = SubmissionQueue(max_depth=5, workers=1)
+
+    async def failing() -> None:
+        raise ValueError("nonce too low")
+
+    with pytest.raises(ValueError):
+        await queue.submit(failing)
+
+    never = asyncio.Event()
+    first = asyncio.ensure_future(queue.submit(never.wait))
+    queued = asyncio.ensure_future(queue.submit(never.wait))
+    await asyncio.sleep(0)
+    await queue.close()
+
+    with pytest.raises(ConnectionError):
+        await queued
+    first.cancel()
+
+
+async def test_worker_survives_a_job_cancelled_from_within():
+    """Test a job whose own task is cancelled does not take its worker down."""
+    queue = SubmissionQueue(max_depth=5, workers=1)
+
+    async def cancelled() -> None:
+        raise asyncio.CancelledError
+
+    with pytest.raises(asyncio.CancelledError):
+        await queue.submit(cancelled)
+
+    assert (
+        await asyncio.wait_for(queue.submit(lambda: asyncio.sleep(0, "ok")), 1) == "ok"
+    )
+    await queue.close()
+
+
+def test_busy_service_answers_429(monkeypatch):
+    """Test the API turns a full queue into 429 with Retry-After."""
+    with TestClient(app) as client:
+
+        async def busy(*args: object, **kwargs: object) -> None:
+            raise ServiceBusyError("Transaction queue is full", retry_after=3)
+
+        service = client.app.state.blockchain_service
+        monkeypatch.setattr(service, "submit_mint_ticket", busy)
+        response = client.post(
+            "/api/v1/tickets/sold",
+            json={
+                "event_id": "event-1",
+                "ticket_id": "busy-1",
+                "user_id": "user-1",
+                "price": 100,
+                "to_address": ALICE,
+            },
+        )
+
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "3"
@@ -0,0 +1,64 @@
+"""Unit tests for the ticket owner/status cache."""
+
+import time
+
+from src.blockchain_service.ticket_cache import TicketStateCache
+
+OWNER = TicketStateCache.OWNER
+STATUS = TicketStateCache.STATUS
+
+
+def test_read_through_fill_then_hit():
+    """Test a value read from the chain is served until it changes."""
+    cache = TicketStateCache()
+
+    assert cache.get(1, STATUS) is None
+    cache.fill(1, STATUS, "Valid", cache.version(1))
+
+    assert cache.get(1, STATUS) == "Valid"
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_receipt_updates_win_over_racing_reads():
+    """Test a read started before our own change cannot overwrite it."""
+    cache = TicketStateCache()
+    version = cache.version(1)  # read of ticketStatuses starts
+
+    cache.set(1, STATUS, "CheckedIn")  # our check-in is mined
+    cache.fill(1, STATUS, "Valid", version)  # the read returns old state
+
+    assert cache.get(1, STATUS) == "CheckedIn"
+
+
+def test_invalidate_drops_owner_and_status():
+    """Test a log from another writer drops everything for the token."""
+    cache = TicketStateCache()
+    cache.set(1, OWNER, "0xabc")
+    cache.set(1, STATUS, "Valid")
+
+    cache.invalidate(1)
+
+    assert cache.get(1, OWNER) is None
+    assert cache.get(1, STATUS) is None
+    assert cache.stats()["invalidations"] == 2
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    """Test staleness is bounded even if a log is missed."""
+    cache = TicketStateCache(ttl_seconds=30)
+    cache.set(1, OWNER, "0xabc")
+
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 31)
+
+    assert cache.get(1, OWNER) is None
+
+
+def test_zero_ttl_disables_caching():
+    """Test the cache can be turned off."""
+    cache = TicketStateCache(ttl_seconds=0)
+    cache.set(1, OWNER, "0xabc")
+
+    assert cache.get(1, OWNER) is None
+    assert cache.stats()["entries"] == 0
@@ -1,5 +1,11 @@
 """Unit tests for ticket registry."""
 
+import pytest
+
+from src.config import settings
+from src.datastore.compact_map import CompactTicketMap
+from src.datastore.records import RegisteredTicket
+from src.datastore.sqlite_registry import SQLiteTicketRegistry, sqlite_path_from_url
 from src.datastore.ticket_registry import TicketRegistry
 
 
@@ -39,3 +45,195 @@ def test_registry_isolation_between_tests(clean_registry):
     assert ticket_registry.exists("isolation-test")
 
     # The fixture will clear this after the test
+
+
+def test_registry_register_many():
+    """Test bulk registration of ticket mappings."""
+    registry = TicketRegistry(storage_path=None)
+
+    registry.register_many({"bulk-1": 10, "bulk-2": 11})
+
+    assert registry.get_token_id("bulk-1") == 10
+    assert registry.get_token_id("bulk-2") == 11
+
+
+def test_registry_get_many():
+    """Test bulk lookup leaves out unknown tickets."""
+    registry = TicketRegistry(storage_path=None)
+    registry.register_many({"bulk-1": 10, "bulk-2": 11})
+
+    assert registry.get_many(["bulk-1", "missing", "bulk-2"]) == {
+        "bulk-1": 10,
+        "bulk-2": 11,
+    }
+
+
+def test_sqlite_registry_matches_in_memory_api(tmp_path):
+    """Test the SQLite registry behaves like the in-memory one and persists."""
+    path = str(tmp_path / "registry.db")
+    registry = SQLiteTicketRegistry(path)
+
+    registry.register_ticket("sql-1", 1, event_id="event-1")
+    registry.register_many({f"sql-{i}": i for i in range(2, 1200)})
+    registry.register_ticket("sql-2", 42)  # re-registering overwrites
+
+    assert registry.exists("sql-1")
+    assert not registry.exists("missing")
+    assert registry.get_token_id("sql-2") == 42
+    assert registry.get_token_id("missing") is None
+    # Spans several IN (...) chunks
+    found = registry.get_many([f"sql-{i}" for i in range(1, 1200)] + ["missing"])
+    assert len(found) == 1199
+    assert found["sql-1"] == 1
+    assert registry.count() == 1199
+    registry.close()
+
+    reopened = SQLiteTicketRegistry(path)
+    assert reopened.count() == 1199
+    reopened.clear()
+    assert not reopened.exists("sql-1")
+    assert reopened.stats() == {"tickets": 0}
+    reopened.close()
+
+
+def test_sqlite_registry_count_does_not_scan(tmp_path):
+    """Test stats come from the kept row count, not a COUNT(*) per call."""
+    registry = SQLiteTicketRegistry(str(tmp_path / "registry.db"))
+    registry.register_many({"a": 1, "b": 2})
+    # Duplicates within and across batches are counted once
+    registry.register_tickets(
+        RegisteredTicket(ticket_id, token_id)
+        for ticket_id, token_id in [("b", 3), ("c", 4), ("c", 5)]
+    )
+
+    statements = []
+    registry._conn.set_trace_callback(statements.append)
+    assert registry.stats() == {"tickets": 3}
+    assert statements == []
+    registry.close()
+
+
+def test_sqlite_path_from_url():
+    """Test the database URL from settings maps to a file path."""
+    assert sqlite_path_from_url("sqlite:///./data/ticketchain.db") == (
+        "./data/ticketchain.db"
+    )
+    with pytest.raises(ValueError):
+        sqlite_path_from_url("postgresql://localhost/ticketchain")
+
+
+def test_compact_map_matches_dict():
+    """Test the compact map agrees with a dict through growth and overwrites."""
+    compact = CompactTicketMap()
+    expected = {}
+    for i in range(5000):
+        ticket_id = f"ticket-{i}-{'é' * (i % 3)}"
+        compact[ticket_id] = i
+        expected[ticket_id] = i
+    for i in range(0, 5000, 7):
+        ticket_id = f"ticket-{i}-{'é' * (i % 3)}"
+        compact[ticket_id] = -i
+        expected[ticket_id] = -i
+
+    assert len(compact) == len(expected)
+    assert dict(compact.items()) == expected
+    assert compact.get("ticket-1") is None
+    assert "ticket-1" not in compact
+    with pytest.raises(KeyError):
+        compact["missing"]
+
+    clone = compact.copy()
+    compact.clear()
+    assert len(compact) == 0
+    assert clone["ticket-7-é"] == -7
+
+
+def test_compact_map_resolves_hash_collisions(monkeypatch):
+    """Test keys sharing a hash are told apart by their bytes."""
+    compact = CompactTicketMap()
+    monkeypatch.setattr("src.datastore.compact_map.hash", lambda _: 42, raising=False)
+    for i in range(20):
+        compact[f"same-hash-{i}"] = i
+
+    assert [compact[f"same-hash-{i}"] for i in range(20)] == list(range(20))
+    assert "same-hash-20" not in compact
+
+
+async def test_compact_registry_persists(tmp_path, monkeypatch):
+    """Test the compact layout loads, journals and snapshots like the dict."""
+    monkeypatch.setattr(settings, "ticket_registry_compact_every", 10)
+    path = str(tmp_path / "registry.json")
+    registry = TicketRegistry(storage_path=path, compact=True, capacity=100)
+    registry.register_many({f"cp-{i}": i for i in range(25)})
+    registry.register_ticket("cp-0", 99)
+    await registry.flush()
+    registry.close()
+
+    reopened = TicketRegistry(storage_path=path, compact=True)
+    assert reopened.stats()["layout"] == "compact"
+    assert reopened.get_token_id("cp-0") == 99
+    assert len(reopened.get_many(f"cp-{i}" for i in range(30))) == 25
+    # Snapshots stay readable by the dict layout
+    assert TicketRegistry(storage_path=path).get_token_id("cp-24") == 24
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_registry_event_index(compact):
+    """Test event listing follows registration order and event changes."""
+    registry = TicketRegistry(storage_path=None, compact=compact)
+    registry.register_many({f"a-{i}": i for i in range(5)}, event_id="event-a")
+    registry.register_ticket("b-0", 10, event_id="event-b", metadata={"price": 5})
+    registry.register_ticket("a-1", 1, event_id="event-b")  # moved to another event
+
+    first = registry.list_event_tickets("event-a", limit=3)
+    rest = registry.list_event_tickets("event-a", cursor=first.next_cursor, limit=3)
+    assert [t.ticket_id for t in first.tickets + rest.tickets] == [
+        "a-0",
+        "a-2",
+        "a-3",
+        "a-4",
+    ]
+    assert rest.next_cursor is None
+    assert [t.ticket_id for t in registry.list_event_tickets("event-b").tickets] == [
+        "b-0",
+        "a-1",
+    ]
+    assert registry.get_ticket("b-0") == RegisteredTicket(
+        "b-0", 10, "event-b", {"price": 5}
+    )
+    assert registry.get_ticket("missing") is None
+
+
+async def test_registry_details_survive_a_restart(tmp_path, monkeypatch):
+    """Test events and metadata are journaled and snapshotted."""
+    monkeypatch.setattr(settings, "ticket_registry_compact_every", 3)
+    path = str(tmp_path / "registry.json")
+    registry = TicketRegistry(storage_path=path)
+    for i in range(5):
+        registry.register_ticket(f"d-{i}", i, event_id="event-d", metadata={"n": i})
+    registry.register_ticket("plain", 9)
+    await registry.flush()
+    registry.close()
+
+    reopened = TicketRegistry(storage_path=path, compact=True)
+    assert reopened.get_ticket("d-4") == RegisteredTicket("d-4", 4, "event-d", {"n": 4})
+    assert reopened.get_ticket("plain") == RegisteredTicket("plain", 9)
+    assert len(reopened.list_event_tickets("event-d").tickets) == 5
+
+
+def test_sqlite_registry_event_index(tmp_path):
+    """Test the SQLite registry pages an event's tickets by keyset."""
+    registry = SQLiteTicketRegistry(str(tmp_path / "registry.db"))
+    registry.register_many({f"s-{i}": i for i in range(5)}, event_id="event-s")
+    registry.register_ticket("s-9", 9, event_id="other", metadata={"price": 1})
+
+    first = registry.list_event_tickets("event-s", limit=3)
+    rest = registry.list_event_tickets("event-s", cursor=first.next_cursor, limit=3)
+    assert [t.ticket_id for t in first.tickets + rest.tickets] == [
+        f"s-{i}" for i in range(5)
+    ]
+    assert rest.next_cursor is None
+    assert registry.get_ticket("s-9") == RegisteredTicket(
+        "s-9", 9, "other", {"price": 1}
+    )
+    registry.close()
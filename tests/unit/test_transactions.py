@@ -0,0 +1,123 @@
+"""Unit tests for asynchronous submit-and-track mode."""
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.main import app
+from src.api.models import TransactionState
+from src.api.transactions import TransactionTracker, validate_callback_url
+from src.blockchain_service.interface import PendingTransaction
+from src.config import settings
+
+SOLD_TICKET = {
+    "event_id": "event-1",
+    "ticket_id": "ticket-1",
+    "user_id": "user-1",
+    "price": 100,
+    "to_address": "0x70997970C51812dc3A010C7d01b50e0d17dc79C8",
+}
+
+
+@pytest.fixture
+def client():
+    """Create a test client that runs the app lifespan."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_sold_without_wait_returns_handle(client):
+    """Test wait=false responds 202 and the status endpoint reports the result."""
+    response = client.post("/api/v1/tickets/sold?wait=false", json=SOLD_TICKET)
+    assert response.status_code == 202
+    accepted = response.json()
+    assert accepted["status"] == "pending"
+    assert response.headers["location"] == accepted["status_url"]
+
+    status_response = client.get(accepted["status_url"])
+    assert status_response.status_code == 200
+    data = status_response.json()
+    assert data["status"] == "confirmed"
+    assert data["operation"] == "sold"
+    assert data["result"]["ticket_id"] == "ticket-1"
+
+    # The ticket is registered once confirmed, so later writes find it
+    check_in = client.post(
+        "/api/v1/tickets/checked-in?wait=false", json={"ticket_id": "ticket-1"}
+    )
+    assert check_in.status_code == 202
+
+
+def test_sold_waits_by_default(client):
+    """Test the default mode still waits for the mint and responds 201."""
+    response = client.post("/api/v1/tickets/sold", json=SOLD_TICKET)
+    assert response.status_code == 201
+    assert response.json()["status"] == "valid"
+
+
+def test_unknown_transaction_returns_404(client):
+    """Test the status endpoint for a hash it never tracked."""
+    response = client.get("/api/v1/transactions/0xdeadbeef")
+    assert response.status_code == 404
+
+
+async def test_tracker_records_failures():
+    """Test a transaction that fails to resolve is reported as failed."""
+    outcome: asyncio.Future = asyncio.get_running_loop().create_future()
+    outcome.set_exception(Exception("Transaction 0xabc reverted"))
+    tracker = TransactionTracker()
+
+    async def finalize(result):
+        raise AssertionError("finalize must not run for failed transactions")
+
+    record = tracker.track(
+        PendingTransaction(transaction_hash="0xabc", outcome=outcome),
+        "checked-in",
+        "ticket-1",
+        finalize,
+    )
+    assert record.status == TransactionState.PENDING
+
+    await asyncio.sleep(0)
+    assert record.status == TransactionState.FAILED
+    assert "reverted" in record.error
+    await tracker.close()
+
+
+@pytest.mark.parametrize(
+    "callback_url",
+    [
+        "http://127.0.0.1:8080/hook",
+        "http://169.254.169.254/latest/meta-data/",
+        "http://10.0.0.5/admin",
+        "http://[::1]/hook",
+        "http://localhost:9000/hook",
+        "file:///etc/passwd",
+        "not-a-url",
+    ],
+)
+def test_internal_callback_url_is_rejected(client, callback_url):
+    """Test webhooks to internal or non-http addresses are refused with 422."""
+    response = client.post(
+        "/api/v1/tickets/sold",
+        params={"wait": "false", "callback_url": callback_url},
+        json=SOLD_TICKET,
+    )
+
+    assert response.status_code == 422
+    assert "callback_url" in response.text
+
+
+def test_callback_host_allow_list(monkeypatch):
+    """Test a configured allow-list replaces the public address check."""
+    assert validate_callback_url("https://example.com/t") == "https://example.com/t"
+    assert validate_callback_url(None) is None
+
+    monkeypatch.setattr(settings, "webhook_allowed_hosts", ["hooks.internal"])
+
+    assert (
+        validate_callback_url("https://hooks.internal/t") == "https://hooks.internal/t"
+    )
+    with pytest.raises(ValueError, match="not allowed"):
+        validate_callback_url("https://example.com/t")
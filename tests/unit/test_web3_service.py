@@ -0,0 +1,265 @@
+"""Unit tests for the Web3 blockchain service against a stub JSON-RPC node."""
+
+import asyncio
+import json
+from collections import Counter
+from collections.abc import AsyncIterator
+from typing import Any, Optional
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from eth_account.typed_transactions import TypedTransaction
+from hexbytes import HexBytes
+from web3 import Web3
+
+from src.blockchain_service.web3_service import Web3BlockchainService
+from src.config import settings
+
+CONTRACT = "0x5FbDB2315678afecb367f032d93F642f64180aa3"
+HOLDER = "0x70997970C51812dc3A010C7d01b50e0d17dc79C8"
+
+
+def _event(name: str, *inputs: tuple[str, str]) -> dict[str, Any]:
+    return {
+        "type": "event",
+        "name": name,
+        "anonymous": False,
+        "inputs": [
+            {"name": arg, "type": kind, "indexed": True} for arg, kind in inputs
+        ],
+    }
+
+
+ABI = [
+    {
+        "type": "function",
+        "name": "mintTicket",
+        "stateMutability": "nonpayable",
+        "inputs": [
+            {"name": "to", "type": "address"},
+            {"name": "tokenURI_", "type": "string"},
+        ],
+        "outputs": [],
+    },
+    _event("Transfer", ("from", "address"), ("to", "address"), ("tokenId", "uint256")),
+    _event("TicketMinted", ("tokenId", "uint256"), ("to", "address")),
+    _event("TicketCheckedIn", ("tokenId", "uint256")),
+    _event("TicketInvalidated", ("tokenId", "uint256")),
+]
+
+TICKET_MINTED = Web3.to_hex(Web3.keccak(text="TicketMinted(uint256,address)"))
+
+
+def _word(value: int) -> str:
+    return "0x" + f"{value:x}".rjust(64, "0")
+
+
+class StubNode:
+    """JSON-RPC node that mines every accepted transaction into its own block."""
+
+    def __init__(self, pending_count: int = 7):
+        # Transactions sent from the account by someone else
+        self.external_count = pending_count
+        # Nonces of accepted transactions, in arrival order
+        self.nonces: list[int] = []
+        self.blocks: list[dict[str, Any]] = []
+        self.receipts: dict[str, dict[str, Any]] = {}
+        self.revert_next = False
+        self.drop_next = False
+        self.calls: Counter[str] = Counter()
+        self._mine(None)
+
+    @property
+    def pending_count(self) -> int:
+        return self.external_count + len(self.nonces)
+
+    def _mine(self, tx_hash: Optional[str]) -> dict[str, Any]:
+        number = len(self.blocks)
+        block = {
+            "number": hex(number),
+            "hash": _word(number + 1),
+            "parentHash": _word(number),
+            "timestamp": hex(1_700_000_000 + number),
+            "extraData": "0x",
+            "transactions": [tx_hash] if tx_hash else [],
+        }
+        self.blocks.append(block)
+        return block
+
+    def _send(self, raw: str) -> str:
+        nonce = TypedTransaction.from_bytes(HexBytes(raw)).as_dict()["nonce"]
+        if nonce < self.pending_count:
+            raise ValueError("nonce too low")
+
+        tx_hash = Web3.to_hex(Web3.keccak(HexBytes(raw)))
+        if self.drop_next:
+            # Accepted, then evicted from the mempool without being mined
+            self.drop_next = False
+            return tx_hash
+        token_id = len(self.nonces)
+        self.nonces.append(nonce)
+        block = self._mine(tx_hash)
+        status, self.revert_next = not self.revert_next, False
+        self.receipts[tx_hash] = {
+            "transactionHash": tx_hash,
+            "transactionIndex": "0x0",
+            "blockHash": block["hash"],
+            "blockNumber": block["number"],
+            "to": CONTRACT,
+            "cumulativeGasUsed": "0x186a0",
+            "gasUsed": "0x186a0",
+            "status": hex(status),
+            "logs": (
+                [
+                    {
+                        "address": CONTRACT,
+                        "topics": [
+                            TICKET_MINTED,
+                            _word(token_id),
+                            _word(int(HOLDER, 16)),
+                        ],
+                        "data": "0x",
+                        "blockHash": block["hash"],
+                        "blockNumber": block["number"],
+                        "transactionHash": tx_hash,
+                        "transactionIndex": "0x0",
+                        "logIndex": "0x0",
+                        "removed": False,
+                    }
+                ]
+                if status
+                else []
+            ),
+        }
+        return tx_hash
+
+    def answer(self, request: dict[str, Any]) -> dict[str, Any]:
+        method, params = request["method"], request.get("params", [])
+        self.calls[method] += 1
+        try:
+            result: Any
+            if method == "web3_clientVersion":
+                result = "stub/v1"
+            elif method == "eth_chainId":
+                result = hex(settings.chain_id)
+            elif method == "eth_getTransactionCount":
+                result = hex(self.pending_count)
+            elif method == "eth_feeHistory":
+                result = {
+                    "oldestBlock": "0x0",
+                    "baseFeePerGas": ["0x3b9aca00", "0x3b9aca00"],
+                    "gasUsedRatio": [0.5],
+                    "reward": [["0x3b9aca00"]],
+                }
+            elif method == "eth_estimateGas":
+                result = "0x186a0"
+            elif method == "eth_blockNumber":
+                result = hex(len(self.blocks) - 1)
+            elif method == "eth_getBlockByNumber":
+                block_id = params[0]
+                result = self.blocks[-1 if block_id == "latest" else int(block_id, 16)]
+            elif method == "eth_sendRawTransaction":
+                result = self._send(params[0])
+            elif method == "eth_getTransactionReceipt":
+                result = self.receipts.get(params[0])
+            else:
+                raise ValueError(f"the method {method} does not exist")
+        except ValueError as e:
+            return {
+                "jsonrpc": "2.0",
+                "id": request["id"],
+                "error": {"code": -32000, "message": str(e)},
+            }
+        return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+
+    async def handle(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        if isinstance(payload, list):
+            return web.json_response([self.answer(r) for r in payload])
+        return web.json_response(self.answer(payload))
+
+
+@pytest.fixture
+async def node_and_service(
+    monkeypatch, tmp_path
+) -> AsyncIterator[tuple[StubNode, Web3BlockchainService]]:
+    node = StubNode()
+    app = web.Application()
+    app.router.add_post("/", node.handle)
+    server = TestServer(app)
+    await server.start_server()
+
+    abi_path = tmp_path / "Ticket.json"
+    abi_path.write_text(json.dumps({"abi": ABI}))
+    monkeypatch.setattr(settings, "ticket_contract_abi_path", str(abi_path))
+    monkeypatch.setattr(settings, "ticket_contract_address", CONTRACT)
+    monkeypatch.setattr(settings, "deployer_private_key", "0x" + "11" * 32)
+    monkeypatch.setattr(settings, "rpc_url", str(server.make_url("/")))
+    monkeypatch.setattr(settings, "rpc_urls", [])
+    monkeypatch.setattr(settings, "receipt_poll_seconds", 0.01)
+    monkeypatch.setattr(settings, "ticket_cache_log_poll_seconds", 0)
+
+    service = Web3BlockchainService()
+    await service.connect()
+    yield node, service
+    await service.close()
+    await server.close()
+
+
+async def test_concurrent_writes_get_contiguous_nonces(node_and_service):
+    """Test concurrent mints each get their own nonce, with no gaps."""
+    node, service = node_and_service
+
+    pending = await asyncio.gather(
+        *(service.submit_mint_ticket(HOLDER, f"ipfs://{i}") for i in range(10))
+    )
+    results = await asyncio.gather(*(p.wait() for p in pending))
+
+    assert sorted(node.nonces) == list(range(7, 17))
+    assert sorted(result["token_id"] for result in results) == list(range(10))
+    assert node.calls["eth_getTransactionCount"] == 1
+
+
+async def test_reverted_transaction_fails_its_outcome(node_and_service):
+    """Test a receipt with status 0 surfaces as a failed result."""
+    node, service = node_and_service
+    node.revert_next = True
+
+    pending = await service.submit_mint_ticket(HOLDER, "ipfs://reverted")
+
+    with pytest.raises(Exception, match="reverted"):
+        await pending.wait()
+    # The next mint is unaffected
+    result = await (await service.submit_mint_ticket(HOLDER, "ipfs://ok")).wait()
+    assert result["token_id"] == 1
+
+
+async def test_nonce_error_resyncs_from_the_node(node_and_service):
+    """Test a "nonce too low" rejection makes the next send re-read the count."""
+    node, service = node_and_service
+    # Another sender used two of the account's nonces behind our back
+    node.external_count += 2
+
+    with pytest.raises(Exception, match="nonce too low"):
+        await service.submit_mint_ticket(HOLDER, "ipfs://stale")
+    pending = await service.submit_mint_ticket(HOLDER, "ipfs://fresh")
+    await pending.wait()
+
+    assert node.nonces == [9]
+    assert node.calls["eth_getTransactionCount"] == 2
+
+
+async def test_receipt_timeout_fills_the_nonce_gap(node_and_service, monkeypatch):
+    """Test a transaction that never gets mined has its nonce reused."""
+    node, service = node_and_service
+    monkeypatch.setattr(settings, "receipt_timeout_seconds", 0.1)
+    node.drop_next = True
+
+    pending = await service.submit_mint_ticket(HOLDER, "ipfs://dropped")
+    with pytest.raises(Exception, match="is not in the chain"):
+        await pending.wait()
+    await (await service.submit_mint_ticket(HOLDER, "ipfs://retry")).wait()
+
+    assert node.nonces == [7]
+    assert node.calls["eth_getTransactionCount"] == 2